@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Accessory Filter - tells accessories apart from the product searched for
+The accessory keywords are compiled once into a single word-boundary regex, so
+"string" no longer hides a "ring" and "Standard" no longer hides a "stand". The
+filter is query-aware: a keyword the user searched for ("iphone case") is not an
+accessory for that search. Keywords that only describe the product, such as
+"6000mAh Battery" or "with Charger", do not count.
+
+    accessory_filter('iphone 14').match('iPhone 14 Silicone Case')   -> 'Case'
+    accessory_filter('iphone case').match('iPhone 14 Silicone Case') -> None
+    accessory_filter(query).matches(titles)   # every title of a page in one scan
+"""
+
+import re
+from functools import lru_cache
+
+ACCESSORY_KEYWORDS = (
+    'cover', 'case', 'protector', 'screen guard', 'charger',
+    'cable', 'headphone', 'earphone', 'stand', 'holder',
+    'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
+    'power bank', 'tempered glass', 'lens', 'ring light', 'clip',
+)
+
+# Keywords that describe the product's own part after a capacity ("6000mAh Battery"),
+# unlike "20000mAh Power Bank"
+CAPACITY_KEYWORDS = ('battery',)
+
+# Joins batch titles; no keyword can span it
+_BATCH_SEPARATOR = '\x00'
+
+
+def _keyword_pattern(keyword):
+    """Regex source of one keyword: any whitespace between words, plural accepted"""
+    words = [re.escape(word) for word in keyword.split()]
+    last = words[-1]
+    if last.endswith('y'):
+        words[-1] = last[:-1] + '(?:y|ies)'
+    elif last.endswith(('s', 'x', 'ch', 'sh')):
+        words[-1] = last + '(?:es)?'
+    else:
+        words[-1] = last + 's?'
+    return r'\s+'.join(words)
+
+
+_KEYWORD_PATTERNS = {keyword: re.compile(rf'\b{_keyword_pattern(keyword)}\b', re.IGNORECASE)
+                     for keyword in ACCESSORY_KEYWORDS}
+
+
+class AccessoryFilter:
+    """Compiled accessory matcher for the keywords that are not part of the query"""
+
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        self.pattern = None
+        if self.keywords:
+            # Longest first so "screen guard" wins over a shorter keyword at the same spot
+            alternation = '|'.join(('(?<!mah )' if keyword in CAPACITY_KEYWORDS else '') + _keyword_pattern(keyword)
+                                   for keyword in sorted(self.keywords, key=len, reverse=True))
+            # "with Charger" / "6000mAh Battery" describe the product rather than name an accessory
+            self.pattern = re.compile(rf'(?<!with )\b(?:{alternation})\b', re.IGNORECASE)
+
+    def match(self, title):
+        """The accessory keyword as written in title, None when it names a main product"""
+        if not self.pattern or not title:
+            return None
+        found = self.pattern.search(title)
+        return found.group() if found else None
+
+    def matches(self, titles):
+        """match() for many titles (e.g. every product of a page) from one scan of their joined text"""
+        titles = [title or '' for title in titles]
+        found = [None] * len(titles)
+        if not self.pattern or not titles:
+            return found
+        ends = []
+        position = 0
+        for title in titles:
+            position += len(title)
+            ends.append(position)
+            position += len(_BATCH_SEPARATOR)
+        segment = 0
+        for hit in self.pattern.finditer(_BATCH_SEPARATOR.join(titles)):
+            while hit.start() >= ends[segment]:
+                segment += 1
+            if found[segment] is None:
+                found[segment] = hit.group()
+        return found
+
+
+@lru_cache(maxsize=256)
+def _filter_for(query):
+    return AccessoryFilter(keyword for keyword, pattern in _KEYWORD_PATTERNS.items()
+                           if not pattern.search(query))
+
+
+def accessory_filter(query=None):
+    """Shared AccessoryFilter for a search query, compiled once per distinct query"""
+    return _filter_for(' '.join((query or '').lower().split()))
+
+
+def is_accessory(title, query=None):
+    """True when a product title names an accessory rather than what the query searched for"""
+    return accessory_filter(query).match(title) is not None
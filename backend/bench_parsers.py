@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Offline parser benchmark for the Cost Curve scraper
+Feeds the saved HTML captures into each platform's scrape method with the network
+replaced by the fixture, then reports pages/sec, ms per page, memory blocks allocated
+and retained, and peak memory per case. The run fails when a case gets slower (or
+hungrier) than bench_baselines.json allows, or extracts fewer products than it must.
+
+Speed is judged relative to a calibration parse (plain BeautifulSoup on
+CALIBRATION_FIXTURE, none of the scraper's code) timed in between the case's own
+samples, so baselines recorded on one machine hold on another and a busy machine
+slows both sides alike. Each side counts its fastest sample. --tolerance is the
+allowed growth of that ratio (default 30%); raise it where the benchmark shares
+the machine with other heavy jobs.
+
+Usage:
+    python bench_parsers.py                      # compare against the stored baselines
+    python bench_parsers.py --iterations 10      # more timed samples per case
+    python bench_parsers.py --update-baseline    # record this machine's numbers
+    python bench_parsers.py --json               # machine-readable report (status lines go to stderr)
+    python bench_parsers.py --parser html.parser # time another parser backend
+"""
+
+import gc
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import requests
+from bs4 import BeautifulSoup
+
+import scraper
+from scraper import ProductScraper, CONTAINER_SELECTORS, DEFAULT_PARSER, resolve_parser
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCH_DIR, 'bench_baselines.json')
+DEFAULT_ITERATIONS = 5  # timed samples per case
+SAMPLE_SECONDS = 0.2
+DEFAULT_TOLERANCE = 0.30  # allowed slowdown / memory growth over the baseline
+MIN_SLOWDOWN_MS = 1.0  # smaller slowdowns are scheduler noise, whatever the ratio
+CALIBRATION_FIXTURE = 'flipkart_debug_page.html'
+
+# (case name, scraper method, fixture file, query, fixture transform, minimum results)
+# With method None only the HTML parse is timed, restricted to the containers of
+# the scraper named in the query slot when one is given. A scrape case extracting
+# fewer than its minimum fails the run, so every timed extraction is also checked.
+# tatacliq_debug.html is the unrendered JS shell (no product markup), so it is
+# only timed as a parse. Flipkart has no container selectors (its HTML fallback
+# parses the whole page), so its captures get no containers case.
+CASES = [
+    ('Parse / flipkart_debug.html', None, 'flipkart_debug.html', None, None, 0),
+    ('Parse / flipkart_debug_page.html', None, 'flipkart_debug_page.html', None, None, 0),
+    ('Parse / tatacliq_debug.html', None, 'tatacliq_debug.html', None, None, 0),
+    ('Parse containers / tatacliq_debug.html', None, 'tatacliq_debug.html', 'scrape_tatacliq', None, 0),
+    ('Flipkart / iPhone 14', 'scrape_flipkart', 'flipkart_debug.html', 'iPhone 14', None, 5),
+    ('Flipkart / iPhone 14 (comprehensive)', 'scrape_flipkart', 'flipkart_comprehensive_debug.html', 'iPhone 14',
+     None, 5),
+    ('Flipkart / Samsung SSD', 'scrape_flipkart', 'flipkart_debug_page.html', 'samsung ssd', None, 5),
+    # Same page with the embedded state hidden, to time the HTML fallback path
+    ('Flipkart / Samsung SSD (HTML fallback)', 'scrape_flipkart', 'flipkart_debug_page.html', 'samsung ssd',
+     lambda html: html.replace('window.__INITIAL_STATE__', 'window.__HIDDEN_STATE__'), 4),
+]
+
+
+class FixtureResponse:
+    """Just enough of requests.Response for the scrape methods.
+
+    Like a socket, iter_content produces the body chunk by chunk, so a streamed read
+    pays for the chunks it reads and nothing more; content joins all of them, as
+    requests does for a response that is not streamed.
+    """
+
+    def __init__(self, url, html):
+        self.url = url
+        self.status_code = 200
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        self.text = html
+
+    @property
+    def content(self):
+        return b''.join(self.iter_content(16 * 1024))
+
+    def iter_content(self, chunk_size=1):
+        # Chunks of the encoded text; utf-8 takes at most 4 bytes per character
+        step = max(chunk_size // 4, 1)
+        for start in range(0, len(self.text), step):
+            yield self.text[start:start + step].encode('utf-8')
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FixtureScraper(ProductScraper):
+    """ProductScraper whose first fetch returns the fixture; any further fetch fails offline.
+
+    keep_soups holds on to every parse tree built, so none is freed before the
+    memory snapshot taken at the end of a run.
+    """
+
+    def __init__(self, html, parser=DEFAULT_PARSER, keep_soups=False):
+        super().__init__(parser=parser)
+        self.html = html
+        self.served = False
+        self.soups = [] if keep_soups else None
+
+    def fork(self):
+        worker = super().fork()
+        worker.served = False
+        return worker
+
+    def _get(self, url, timeout=15, **kwargs):
+        if not self.served:
+            self.served = True
+            return FixtureResponse(url, self.html)
+        raise requests.ConnectionError(f"offline benchmark: no fixture for {url}")
+
+    def _soup(self, markup, only=None):
+        return self._kept(super()._soup(markup, only))
+
+    def _response_soup(self, response, only=None):
+        return self._kept(super()._response_soup(response, only))
+
+    def _kept(self, soup):
+        if self.soups is not None:
+            self.soups.append(soup)
+        return soup
+
+
+def calibration_run(parser=DEFAULT_PARSER):
+    """Callable parsing CALIBRATION_FIXTURE with BeautifulSoup alone, the yardstick for this machine"""
+    with open(os.path.join(BENCH_DIR, CALIBRATION_FIXTURE), 'rb') as f:
+        markup = f.read()
+    builder = resolve_parser(parser)
+    return lambda: BeautifulSoup(markup, builder)
+
+
+def run_case(method_name, html, query, parser=DEFAULT_PARSER, bench_scraper=None):
+    """Run one scrape method against the fixture and return its results"""
+    bench_scraper = bench_scraper or FixtureScraper(html, parser)
+    if method_name is None:
+        bench_scraper._response_soup(bench_scraper._get(None), only=CONTAINER_SELECTORS.get(query))
+        return []
+    return bench_scraper._run_platform(method_name, query)
+
+
+def _repeats(run):
+    """Runs per timed sample: enough to last SAMPLE_SECONDS, so millisecond-sized
+    cases are not dominated by timer and scheduler noise"""
+    started = time.process_time()
+    run()
+    return max(1, int(SAMPLE_SECONDS / max(time.process_time() - started, 1e-4)))
+
+
+def _sample(run, repeats):
+    """ms per run over one timed sample"""
+    gc.collect()
+    # CPU time of the process: parsing is CPU-bound and this ignores other load on the machine
+    started = time.process_time()
+    for _ in range(repeats):
+        run()
+    return (time.process_time() - started) * 1000 / repeats
+
+
+def measure(name, method_name, fixture, query, transform, min_results, iterations, parser=DEFAULT_PARSER,
+            calibrate=None):
+    with open(os.path.join(BENCH_DIR, fixture), encoding='utf-8') as f:
+        html = f.read()
+    if transform:
+        html = transform(html)
+    calibrate = calibrate or calibration_run(parser)
+
+    def case():
+        return run_case(method_name, html, query, parser)
+
+    results = case()  # warm-up (imports, regex and selector caches)
+    calibrate()
+    repeats, calibration_repeats = _repeats(case), _repeats(calibrate)
+
+    # Calibration and case samples alternate, so both see the same state of the machine
+    timings, calibrations = [], []
+    for _ in range(iterations):
+        calibrations.append(_sample(calibrate, calibration_repeats))
+        timings.append(_sample(case, repeats))
+
+    # Memory is measured in a separate run since tracemalloc slows everything down:
+    # the blocks allocated by the run that it still held at its end (every parse tree
+    # is kept until then, so only temporaries freed along the way are missed), the
+    # blocks still alive once the scraper and its trees are gone, and the peak
+    gc.collect()
+    bench_scraper = FixtureScraper(html, parser, keep_soups=True)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    kept = run_case(method_name, html, query, parser, bench_scraper)
+    _, peak = tracemalloc.get_traced_memory()
+    held = tracemalloc.take_snapshot()
+    del bench_scraper
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in held.compare_to(before, 'filename') if stat.count_diff > 0)
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    del kept
+
+    ms_per_page = statistics.median(timings)
+    return {
+        'case': name,
+        'fixture': fixture,
+        'results': len(results),
+        'min_results': min_results,
+        'iterations': iterations,
+        'ms_per_page': round(ms_per_page, 2),
+        'ms_min': round(min(timings), 2),
+        'calibration_ms': round(min(calibrations), 2),
+        'relative': round(min(timings) / min(calibrations), 3),
+        'pages_per_sec': round(1000 / ms_per_page, 1) if ms_per_page else None,
+        'allocations': allocations,
+        'retained_blocks': retained,
+        'peak_kb': round(peak / 1024, 1),
+        'page_kb': round(len(html.encode('utf-8')) / 1024, 1),
+    }
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baselines(report):
+    baselines = {row['case']: {key: row[key] for key in ('relative', 'ms_min', 'peak_kb', 'results')}
+                 for row in report}
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2)
+        f.write('\n')
+
+
+def expected_ms(row, baseline):
+    """The baseline's best ms/page on this machine, scaled by this run's calibration parse
+    (None for a baseline recorded before calibration)"""
+    if 'relative' not in baseline:
+        return None
+    return baseline['relative'] * row['calibration_ms']
+
+
+def check_against_baselines(report, baselines, tolerance):
+    """Return human-readable failures for cases worse than their baseline"""
+    failures = []
+    for row in report:
+        if row['results'] < row['min_results']:
+            failures.append(f"{row['case']}: {row['results']} results, at least {row['min_results']} expected")
+        baseline = baselines.get(row['case'])
+        if not baseline:
+            continue
+        expected = expected_ms(row, baseline)
+        if expected is None:
+            failures.append(f"{row['case']}: baseline has no calibrated time, re-record it with --update-baseline")
+        elif row['ms_min'] > max(expected * (1 + tolerance), expected + MIN_SLOWDOWN_MS):
+            failures.append(f"{row['case']}: best {row['ms_min']}ms/page vs {expected:.2f}ms expected "
+                            f"({baseline['relative']}x the {row['calibration_ms']}ms calibration parse)")
+        if row['peak_kb'] > baseline['peak_kb'] * (1 + tolerance):
+            failures.append(f"{row['case']}: peak {row['peak_kb']}KB vs baseline {baseline['peak_kb']}KB")
+        if row['results'] != baseline['results']:
+            failures.append(f"{row['case']}: {row['results']} results vs baseline {baseline['results']}")
+    return failures
+
+
+def print_report(report, baselines):
+    print(f"{'case':<42} {'results':>7} {'ms/page':>9} {'best ms':>9} {'pages/s':>8} {'allocs':>8} {'retained':>9} "
+          f"{'peak KB':>9} {'vs base':>8}")
+    print('-' * 117)
+    for row in report:
+        baseline = baselines.get(row['case'])
+        expected = expected_ms(row, baseline) if baseline else None
+        change = f"{(row['ms_min'] / expected - 1) * 100:+.0f}%" if expected else 'new'
+        print(f"{row['case']:<42} {row['results']:>7} {row['ms_per_page']:>9} {row['ms_min']:>9} {row['pages_per_sec']:>8} "
+              f"{row['allocations']:>8} {row['retained_blocks']:>9} {row['peak_kb']:>9} {change:>8}")
+
+
+def _get_option(name, default=None):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
+
+def main():
+    iterations = int(_get_option('--iterations', DEFAULT_ITERATIONS))
+    tolerance = float(_get_option('--tolerance', DEFAULT_TOLERANCE))
+
+    # Per-product log lines would dominate the timings
+    scraper.logger.setLevel(logging.ERROR)
+
+    # With --json stdout carries the report alone, so it can be piped to json.load
+    as_json = '--json' in sys.argv
+    status = sys.stderr if as_json else sys.stdout
+
+    parser = _get_option('--parser', DEFAULT_PARSER)
+    print(f"🔧 Parser backend: {resolve_parser(parser)}\n", file=status)
+
+    calibrate = calibration_run(parser)
+    report = [measure(*case, iterations, parser, calibrate) for case in CASES]
+    baselines = load_baselines()
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, baselines)
+
+    if '--update-baseline' in sys.argv:
+        save_baselines(report)
+        print(f"\n📝 Baselines written to {os.path.basename(BASELINE_PATH)}", file=status)
+        return
+
+    failures = check_against_baselines(report, baselines, tolerance)
+    if failures:
+        print(f"\n❌ {len(failures)} regressions (tolerance {tolerance:.0%}):", file=status)
+        for failure in failures:
+            print(f"  - {failure}", file=status)
+        sys.exit(1)
+    print(f"\n✅ All cases within {tolerance:.0%} of their baselines", file=status)
+
+
+if __name__ == "__main__":
+    main()
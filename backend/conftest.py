@@ -0,0 +1,23 @@
+"""Shared pytest fixtures for the offline backend tests"""
+
+import pytest
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test advances it or something sleeps on it"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Embedded Data - products from the structured data a page already ships
+Many storefronts embed their listing as data: schema.org Product/Offer blocks in
+<script type="application/ld+json">, a Next.js __NEXT_DATA__ blob, or a
+window.__PRELOADED_STATE__ style global. One regex scan of the raw HTML locates
+all of them and only those spans are JSON-decoded (no HTML parse), so a scraper can
+try them before its CSS selectors, which break whenever the site restyles.
+
+    products, source = embedded_products(html, base_url='https://www.myntra.com', limit=5)
+    # [{'title', 'price', 'mrp', 'url', 'image', 'availability'}, ...], '__myx'
+
+JSON-LD is read by its schema (Product, ItemList, @graph). State globals have no
+common schema, so an object counts as a product when it carries a title, a positive
+price and an id or a url; facets, filters and breadcrumbs with a name and an amount
+do not. Pass state=False to read JSON-LD only, for platforms whose state has a
+dedicated reader.
+"""
+
+import json
+import re
+from urllib.parse import urljoin
+
+from price_parser import parse_price
+
+# window.<name> = {...} globals holding page state
+STATE_GLOBALS = ('__PRELOADED_STATE__', '__INITIAL_STATE__', '__INITIAL_DATA__', '__APOLLO_STATE__', '__myx')
+
+LD_JSON = 'ld+json'
+NEXT_DATA = '__NEXT_DATA__'
+
+# Literal markers located with str.find, far quicker than a regex alternation over
+# the page; the JSON of a script marker starts after the end of its opening tag
+SCRIPT_MARKERS = (('application/ld+json', LD_JSON), ('__NEXT_DATA__', NEXT_DATA))
+STATE_MARKER = 'window.__'
+STATE_ASSIGNMENT_PATTERN = re.compile(r'window\.(%s)\s*=\s*' % '|'.join(re.escape(name) for name in STATE_GLOBALS))
+
+# Keys tried, in order, on the product objects of state globals
+TITLE_KEYS = ('productName', 'product_name', 'displayName', 'title', 'name')
+PRICE_KEYS = ('discountedPrice', 'sellingPrice', 'offerPrice', 'salePrice', 'specialPrice',
+              'finalPrice', 'price')
+MRP_KEYS = ('mrp', 'strikeOffPrice', 'listPrice', 'originalPrice', 'maxPrice')
+URL_KEYS = ('landingPageUrl', 'productUrl', 'pdpUrl', 'url', 'link', 'href')
+ID_KEYS = ('productId', 'product_id', 'styleId', 'itemId', 'sku', 'asin', 'pid', 'id')
+IMAGE_KEYS = ('searchImage', 'imageUrl', 'image', 'thumbnail', 'img')
+
+SCHEMA_AVAILABILITY = {
+    'instock': 'In Stock',
+    'limitedavailability': 'In Stock',
+    'preorder': 'Pre-order',
+    'outofstock': 'Out of Stock',
+    'soldout': 'Out of Stock',
+}
+
+# Objects visited per blob; state globals can be megabytes of unrelated data
+MAX_NODES = 200000
+
+_decoder = json.JSONDecoder()
+
+
+def _marker_positions(html, marker):
+    position = html.find(marker)
+    while position != -1:
+        yield position
+        position = html.find(marker, position + len(marker))
+
+
+def _locate(html):
+    """(position, source, JSON start) of every embedded-data marker, in page order"""
+    found = []
+    for marker, source in SCRIPT_MARKERS:
+        for position in _marker_positions(html, marker):
+            start = html.find('>', position) + 1
+            if start:
+                found.append((position, source, start))
+    for position in _marker_positions(html, STATE_MARKER):
+        match = STATE_ASSIGNMENT_PATTERN.match(html, position)
+        if match:
+            found.append((position, match.group(1), match.end()))
+    found.sort()
+    return found
+
+
+def find_embedded_data(html):
+    """(source, data) of every decodable JSON-LD block, __NEXT_DATA__ blob and state global, in page order"""
+    blobs = []
+    if not html:
+        return blobs
+    for _, source, start in _locate(html):
+        while start < len(html) and html[start].isspace():
+            start += 1
+        try:
+            data, _ = _decoder.raw_decode(html, start)
+        except ValueError:
+            continue  # JS literals (undefined, functions), a marker outside a script, a truncated page
+        blobs.append((source, data))
+    return blobs
+
+
+def _types(node):
+    kind = node.get('@type')
+    return set(kind) if isinstance(kind, list) else {kind}
+
+
+def _amount(value):
+    """int price from a number, a price string or a {"value": ...} object, else None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    if isinstance(value, str):
+        return parse_price(value) or None
+    if isinstance(value, dict):
+        for key in ('value', 'amount', 'price'):
+            if key in value:
+                return _amount(value[key])
+    return None
+
+
+def _image(value):
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('contentUrl') or value.get('src')
+    return value if isinstance(value, str) and value else None
+
+
+def _first(node, keys, convert=None):
+    for key in keys:
+        value = node.get(key)
+        if convert:
+            value = convert(value)
+        if value:
+            return value
+    return None
+
+
+def _ld_product(node):
+    offers = node.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if not isinstance(offers, dict):
+        offers = {}
+    currency = offers.get('priceCurrency')
+    if currency and currency.upper() != 'INR':
+        return None
+    availability = str(offers.get('availability') or '').rsplit('/', 1)[-1].lower()
+    return {
+        'title': node.get('name'),
+        'price': _first(offers, ('price', 'lowPrice'), _amount),
+        'mrp': _amount(offers.get('highPrice')),
+        'url': node.get('url') or offers.get('url'),
+        'image': _image(node.get('image')),
+        'availability': SCHEMA_AVAILABILITY.get(availability),
+    }
+
+
+def _walk_ld(node, found, depth=0):
+    """Product records of a JSON-LD document (lists, @graph and ItemList included)"""
+    if depth > 8:
+        return
+    if isinstance(node, list):
+        for item in node:
+            _walk_ld(item, found, depth + 1)
+        return
+    if not isinstance(node, dict):
+        return
+    types = _types(node)
+    if 'Product' in types:
+        product = _ld_product(node)
+        if product:
+            found.append(product)
+        return
+    for key in ('@graph', 'itemListElement', 'item', 'mainEntity'):
+        if key in node:
+            _walk_ld(node[key], found, depth + 1)
+
+
+def _state_product(node):
+    title = _first(node, TITLE_KEYS, lambda value: value if isinstance(value, str) else None)
+    price = _first(node, PRICE_KEYS, _amount)
+    if not title or not price:
+        return None
+    url = _first(node, URL_KEYS, lambda value: value if isinstance(value, str) else None)
+    if not url and not _first(node, ID_KEYS, lambda value: value if isinstance(value, (str, int)) else None):
+        return None  # a name and an amount alone (a facet, filter or widget), not a product
+    brand = node.get('brand')
+    if isinstance(brand, dict):
+        brand = brand.get('name')
+    if isinstance(brand, str) and brand and brand.lower() not in title.lower():
+        title = f"{brand} {title}"
+    mrp = _first(node, MRP_KEYS, _amount)
+    return {
+        'title': title,
+        'price': price,
+        'mrp': mrp if mrp and mrp > price else None,
+        'url': url,
+        'image': _first(node, IMAGE_KEYS, _image),
+        'availability': None,
+    }
+
+
+def _walk_state(data, found):
+    """Product-like objects of a state blob in document order, not descending into products"""
+    stack = [data]
+    visited = 0
+    while stack and visited < MAX_NODES:
+        node = stack.pop()
+        visited += 1
+        if isinstance(node, dict):
+            product = _state_product(node)
+            if product:
+                found.append(product)
+                continue
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        # Reversed so the stack pops children in their original order
+        stack.extend(child for child in reversed(list(children)) if isinstance(child, (dict, list)))
+
+
+def products_from_embedded(source, data):
+    """Product records of one decoded blob"""
+    found = []
+    if source == LD_JSON:
+        _walk_ld(data, found)
+    else:
+        _walk_state(data, found)
+    return found
+
+
+def embedded_products(html, base_url=None, limit=None, state=True):
+    """(products, source) of the first embedded blob describing products, ([], None) when none does.
+
+    JSON-LD is preferred over state globals, which state=False skips altogether.
+    Repeated (title, price) pairs are kept once; relative urls are resolved against
+    base_url.
+    """
+    blobs = find_embedded_data(html)
+    if not state:
+        blobs = [blob for blob in blobs if blob[0] == LD_JSON]
+    blobs.sort(key=lambda blob: blob[0] != LD_JSON)
+    for source, data in blobs:
+        products = []
+        seen = set()
+        for product in products_from_embedded(source, data):
+            key = (product['title'], product['price'])
+            if not product['title'] or not product['price'] or key in seen:
+                continue
+            seen.add(key)
+            if product['url'] and base_url:
+                product['url'] = urljoin(base_url, product['url'])
+            products.append(product)
+            if limit and len(products) >= limit:
+                break
+        if products:
+            return products, source
+    return [], None
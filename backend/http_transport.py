@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Cost Curve HTTP Transport - a kept-alive connection pool per platform host
+A plain requests.Session shares one HTTPAdapter whose PoolManager keeps pools for
+only ten hosts, least recently used first out, so a search touching a dozen
+storefronts keeps evicting and re-handshaking them. HostTransport mounts a
+dedicated adapter per platform host on the session instead, can speak HTTP/2
+through httpx (negotiated per host with ALPN, HTTP/1.1 otherwise) and opens the
+connections (DNS, TCP, TLS) ahead of the first search.
+
+    transport = HostTransport(['www.flipkart.com', 'www.amazon.in'], http2=True)
+    transport.mount(session)
+    transport.prewarm()     # connect to every host, no HTTP request sent over HTTP/1.1
+    transport.stats()       # {'www.flipkart.com': {'protocol': 'HTTP/2', 'requests': 12,
+                            #   'connections': 1, 'prewarmed': 1, 'reused': 12}, ...}
+
+HTTP/2 needs `pip install httpx[http2]`; without it the hosts use HTTP/1.1.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, get_environ_proxies
+
+HTTP2_AVAILABLE = False
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx speaks HTTP/2 only with h2 installed
+    HTTP2_AVAILABLE = True
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+# Connections kept alive per host: a search page plus PER_HOST_CONCURRENCY product
+# page lookups for each of the service's concurrent queries
+HOST_POOL_SIZE = 8
+
+# Seconds one host may take to resolve, connect and finish its TLS handshake
+PREWARM_TIMEOUT = 5
+
+# Connection-specific headers HTTP/2 forbids (the registry's headers send "Connection: keep-alive")
+HOP_BY_HOP_HEADERS = frozenset(('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'))
+
+
+def _counters(protocol, sent, opened, prewarmed):
+    """Per-host stats: reused counts the requests that did not wait for a handshake
+    (connections opened by prewarm() were paid for before any search)"""
+    return {'protocol': protocol, 'requests': sent, 'connections': opened, 'prewarmed': prewarmed,
+            'reused': max(sent - (opened - prewarmed), 0)}
+
+
+class HostAdapter(HTTPAdapter):
+    """HTTP/1.1 keep-alive pool of one host, counting requests and new connections"""
+
+    protocol = 'HTTP/1.1'
+
+    def __init__(self, pool_size=HOST_POOL_SIZE):
+        super().__init__(pool_connections=1, pool_maxsize=pool_size)
+        self.prewarmed = 0
+
+    def _pool(self, url):
+        """The urllib3 pool send() uses for url (same TLS settings and proxy)"""
+        request = requests.Request('GET', url).prepare()
+        proxies = get_environ_proxies(url)
+        if hasattr(self, 'get_connection_with_tls_context'):  # requests >= 2.32.2
+            return self.get_connection_with_tls_context(request, verify=True, proxies=proxies)
+        return self.get_connection(url, proxies)
+
+    def prewarm(self, url, timeout=PREWARM_TIMEOUT):
+        """Open one connection to url's host and park it in the pool"""
+        pool = self._pool(url)
+        connection = pool._get_conn()
+        try:
+            connection.timeout = timeout
+            connection.connect()
+            self.prewarmed += 1
+        except Exception:
+            connection.close()
+            raise
+        finally:
+            pool._put_conn(connection)
+
+    def stats(self):
+        """Counters across this host's pools (see _counters)"""
+        pools = [self.poolmanager.pools.get(key) for key in self.poolmanager.pools.keys()]
+        return _counters(self.protocol, sum(pool.num_requests for pool in pools if pool),
+                         sum(pool.num_connections for pool in pools if pool), self.prewarmed)
+
+
+@contextmanager
+def _requests_errors():
+    """Raise httpx errors as the requests exceptions the scrapers handle"""
+    try:
+        yield
+    except httpx.ConnectTimeout as e:
+        raise requests.ConnectTimeout(e)
+    except httpx.TimeoutException as e:
+        raise requests.ReadTimeout(e)
+    except httpx.HTTPError as e:
+        raise requests.ConnectionError(e)
+
+
+class _StreamedBody:
+    """The raw attribute of a requests.Response backed by an httpx response:
+    requests reads the (decoded) body through stream() and closes it with close()"""
+
+    def __init__(self, response):
+        self.response = response
+
+    def stream(self, amount=None, decode_content=True):
+        with _requests_errors():
+            yield from self.response.iter_bytes(amount)
+
+    def read(self, amount=None, decode_content=False):
+        with _requests_errors():
+            return self.response.read()
+
+    def close(self):
+        self.response.close()
+
+    def release_conn(self):
+        self.response.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """requests adapter sending through an httpx client, HTTP/2 where the host offers it.
+
+    Responses come back as requests.Response objects, and httpx errors as requests
+    exceptions, so the scrapers cannot tell the difference.
+    """
+
+    def __init__(self, pool_size=HOST_POOL_SIZE):
+        super().__init__()
+        self.client = httpx.Client(http2=True, follow_redirects=False,
+                                   limits=httpx.Limits(max_connections=pool_size,
+                                                       max_keepalive_connections=pool_size))
+        self.protocol = None  # negotiated HTTP version, known after the first response
+        self.sent = 0
+        self.opened = 0
+        self.prewarmed = 0
+        self._lock = threading.Lock()
+
+    def _trace(self, event, info):
+        if event == 'connection.connect_tcp.complete':
+            with self._lock:
+                self.opened += 1
+
+    @staticmethod
+    def _timeout(timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _request(self, method, url, headers=None, content=None, timeout=None, counted=True):
+        """Send a request and return the httpx response once its headers are in (body unread)"""
+        headers = {name: value for name, value in (headers or {}).items()
+                   if name.lower() not in HOP_BY_HOP_HEADERS}
+        request = self.client.build_request(method, url, headers=headers, content=content,
+                                            timeout=self._timeout(timeout), extensions={'trace': self._trace})
+        with _requests_errors():
+            response = self.client.send(request, stream=True)
+        if counted:
+            with self._lock:
+                self.sent += 1
+        self.protocol = response.http_version
+        return response
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        response = self._request(request.method, request.url, request.headers, request.body, timeout)
+        result = requests.Response()
+        # The body is read through raw, so stream=True responses download only what is read
+        result.raw = _StreamedBody(response)
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        for name, value in response.cookies.items():
+            result.cookies.set(name, value)
+        return result
+
+    def prewarm(self, url, timeout=PREWARM_TIMEOUT):
+        """Open the connection to url's host (a HEAD request, which also negotiates HTTP/2)"""
+        opened = self.opened
+        self._request('HEAD', url, timeout=timeout, counted=False).close()
+        with self._lock:
+            self.prewarmed += min(self.opened - opened, 1)
+
+    def stats(self):
+        return _counters(self.protocol or 'HTTP/2', self.sent, self.opened, self.prewarmed)
+
+    def close(self):
+        self.client.close()
+
+
+class HostTransport:
+    """One tuned adapter per platform host, mounted on a requests.Session"""
+
+    def __init__(self, hosts=(), http2=False, pool_size=HOST_POOL_SIZE):
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("⚠️ [TRANSPORT] HTTP/2 needs httpx with h2 (pip install httpx[http2]); using HTTP/1.1")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        adapter_class = HTTP2Adapter if self.http2 else HostAdapter
+        self.adapters = {host: adapter_class(pool_size) for host in dict.fromkeys(hosts)}
+
+    def mount(self, session):
+        """Route requests to each host through its adapter; other hosts keep the session default"""
+        for host, adapter in self.adapters.items():
+            session.mount(f'https://{host}/', adapter)
+        return session
+
+    def prewarm(self, hosts=None, timeout=PREWARM_TIMEOUT):
+        """Resolve, connect and handshake with every host (or the given ones) in parallel.
+
+        Returns the number of hosts now holding a warm connection; failures are logged only.
+        """
+        hosts = [host for host in (hosts or self.adapters) if host in self.adapters]
+        if not hosts:
+            return 0
+
+        def warm(host):
+            try:
+                self.adapters[host].prewarm(f'https://{host}/', timeout=timeout)
+                return True
+            except Exception as e:
+                logger.warning(f"⚠️ [TRANSPORT] Could not pre-connect to {host}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=len(hosts), thread_name_prefix='prewarm') as pool:
+            warmed = sum(pool.map(warm, hosts))
+        logger.info(f"🔥 [TRANSPORT] Pre-connected to {warmed}/{len(hosts)} hosts"
+                    f" ({'HTTP/2' if self.http2 else 'HTTP/1.1'})")
+        return warmed
+
+    def stats(self):
+        """Per-host counters (protocol, requests, connections, prewarmed, reused) of the hosts used so far"""
+        report = {}
+        for host, adapter in self.adapters.items():
+            counters = adapter.stats()
+            if counters['requests'] or counters['connections']:
+                report[host] = counters
+        return report
+
+    def close(self):
+        for adapter in self.adapters.values():
+            adapter.close()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Latency Tracker - request timeouts derived from how fast each platform answers
+Fixed timeouts are either too tight for a slow storefront or so loose that one stalled
+host burns most of a query's budget. LatencyTracker keeps the latest response
+latencies (time until the response headers arrived) of every platform and endpoint
+type, and sizes the next request's timeouts from their 99th percentile:
+
+    read    = p99 x READ_FACTOR      clamped to [MIN_READ_TIMEOUT, ceiling]
+    connect = p99 x CONNECT_FACTOR   clamped to [MIN_CONNECT_TIMEOUT, min(MAX_CONNECT_TIMEOUT, ceiling)]
+
+where the ceiling is the timeout the caller used to hard-code. Connecting is part of
+the measured latency, so the same percentile bounds it. Until MIN_SAMPLES
+latencies are in, the ceiling is used for both.
+
+    tracker = LatencyTracker()
+    tracker.timeout('Flipkart', SEARCH_PAGE, ceiling=10)   # (10, 10) at first, later e.g. (1.4, 1.9)
+    tracker.record('Flipkart', SEARCH_PAGE, 0.62)
+    tracker.report('Flipkart')
+    # {'search': {'timeout': {'connect': 1.4, 'read': 1.9}, 'samples': 57, 'p50': 0.41, 'p90': 0.7,
+    #             'p99': 0.93, 'histogram': {'<=0.5s': 31, '<=1s': 26}}}
+
+A request that timed out counts as a latency of the timeout it hit, so a host that
+starts stalling gets its longer timeouts back instead of failing ever faster.
+"""
+
+import threading
+from collections import deque
+
+# Endpoint types tracked separately per platform
+SEARCH_PAGE = 'search'
+PRODUCT_PAGE = 'product'
+
+# Latencies kept per platform and endpoint, and how many are needed before adapting
+WINDOW = 200
+MIN_SAMPLES = 10
+
+READ_FACTOR = 2.0
+CONNECT_FACTOR = 1.5
+MIN_READ_TIMEOUT = 2.0
+MIN_CONNECT_TIMEOUT = 1.0
+MAX_CONNECT_TIMEOUT = 5.0
+
+# Upper bounds (seconds) of the reported histogram buckets
+HISTOGRAM_BOUNDS = (0.25, 0.5, 1, 2, 4, 8, 16)
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def histogram(latencies):
+    """Counts per HISTOGRAM_BOUNDS bucket, empty buckets left out"""
+    counts = {}
+    for latency in latencies:
+        bound = next((bound for bound in HISTOGRAM_BOUNDS if latency <= bound), None)
+        label = f'<={bound}s' if bound is not None else f'>{HISTOGRAM_BOUNDS[-1]}s'
+        counts[label] = counts.get(label, 0) + 1
+    return {label: counts[label] for label in
+            [f'<={bound}s' for bound in HISTOGRAM_BOUNDS] + [f'>{HISTOGRAM_BOUNDS[-1]}s'] if label in counts}
+
+
+class LatencyTracker:
+    """Rolling latencies per (platform, endpoint) and the timeouts derived from them"""
+
+    def __init__(self, window=WINDOW, min_samples=MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self.latencies = {}  # (platform, endpoint) -> deque of seconds, oldest first
+        self.timeouts = {}  # (platform, endpoint) -> (connect, read) last handed out
+        self._lock = threading.Lock()
+
+    def record(self, platform, endpoint, seconds):
+        with self._lock:
+            key = (platform, endpoint)
+            if key not in self.latencies:
+                self.latencies[key] = deque(maxlen=self.window)
+            self.latencies[key].append(seconds)
+
+    def timeout(self, platform, endpoint, ceiling):
+        """(connect, read) timeouts for the next request, neither above ceiling"""
+        with self._lock:
+            latencies = sorted(self.latencies.get((platform, endpoint), ()))
+        if len(latencies) < self.min_samples:
+            timeouts = (ceiling, ceiling)
+        else:
+            p99 = percentile(latencies, 0.99)
+            connect_ceiling = min(MAX_CONNECT_TIMEOUT, ceiling)
+            timeouts = (round(min(max(p99 * CONNECT_FACTOR, MIN_CONNECT_TIMEOUT), connect_ceiling), 2),
+                        round(min(max(p99 * READ_FACTOR, MIN_READ_TIMEOUT), ceiling), 2))
+        self.timeouts[(platform, endpoint)] = timeouts
+        return timeouts
+
+    def report(self, platform):
+        """Per endpoint: the current timeouts, latency percentiles and histogram of a platform"""
+        report = {}
+        with self._lock:
+            tracked = {endpoint: sorted(latencies) for (name, endpoint), latencies in self.latencies.items()
+                       if name == platform}
+        for endpoint, latencies in tracked.items():
+            entry = {'samples': len(latencies)}
+            timeouts = self.timeouts.get((platform, endpoint))
+            if timeouts:
+                entry['timeout'] = {'connect': timeouts[0], 'read': timeouts[1]}
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+                entry[name] = round(percentile(latencies, fraction), 2)
+            entry['histogram'] = histogram(latencies)
+            report[endpoint] = entry
+        return report
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Page Context - derived views of one parsed page, computed once
+The extraction strategies of a scraper keep asking the same questions of a page:
+its full text, its <script> bodies, its product links, the elements carrying a
+class. PageContext answers each from an index built on first use, so a document
+is traversed once per view instead of once per strategy (and per product).
+
+    page = PageContext(soup)
+    page.text                               # soup.get_text(), cached
+    page.script_containing('window.__myx')  # first script body holding the marker
+    page.links                              # every <a href> in document order
+    page.with_classes('Nx9bqj', 'CxhGGd')   # like soup.select('.Nx9bqj.CxhGGd')
+    page.class_contains('price', 'Price')   # like soup.select('[class*="price"], [class*="Price"]')
+"""
+
+from functools import cached_property
+
+from bs4 import Tag
+
+
+class PageContext:
+    """Lazily built, memoized views of one BeautifulSoup document"""
+
+    def __init__(self, soup):
+        self.soup = soup
+        self._script_hits = {}
+
+    @cached_property
+    def text(self):
+        """Full text of the page"""
+        return self.soup.get_text()
+
+    @cached_property
+    def text_lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def _tags(self):
+        """Every tag of the document in document order (one traversal shared by the indexes)"""
+        return [node for node in self.soup.descendants if isinstance(node, Tag)]
+
+    @cached_property
+    def scripts(self):
+        """(script tag, body text) of every <script>"""
+        return [(tag, tag.get_text()) for tag in self._tags if tag.name == 'script']
+
+    @cached_property
+    def links(self):
+        """Every <a> with an href, in document order"""
+        return [tag for tag in self._tags if tag.name == 'a' and tag.get('href')]
+
+    @cached_property
+    def class_index(self):
+        """class name -> document positions (indexes into the tag list) of the tags carrying it"""
+        index = {}
+        for position, tag in enumerate(self._tags):
+            for name in tag.get('class') or ():
+                positions = index.setdefault(name, [])
+                # A class listed twice on one tag must not list the tag twice
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+        return index
+
+    def script_containing(self, marker):
+        """(script tag, body) of the first script whose body contains marker, else (None, None)"""
+        if marker not in self._script_hits:
+            self._script_hits[marker] = next(
+                ((tag, body) for tag, body in self.scripts if marker in body), (None, None))
+        return self._script_hits[marker]
+
+    def with_classes(self, *names):
+        """Tags carrying all of the given classes, in document order"""
+        positions = set(self.class_index.get(names[0], ()))
+        for name in names[1:]:
+            positions.intersection_update(self.class_index.get(name, ()))
+        return [self._tags[position] for position in sorted(positions)]
+
+    def class_contains(self, *fragments, also=()):
+        """Tags with a class containing any fragment (or named exactly in also), in document order"""
+        positions = set()
+        for name, tagged in self.class_index.items():
+            if name in also or any(fragment in name for fragment in fragments):
+                positions.update(tagged)
+        return [self._tags[position] for position in sorted(positions)]
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Page Stream - download a search page only as far as the scraper reads it
+A scraper that keeps the first three product cards of a 700 KB page has no use for
+the rest. PageStream reads a streamed response chunk by chunk and hands each chunk
+to a watcher, stopping as soon as the watcher has seen what the scraper needs, and
+gives up on bodies once max_bytes have arrived. The prefix it returns parses like the
+whole page up to that point.
+
+    response = session.get(url, stream=True)
+    stream = PageStream(response)
+    content = stream.read(until=ContainerWatcher.for_selector('div.product-tuple-listing', 3))
+    stream.complete       # False when the download stopped early
+    content = stream.read()  # the rest, when the prefix turned out not to be enough
+
+ContainerWatcher feeds the chunks to lxml's incremental HTML parser and counts the
+containers that have closed; MarkerWatcher waits for the script holding an embedded
+state (e.g. window.__INITIAL_STATE__) to end.
+"""
+
+import re
+
+LXML_AVAILABLE = False
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    pass
+
+# Body size after which reading stops (at the next chunk boundary); a bigger page
+# is parsed as far as it got
+MAX_BODY_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 16 * 1024
+
+
+class PageStream:
+    """Body of a streamed requests response, read on demand"""
+
+    def __init__(self, response, max_bytes=MAX_BODY_BYTES, chunk_size=CHUNK_SIZE):
+        self.response = response
+        self.max_bytes = max_bytes
+        self._chunks = response.iter_content(chunk_size)
+        self._body = []  # chunks read so far, joined once per read()
+        self.size = 0
+        self.complete = False  # the whole body has been read
+        self.oversized = False  # reading stopped at max_bytes
+        self.closed = False
+
+    def read(self, until=None):
+        """The body read so far, after reading on until until(chunk) is true, the body ends
+        or max_bytes is reached. The connection is closed once reading is over."""
+        if until is not None and self._body and until(self._join()):
+            return self._join()
+        while not self.complete and not self.oversized:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.complete = True
+                break
+            self._body.append(chunk)
+            self.size += len(chunk)
+            if self.size >= self.max_bytes:
+                self.oversized = True
+                break
+            if until is not None and until(chunk):
+                break
+        if self.complete or self.oversized:
+            self.close()
+        return self._join()
+
+    def _join(self):
+        if len(self._body) > 1:
+            self._body = [b''.join(self._body)]
+        return self._body[0] if self._body else b''
+
+    def close(self):
+        """Stop reading and let the connection go (closed, when the body was left unfinished)"""
+        if not self.closed:
+            self.closed = True
+            self.response.close()
+
+
+class MarkerWatcher:
+    """Satisfied once the element following a marker has ended (by default the script
+    that assigns an embedded state such as window.__INITIAL_STATE__)"""
+
+    def __init__(self, marker, end='</script>'):
+        self.marker = marker.encode('ascii')
+        self.end = end.encode('ascii')
+        self.found = False
+        self._tail = b''
+
+    def __call__(self, chunk):
+        data = self._tail + chunk
+        if not self.found:
+            position = data.find(self.marker)
+            if position == -1:
+                self._tail = data[-len(self.marker):]
+                return False
+            self.found = True
+            data = data[position + len(self.marker):]
+        if self.end in data:
+            return True
+        self._tail = data[-len(self.end):]
+        return False
+
+
+# One compound selector: optional tag, then .class / #id / [attribute] parts
+_COMPOUND_PATTERN = re.compile(r'\s*(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<parts>(?:[.#][\w-]+|\[[^\]]+\])*)\s*$')
+_PART_PATTERN = re.compile(r'''\.(?P<cls>[\w-]+)|\#(?P<id>[\w-]+)
+    |\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]''', re.VERBOSE)
+
+_ATTRIBUTE_TESTS = {
+    None: lambda actual, value: True,
+    '=': lambda actual, value: actual == value,
+    '*=': lambda actual, value: bool(value) and value in actual,
+    '^=': lambda actual, value: bool(value) and actual.startswith(value),
+    '$=': lambda actual, value: bool(value) and actual.endswith(value),
+    '~=': lambda actual, value: value in actual.split(),
+    '|=': lambda actual, value: actual == value or actual.startswith(value + '-'),
+}
+
+
+def split_selector_list(css):
+    """Selectors of a comma-separated list (commas inside [...] do not split)"""
+    return re.split(r',(?![^\[]*\])', css)
+
+
+def _compile_compound(css):
+    """Element predicate of a compound selector, None when it uses anything else (combinators, pseudo-classes)"""
+    match = _COMPOUND_PATTERN.match(css)
+    if not match or not (match.group('tag') or match.group('parts')):
+        return None
+    tag = (match.group('tag') or '*').lower()
+    classes, tests = set(), []
+    for part in _PART_PATTERN.finditer(match.group('parts')):
+        if part.group('cls'):
+            classes.add(part.group('cls'))
+        elif part.group('id'):
+            tests.append(('id', '=', part.group('id')))
+        else:
+            value = part.group('value')
+            if value and value[0] in '"\'':
+                value = value[1:-1]
+            tests.append((part.group('attr').lower(), part.group('op'), value))
+    if _PART_PATTERN.sub('', match.group('parts')):
+        return None  # something the part pattern did not consume
+
+    def matches(element):
+        if tag != '*' and element.tag != tag:
+            return False
+        if classes and not classes.issubset((element.get('class') or '').split()):
+            return False
+        for name, op, value in tests:
+            actual = element.get(name)
+            if actual is None:
+                return False
+            if name == 'class':
+                actual = ' '.join(actual.split())
+            if not _ATTRIBUTE_TESTS[op](actual, value):
+                return False
+        return True
+
+    return matches
+
+
+class ContainerWatcher:
+    """Satisfied once the first count elements matching a selector have closed.
+
+    The chunks are parsed incrementally with lxml; each finished element is cleared
+    right away, so the watcher holds little more than the open ancestors.
+    """
+
+    def __init__(self, predicates, count):
+        self.predicates = predicates
+        self.count = count
+        self.matched = 0
+        self._depth = 0
+        self._open = set()  # depths of matched containers not yet closed
+        self.parser = etree.HTMLPullParser(events=('start', 'end'))
+
+    @classmethod
+    def for_selector(cls, css, count):
+        """Watcher for a selector list, None when lxml is missing or a selector is not a plain compound one"""
+        if not LXML_AVAILABLE or not css or count < 1:
+            return None
+        predicates = [_compile_compound(selector) for selector in split_selector_list(css)]
+        if not all(predicates):
+            return None
+        return cls(predicates, count)
+
+    def __call__(self, chunk):
+        self.parser.feed(chunk)
+        for event, element in self.parser.read_events():
+            if event == 'start':
+                self._depth += 1
+                if (self.matched < self.count and isinstance(element.tag, str)
+                        and any(predicate(element) for predicate in self.predicates)):
+                    self.matched += 1
+                    self._open.add(self._depth)
+            else:
+                self._open.discard(self._depth)
+                self._depth -= 1
+                element.clear(keep_tail=True)
+        return self.matched >= self.count and not self._open
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Platform Health - spot block pages early, stop calling failing platforms
+A captcha or "Access Denied" page is an HTTP 200 whose products never appear, so a
+scraper used to parse all of it before giving up. block_page_reason() recognises
+those pages from the first chunk of the body. CircuitBreakerBoard keeps one breaker
+per platform for the life of the process: after repeated failures (or one block)
+the platform is skipped outright until a cooldown passes, then a single trial run
+decides whether it is healthy again.
+
+    block_page_reason(b'<html><head><title>Robot Check</title>...')   -> 'Amazon robot check'
+
+    breakers = CircuitBreakerBoard()
+    if breakers.allow('Meesho'):              # closed, or the half-open trial run
+        ...
+        breakers.record('Meesho', ok=False, trip=True)   # a block opens it at once
+    breakers.snapshot()   # {'Meesho': {'state': 'open', 'failures': 1, 'retryIn': 59.8, ...}}
+"""
+
+import threading
+import time
+
+# Bytes at the start of a body searched for block page markers
+BLOCK_SNIFF_BYTES = 16 * 1024
+
+# Lowercase markers of the bot-protection pages served instead of search results
+BLOCK_PAGE_MARKERS = (
+    (b'/errors/validatecaptcha', 'Amazon robot check'),
+    (b'<title>robot check</title>', 'Amazon robot check'),
+    (b'api-services-support@amazon.com', 'Amazon automated access notice'),
+    (b'<title>access denied</title>', 'access denied page'),
+    (b'px-captcha', 'PerimeterX captcha'),
+    (b'_cf_chl_opt', 'Cloudflare challenge'),
+    (b'<title>just a moment...</title>', 'Cloudflare challenge'),
+    (b'<title>attention required! | cloudflare</title>', 'Cloudflare block page'),
+    (b'pardon our interruption', 'bot protection page'),
+)
+
+# Consecutive failed runs that open a breaker, and how long it then stays open
+# (doubled after each failed trial run, up to the maximum)
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN = 60.0
+BREAKER_MAX_COOLDOWN = 900.0
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+def block_page_reason(head):
+    """What kind of block page the start of a body is, None for a regular page"""
+    head = head[:BLOCK_SNIFF_BYTES].lower()
+    for marker, reason in BLOCK_PAGE_MARKERS:
+        if marker in head:
+            return reason
+    return None
+
+
+class CircuitBreaker:
+    """Closed / open / half-open state of one platform"""
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, cooldown=BREAKER_COOLDOWN,
+                 max_cooldown=BREAKER_MAX_COOLDOWN, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0  # consecutive failed runs
+        self.cooldown = cooldown
+        self.opened_at = None
+        self.last_failure = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True when the platform may run; an expired open breaker lets one trial through
+        per cooldown (a trial that never reported back, e.g. cancelled at the deadline,
+        is replaced by the next)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = self.clock()
+            if now >= self.opened_at + self.cooldown:
+                self.state = HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+
+    def record(self, ok, trip=False, detail=None):
+        """Outcome of a run: success closes the breaker; failures open it after the threshold,
+        at once when trip is set or when the half-open trial failed"""
+        with self._lock:
+            if ok:
+                self.state = CLOSED
+                self.failures = 0
+                self.cooldown = self.base_cooldown
+                return
+            self.failures += 1
+            self.last_failure = detail
+            if self.state == HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            elif not trip and self.failures < self.failure_threshold:
+                return
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+    def retry_in(self):
+        """Seconds until the breaker lets a (new) trial run through"""
+        if self.state == CLOSED:
+            return 0.0
+        return max(self.opened_at + self.cooldown - self.clock(), 0.0)
+
+    def describe(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'retryIn': round(self.retry_in(), 1),
+            'lastFailure': self.last_failure,
+        }
+
+
+class CircuitBreakerBoard:
+    """One CircuitBreaker per platform, created on first use"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, platform):
+        with self._lock:
+            if platform not in self.breakers:
+                self.breakers[platform] = CircuitBreaker(**self.settings)
+            return self.breakers[platform]
+
+    def allow(self, platform):
+        return self.breaker(platform).allow()
+
+    def record(self, platform, ok, trip=False, detail=None):
+        self.breaker(platform).record(ok, trip=trip, detail=detail)
+
+    def snapshot(self):
+        """describe() of every breaker that is not closed, or has failures counting towards opening"""
+        return {platform: breaker.describe() for platform, breaker in list(self.breakers.items())
+                if breaker.state != CLOSED or breaker.failures}
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Price Parser - one compiled tokenizer for every price on a page
+A single regex alternation walks the text once and emits price tokens: amounts
+marked with ₹ / Rs. / INR, bare amounts, "NN% off" discounts, and the labels
+(MRP, Special Price, ...) that say what the next amount is. Amounts may use
+Indian (1,29,999) or western (129,999) digit grouping; paise are dropped.
+
+    parse_price('₹1,29,999')                        -> 129999
+    parse_price_details('₹799 MRP ₹999 20% off')    -> {'price': 799, 'mrp': 999, 'discount': 20}
+    find_prices(page_text, low=1000, high=50000)    -> every ₹ amount in range, in page order
+    parse_price_batch([...])                        -> details for many strings in one scan
+    find_json_prices(script_text)                   -> "price": 45999 values of embedded JSON
+"""
+
+import re
+from collections import namedtuple
+
+# A token is one amount or discount: kind is 'currency' (₹/Rs./INR amount), 'bare'
+# (plain number) or 'discount' (percent off); label is 'mrp' or 'selling' when a
+# label such as "MRP" or "Special Price" directly precedes the amount, else None
+PriceToken = namedtuple('PriceToken', 'kind value label')
+
+CURRENCY = 'currency'
+BARE = 'bare'
+DISCOUNT = 'discount'
+MRP = 'mrp'
+SELLING = 'selling'
+
+# Western grouping first (1,234,567), then Indian (12,34,567), then ungrouped digits.
+# A group ends after three digits, so '₹59,90023% off' (text of adjacent spans) splits
+# into 59900 and a 23% discount.
+_AMOUNT = r'\d{1,3}(?:,\d{3})+|\d{1,3}(?:,\d{2})*,\d{3}|\d+'
+
+PRICE_TOKEN_PATTERN = re.compile(rf'''
+    (?P<mrp>\bM\.?R\.?P\.?(?!\w))
+  | (?P<selling>\b(?:special|deal|sale|current|offer|selling)\s*price\b)
+  | (?P<discount>\d{{1,2}}(?:\.\d+)?)\s*%\s*off\b
+  | (?:₹|(?<![a-z])(?:rs\.?|inr\b))\s*(?P<currency>{_AMOUNT})(?:\.\d{{1,2}})?
+  | (?<![\w.])(?P<bare>{_AMOUNT})(?:\.\d{{1,2}})?
+  | (?P<reset>\x00)
+''', re.IGNORECASE | re.VERBOSE)
+
+# "price":45999 inside an embedded JSON/JS state blob
+JSON_PRICE_PATTERN = re.compile(r'"price"\s*:\s*(\d+)')
+
+# Joins batch texts; no amount can span it and it resets any pending label
+_BATCH_SEPARATOR = '\x00'
+
+# Characters a label may be separated from its amount by ("MRP (incl. of all taxes) ₹999");
+# a label further away, or with a number in between, describes something else
+LABEL_REACH = 24
+
+
+def _amount(digits):
+    return int(digits.replace(',', ''))
+
+
+def _scan(text):
+    """Yield (start, end, PriceToken) for every token of text in one pass"""
+    label = label_end = None
+    for match in PRICE_TOKEN_PATTERN.finditer(text):
+        group = match.lastgroup
+        if group == 'reset':
+            label = None
+            continue
+        if group == MRP or group == SELLING:
+            label, label_end = group, match.end()
+            continue
+        if label is not None and match.start() - label_end > LABEL_REACH:
+            label = None
+        if group == DISCOUNT:
+            yield match.start(), match.end(), PriceToken(DISCOUNT, round(float(match.group(DISCOUNT))), None)
+        else:
+            yield match.start(), match.end(), PriceToken(group, _amount(match.group(group)), label)
+        label = None
+
+
+def tokenize_prices(text):
+    """All price tokens of a text block, in order"""
+    if not text:
+        return []
+    return [token for _, _, token in _scan(text)]
+
+
+def split_prices(tokens):
+    """Selling price, MRP and discount from the tokens of one price block.
+
+    The selling price is the first ₹ amount not labelled MRP (a plain amount when the
+    block has no currency marks). The MRP is the labelled one, else a higher ₹ amount
+    right after the selling price (the struck-out price). A missing discount is
+    derived from the two.
+    """
+    price = mrp = discount = None
+    first_currency = first_bare = None
+    previous = None
+    for token in tokens:
+        if token.kind == DISCOUNT:
+            discount = discount if discount is not None else token.value
+        elif token.kind == CURRENCY:
+            if first_currency is None:
+                first_currency = token.value
+            if token.label == MRP:
+                mrp = mrp if mrp is not None else token.value
+            elif price is None:
+                price = token.value
+            elif mrp is None and previous is not None and previous.value == price and token.value > price:
+                mrp = token.value
+        elif first_bare is None:
+            first_bare = token.value
+        previous = token if token.kind == CURRENCY else None
+
+    if price is None:
+        price = first_currency if first_currency is not None else first_bare
+    if discount is None and mrp and price and mrp > price:
+        discount = round((mrp - price) * 100 / mrp)
+    return {'price': price, 'mrp': mrp, 'discount': discount}
+
+
+def parse_price(text):
+    """Selling price of a price element's text as an int, None when it holds no amount"""
+    return split_prices(tokenize_prices(text))['price']
+
+
+def parse_price_details(text):
+    """{'price', 'mrp', 'discount'} of a price element's text"""
+    return split_prices(tokenize_prices(text))
+
+
+def _in_range(value, low, high):
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+def find_prices(text, low=None, high=None):
+    """Every ₹/Rs./INR amount in a text block (e.g. a whole page), optionally within [low, high]"""
+    return [token.value for token in tokenize_prices(text)
+            if token.kind == CURRENCY and _in_range(token.value, low, high)]
+
+
+def selling_prices(text, low=None, high=None):
+    """₹ amounts that are marked as the current price in a text block.
+
+    Those labelled "Special/Deal/Sale/Current Price", and the lower of two ₹ amounts
+    separated only by whitespace (a price shown next to its struck-out MRP, in either
+    order, or the one not labelled MRP; pairs do not overlap), optionally within
+    [low, high].
+    """
+    if not text:
+        return []
+    found = []
+    pending = None  # (end, token) of an unpaired ₹ amount
+    for start, end, token in _scan(text):
+        if token.kind != CURRENCY:
+            pending = None
+            continue
+        if token.label == SELLING:
+            if _in_range(token.value, low, high):
+                found.append(token.value)
+            pending = None
+            continue
+        if pending is not None and not text[pending[0]:start].strip():
+            first = pending[1]
+            if first.label == MRP or token.label == MRP:
+                value = token.value if first.label == MRP else first.value
+            else:
+                value = min(first.value, token.value)
+            if _in_range(value, low, high):
+                found.append(value)
+            pending = None
+        else:
+            pending = (end, token)
+    return found
+
+
+def find_json_prices(text, low=None, high=None):
+    """Values of "price" keys in embedded JSON, optionally within [low, high]"""
+    return [value for value in map(int, JSON_PRICE_PATTERN.findall(text or '')) if _in_range(value, low, high)]
+
+
+def tokenize_batch(texts):
+    """Price tokens of many strings (e.g. every price element on a page) from one scan"""
+    texts = [text or '' for text in texts]
+    joined = _BATCH_SEPARATOR.join(texts)
+    batches = [[] for _ in texts]
+    # Segment boundaries in the joined string; tokens arrive in order so a cursor suffices
+    ends = []
+    position = 0
+    for text in texts:
+        position += len(text)
+        ends.append(position)
+        position += len(_BATCH_SEPARATOR)
+    segment = 0
+    for start, _, token in _scan(joined):
+        while start >= ends[segment]:
+            segment += 1
+        batches[segment].append(token)
+    return batches
+
+
+def parse_price_batch(texts):
+    """parse_price_details for many strings at once, in the same order"""
+    return [split_prices(tokens) for tokens in tokenize_batch(texts)]
+
+
+def find_prices_batch(texts, low=None, high=None):
+    """find_prices for many strings at once, flattened in order"""
+    return [token.value for tokens in tokenize_batch(texts) for token in tokens
+            if token.kind == CURRENCY and _in_range(token.value, low, high)]
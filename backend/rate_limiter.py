@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Rate Limiter - per-host politeness shared by every query in the process
+A token bucket per host: each request takes a token, tokens refill at `rate` per
+second up to `burst`. A host that has not been contacted for a while is fetched
+without delay; only once its bucket is empty does a request wait for the next
+token. Because the limiter is process-wide, concurrent queries against the same
+storefront share one budget instead of each pacing themselves.
+
+    limiter = HostRateLimiter(rate=2.0, burst=5)
+    waited = limiter.acquire('https://www.flipkart.com/search?q=ssd', max_wait=10)
+    # 0.0 with tokens left, else the seconds slept; None when the wait would exceed max_wait
+    limiter.stats()   # {'www.flipkart.com': {'requests': 9, 'delayed': 2, 'waited': 0.71}}
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+# Sustained requests per second per host, and how many may go out back to back
+# (a search page plus a batch of product page lookups)
+HOST_RATE = 2.0
+HOST_BURST = 5
+
+
+class TokenBucket:
+    """Request budget of one host"""
+
+    def __init__(self, rate=HOST_RATE, burst=HOST_BURST, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.requests = 0
+        self.delayed = 0  # requests that had to wait for a token
+        self.waited = 0.0  # seconds of waiting added in total
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait=None):
+        """Take a token; returns the seconds to wait before using it, or None (nothing
+        taken) when that would be longer than max_wait"""
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                return None
+            # Waiting callers leave the bucket in debt, so they queue up one token apart
+            self.tokens -= 1
+            self.requests += 1
+            if wait:
+                self.delayed += 1
+                self.waited += wait
+            return wait
+
+    def describe(self):
+        return {'requests': self.requests, 'delayed': self.delayed, 'waited': round(self.waited, 2)}
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use"""
+
+    def __init__(self, rate=HOST_RATE, burst=HOST_BURST, sleep=time.sleep, **settings):
+        self.rate = rate
+        self.burst = burst
+        self.sleep = sleep
+        self.settings = settings
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        with self._lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst, **self.settings)
+            return self.buckets[host]
+
+    def acquire(self, url, max_wait=None):
+        """Wait for a token of url's host (a URL or a bare host name).
+
+        Returns the seconds slept (0.0 when the host had budget left), or None
+        without waiting when the next token is further off than max_wait.
+        """
+        host = urlparse(url).netloc or url
+        wait = self.bucket(host).reserve(max_wait)
+        if wait:
+            self.sleep(wait)
+        return wait
+
+    def stats(self):
+        """describe() of every host contacted so far"""
+        return {host: bucket.describe() for host, bucket in list(self.buckets.items())}
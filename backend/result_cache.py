@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Result Cache - reuse recent scrape_all results for repeated queries
+Two tiers: an in-memory LRU for the running process and an optional SQLite file
+that survives restarts. Entries are keyed on the normalized query, the platform
+set and the Selenium mode, and expire after a per-tier TTL.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_TTL = 600  # seconds
+DEFAULT_DISK_TTL = 3600  # seconds
+DEFAULT_MAX_ENTRIES = 256
+PARTIAL_RESULT_TTL = 60  # seconds a run with failed platforms is reused (memory only)
+
+
+def normalize_query(query):
+    """Lowercase and collapse whitespace so 'iPhone  15' and 'iphone 15' share an entry"""
+    return ' '.join(query.lower().split())
+
+
+def cache_key(query, platforms, use_selenium):
+    """Cache key for a query run against a set of platforms in a Selenium mode"""
+    return json.dumps([normalize_query(query), sorted(platforms), bool(use_selenium)])
+
+
+class ResultCache:
+    """In-memory LRU in front of an optional SQLite table of cached scrape results.
+
+    Values are JSON-serializable dicts (results plus platform stats). A disk hit
+    is promoted to memory. Both tiers are safe to use from several threads.
+    """
+
+    def __init__(self, path=None, memory_ttl=DEFAULT_MEMORY_TTL, disk_ttl=DEFAULT_DISK_TTL,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.memory_ttl = memory_ttl
+        self.disk_ttl = disk_ttl
+        self.max_entries = max_entries
+        self._memory = OrderedDict()  # key -> (created_at, expires_at, value)
+        self._lock = threading.Lock()
+        self._db = None
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0}
+
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute('CREATE TABLE IF NOT EXISTS results '
+                                 '(key TEXT PRIMARY KEY, created_at REAL, value TEXT)')
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ [CACHE] Disk cache disabled, could not open {path}: {e}")
+                self._db = None
+
+    def get(self, key):
+        """Return (value, info) for a fresh entry or (None, info) on a miss.
+
+        info holds the hit status, tier and age in seconds for the output document.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, expires_at, value = entry
+                if now <= expires_at:
+                    self._memory.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return value, self._info('hit', 'memory', now - created_at)
+                del self._memory[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute('SELECT created_at, value FROM results WHERE key = ?',
+                                           (key,)).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ [CACHE] Disk cache read failed: {e}")
+                    row = None
+                if row is not None and now - row[0] <= self.disk_ttl:
+                    value = json.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.stats['disk_hits'] += 1
+                    return value, self._info('hit', 'disk', now - row[0])
+
+            self.stats['misses'] += 1
+            return None, self._info('miss', None, None)
+
+    def put(self, key, value, ttl=None):
+        """Store a value in both tiers; a shorter-lived one (ttl seconds) in memory only"""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value, ttl)
+            self.stats['stores'] += 1
+            if ttl is not None:
+                if self._db is not None:
+                    try:
+                        # An older, complete entry must not outlive the short one
+                        self._db.execute('DELETE FROM results WHERE key = ?', (key,))
+                        self._db.commit()
+                    except sqlite3.Error as e:
+                        logger.warning(f"⚠️ [CACHE] Disk cache write failed: {e}")
+                return
+            if self._db is not None:
+                try:
+                    self._db.execute('INSERT OR REPLACE INTO results (key, created_at, value) VALUES (?, ?, ?)',
+                                     (key, now, json.dumps(value)))
+                    self._db.execute('DELETE FROM results WHERE created_at < ?', (now - self.disk_ttl,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ [CACHE] Disk cache write failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key, created_at, value, ttl=None):
+        ttl = self.memory_ttl if ttl is None else min(ttl, self.memory_ttl)
+        self._memory[key] = (created_at, created_at + ttl, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _info(self, status, tier, age):
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        return {
+            'status': status,
+            'tier': tier,
+            'age': round(age, 1) if age is not None else None,
+            'hits': hits,
+            'misses': self.stats['misses'],
+        }
@@ -6,24 +6,44 @@ Includes Selenium-based scrapers for JavaScript-rendered sites
 """
 
 import sys
+import copy
 import json
 import requests
 import time
 import random
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus, urljoin
+import threading
+import multiprocessing
+import os
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from urllib.parse import urljoin, urlparse
 import re
 import logging
 
+from result_cache import ResultCache, cache_key, DEFAULT_DISK_TTL, PARTIAL_RESULT_TTL
+from selector_registry import load_registry, platform_selectors
+from page_context import PageContext
+from accessory_filter import accessory_filter
+from embedded_data import embedded_products
+from http_transport import HostTransport
+from page_stream import PageStream, ContainerWatcher, MarkerWatcher, MAX_BODY_BYTES, split_selector_list
+from platform_health import CircuitBreakerBoard, block_page_reason, BLOCK_SNIFF_BYTES
+from rate_limiter import HostRateLimiter
+from latency_tracker import LatencyTracker, SEARCH_PAGE, PRODUCT_PAGE
+from price_parser import (CURRENCY, JSON_PRICE_PATTERN, find_json_prices, find_prices, find_prices_batch,
+                          parse_price, selling_prices, tokenize_batch)
+
 # Selenium imports (optional - for JS-rendered sites)
 SELENIUM_AVAILABLE = False
 try:
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service as ChromeService
     from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.common.exceptions import TimeoutException, WebDriverException
     from webdriver_manager.chrome import ChromeDriverManager
     SELENIUM_AVAILABLE = True
@@ -40,690 +60,1635 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Worker pool size for concurrent mode (one worker per requests-based platform)
+DEFAULT_MAX_WORKERS = 6
+
+# Seconds a platform may run past its budget before its worker is abandoned
+PLATFORM_GRACE_SECONDS = 1.0
+
+# BeautifulSoup tree builders selectable with --parser; 'fastest' picks the
+# quickest one installed (lxml, a C parser, falling back to Python's html.parser)
+PARSER_BACKENDS = ('html.parser', 'lxml', 'fastest')
+DEFAULT_PARSER = 'fastest'
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w-]+)', re.IGNORECASE)
+
+# Product containers of each scraper, from the selector registry. Pages are parsed
+# restricted to subtrees whose root matches these selectors (see ContainerStrainer);
+# everything else is skipped.
+CONTAINER_SELECTORS = {key: spec.parse_only for key, spec in load_registry().items() if spec.parse_only}
+
+# Hosts of the registry's search pages, each given its own kept-alive pool (HostTransport)
+PLATFORM_HOSTS = tuple(dict.fromkeys(urlparse(spec.search_url).netloc
+                                     for spec in load_registry().values() if spec.search_url))
+
+# Product-page lookups (_fetch_all): concurrent requests per host, and the
+# seconds one platform's batch of lookups may take in total
+PER_HOST_CONCURRENCY = 4
+DETAIL_FETCH_BUDGET = 12
+
+# HTTP statuses that mean the platform is refusing us rather than failing
+# (a 503 is usually an overloaded or restarting server, so it counts as an error)
+BLOCKED_STATUS_CODES = {403, 429}
+
+# Per-platform outcome reported in the JSON output
+STATUS_OK = 'ok'
+STATUS_TIMEOUT = 'timeout'
+STATUS_BLOCKED = 'blocked'
+STATUS_ERROR = 'error'
+STATUS_SKIPPED = 'skipped'  # not run: its circuit breaker is open
+
+# Selenium WebDriver pool sizing (see SeleniumDriverPool)
+DRIVER_POOL_SIZE = 3
+DRIVER_MAX_PAGES = 50  # page loads before a driver is recycled
+DRIVER_MAX_MEMORY_MB = 512  # JS heap size that marks a driver as bloated
+DRIVER_CHECKOUT_TIMEOUT = 60
+
+# Longest each Selenium scraper waits for its product cards to render (seconds)
+SELENIUM_READY_CAPS = {
+    'Meesho': 8,
+    'JioMart': 8,
+    'Myntra': 6,
+    'AJIO': 8,
+    'Nykaa': 6,
+    'Tata CLiQ': 8,
+    'FirstCry': 6,
+}
+DEFAULT_READY_CAP = 8
+READY_POLL_SECONDS = 0.25
+READY_TARGET_CARDS = 5  # the Selenium scrapers parse at most 5 cards
+
+@lru_cache(maxsize=None)
+def resolve_parser(name=DEFAULT_PARSER):
+    """Map a --parser choice to an installed BeautifulSoup tree builder"""
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser '{name}', expected one of {', '.join(PARSER_BACKENDS)}")
+    if name == 'fastest':
+        return 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"⚠️ [PARSER] {name} is not installed, using html.parser")
+        return 'html.parser'
+    return name
+
+
+COMPOUND_SELECTOR_PATTERN = re.compile(r'^([\w-]+|\*)?((?:\.[\w-]+)*)((?:\[[^\]]+\])*)$')
+ATTRIBUTE_SELECTOR_PATTERN = re.compile(r'\[([\w-]+)(?:([~*^$|]?=)["\']?([^"\'\]]*)["\']?)?\]')
+
+def _attribute_matches(actual, operator, expected):
+    if actual is None:
+        return False
+    if isinstance(actual, list):
+        actual = ' '.join(actual)
+    if not operator:
+        return True
+    if operator == '=':
+        return actual == expected
+    if operator == '*=':
+        return expected in actual
+    if operator == '^=':
+        return actual.startswith(expected)
+    if operator == '$=':
+        return actual.endswith(expected)
+    if operator == '~=':
+        return expected in actual.split()
+    return actual == expected or actual.startswith(expected + '-')  # |=
+
+
+class ContainerStrainer(SoupStrainer):
+    """SoupStrainer that only builds subtrees whose root matches a CSS selector list.
+
+    Understands the compound selectors used for product containers: tag, .class,
+    [attr] and [attr=|*=|^=|$=|~=value]. Selectors with combinators raise
+    ValueError; restrict the parse to their enclosing elements instead.
+    """
+
+    def __init__(self, selector):
+        super().__init__()
+        self.selector = selector
+        self.rules = [self._compile(part) for part in split_selector_list(selector)]
+
+    @staticmethod
+    def _compile(part):
+        match = COMPOUND_SELECTOR_PATTERN.match(part.strip())
+        if not match:
+            raise ValueError(f"Unsupported container selector (compound selectors only): '{part.strip()}'")
+        tag, classes, attributes = match.groups()
+        return (
+            None if tag in (None, '*') else tag.lower(),
+            [name for name in classes.split('.') if name],
+            ATTRIBUTE_SELECTOR_PATTERN.findall(attributes),
+        )
+
+    def matches(self, name, attrs):
+        attrs = dict(attrs) if attrs else {}
+        for tag, classes, attributes in self.rules:
+            if tag and tag != name:
+                continue
+            if classes:
+                tag_classes = attrs.get('class') or ''
+                tag_classes = tag_classes if isinstance(tag_classes, list) else tag_classes.split()
+                if not all(class_name in tag_classes for class_name in classes):
+                    continue
+            if all(_attribute_matches(attrs.get(attr), operator, value) for attr, operator, value in attributes):
+                return True
+        return False
+
+    # BeautifulSoup >= 4.13 asks before creating each top-level tag and string
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.matches(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # Older BeautifulSoup releases call search_tag instead
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return markup_name if self.matches(markup_name, markup_attrs) else None
+
+
+@lru_cache(maxsize=None)
+def container_strainer(selector):
+    """Compiled ContainerStrainer for a selector list, built once per process"""
+    return ContainerStrainer(selector)
+
+
+def make_soup(markup, parser=DEFAULT_PARSER, encoding=None, only=None):
+    """Parse markup (raw bytes or str) with the selected backend.
+
+    Bytes are handed to the parser undecoded; encoding, when known from the
+    response headers, saves BeautifulSoup from sniffing it. With only (a container
+    selector list) nothing outside the matching subtrees is built.
+    """
+    if not isinstance(markup, bytes):
+        encoding = None
+    parse_only = container_strainer(only) if only else None
+    return BeautifulSoup(markup, resolve_parser(parser), from_encoding=encoding, parse_only=parse_only)
+
+
+def declared_charset(response):
+    """Charset from the Content-Type header, or None when the server did not send one"""
+    match = CHARSET_PATTERN.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+INITIAL_STATE_MARKER = 'window.__INITIAL_STATE__'
+INITIAL_STATE_PATTERN = re.compile(r'window\.__INITIAL_STATE__\s*=\s*(?=\{)')
+MYX_STATE_PATTERN = re.compile(r'window\.__myx\s*=\s*(?=\{)')
+
+# Flipkart image URLs in the page state are templates with size/quality placeholders
+FLIPKART_IMAGE_PARAMS = {'{@width}': '416', '{@height}': '416', '{@quality}': '70'}
+
+def _extract_state(html, pattern, name):
+    """Decode the object a page assigns to a window global, or None.
+
+    pattern only locates the assignment (a literal-prefixed regex, linear in the page);
+    raw_decode then reads exactly one JSON object from there, so no lazy `{.*?}` match
+    ever backtracks over a multi-megabyte script.
+    """
+    match = pattern.search(html)
+    if not match:
+        return None
+    try:
+        state, _ = json.JSONDecoder().raw_decode(html, match.end())
+    except ValueError as e:
+        logger.warning(f"⚠️ [STATE] Could not decode {name}: {e}")
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def extract_initial_state(html):
+    """Decode the object assigned to window.__INITIAL_STATE__ in a page, or None"""
+    return _extract_state(html, INITIAL_STATE_PATTERN, '__INITIAL_STATE__')
+
+
+def extract_myx_state(html):
+    """Decode the object assigned to window.__myx (Myntra's server-rendered state), or None"""
+    return _extract_state(html, MYX_STATE_PATTERN, '__myx')
+
+
+def flipkart_products_from_state(state):
+    """Products of a Flipkart search page's __INITIAL_STATE__, in page order.
+
+    Walks multiWidgetState.widgetsData.slots[].slotData.widget.data.products[] and
+    returns dicts with title, price (selling), mrp, pid, url and image. Products
+    without a title or selling price are skipped; repeated pids are kept once
+    (products without a pid are all kept).
+    """
+    if not state:
+        return []
+    slots = ((state.get('multiWidgetState') or {}).get('widgetsData') or {}).get('slots') or []
+    products = []
+    seen_pids = set()
+    for slot in slots:
+        widget = ((slot or {}).get('slotData') or {}).get('widget') or {}
+        for product in (widget.get('data') or {}).get('products') or []:
+            value = (product or {}).get('value') or {}
+            title = (value.get('titles') or {}).get('title')
+            pricing = value.get('pricing') or {}
+            price = pricing.get('displayPrice')
+            pid = (value.get('productMeta') or {}).get('productId')
+            if not title or not isinstance(price, (int, float)) or (pid and pid in seen_pids):
+                continue
+            if pid:
+                seen_pids.add(pid)
+
+            url = ((product.get('action') or {}).get('url'))
+            image = None
+            images = value.get('images') or []
+            if images and images[0].get('imageUrl'):
+                image = images[0]['imageUrl']
+                for placeholder, param in FLIPKART_IMAGE_PARAMS.items():
+                    image = image.replace(placeholder, param)
+
+            products.append({
+                'title': title,
+                'price': int(price),
+                'mrp': pricing.get('strikeOffPrice'),
+                'pid': pid,
+                'url': urljoin('https://www.flipkart.com', url) if url else None,
+                'image': image,
+            })
+    return products
+
+
+AMAZON_ASIN_PATTERN = re.compile(r'^[A-Z0-9]{10}$')
+AMAZON_PRODUCT_URL = 'https://www.amazon.in/dp/{asin}'
+AMAZON_CARD_SELECTOR = '[data-component-type="s-search-result"][data-asin]'
+# Secondary title holders, for cards without an <h2>
+AMAZON_TITLE_CLASSES = ('a-text-normal', 'a-size-medium', 'a-size-base-plus')
+AMAZON_REJECTED_TITLES = {'sponsored', 'advertisement', 'ad'}
+SRCSET_CANDIDATE_PATTERN = re.compile(r'(\S+)\s+(\d+(?:\.\d+)?)[wx]')
+
+
+def is_amazon_product_image(url):
+    """True for a real product image on Amazon's CDN (not an SVG/GIF placeholder or sprite)"""
+    return bool(url) and 'media-amazon' in url and '/I/' in url and not url.endswith(('.svg', '.gif'))
+
+
+def best_srcset_url(srcset, accept=is_amazon_product_image):
+    """Largest candidate of an img srcset accepted by accept, or None"""
+    best_url, best_size = None, -1.0
+    for url, size in SRCSET_CANDIDATE_PATTERN.findall(srcset or ''):
+        if float(size) > best_size and accept(url):
+            best_url, best_size = url, float(size)
+    return best_url
+
+
+# Size suffixes of Amazon image URLs (._AC_UY218_, ._SX300_, ...)
+AMAZON_IMAGE_SIZE_PATTERNS = (
+    re.compile(r'\._[A-Z]{2}\d+[A-Z_]*_'),
+    re.compile(r'\._[A-Z]{2}_[A-Z]{2}\d+[A-Z_]*_'),
+)
+
+
+def upscale_amazon_image(url):
+    """Amazon image URL rewritten to its 500px rendition (the CDN resizes on the size suffix)"""
+    if url and 'amazon' in url.lower():
+        for pattern in AMAZON_IMAGE_SIZE_PATTERNS:
+            url = pattern.sub('._AC_SL500_', url)
+    return url
+
+
+def _amazon_img_url(img):
+    url = best_srcset_url(img.get('srcset'))
+    if not url:
+        url = next((img.get(attr) for attr in ('data-src', 'data-old-hires', 'src')
+                    if is_amazon_product_image(img.get(attr))), None)
+    return upscale_amazon_image(url)
+
+
+def _amazon_price_amount(price_block):
+    """Amount of an .a-price block: its screen-reader text, else the visible whole part"""
+    amount = price_block.find('span', class_='a-offscreen')
+    if amount is None:
+        amount = price_block.find(class_='a-price-whole')
+    return parse_price(amount.get_text()) if amount is not None else None
+
+
+def amazon_card_product(card):
+    """Product of one Amazon search result card keyed by its data-asin, or None.
+
+    Every field is read in one walk over the card's tags: the <h2> title (a title-class
+    span for cards without one), the first .a-price (struck-through .a-price
+    [data-a-strike] is the MRP) and the first .s-image. The url is the canonical
+    /dp/<ASIN> page, stable across tracking parameters and usable as a cache key.
+    """
+    asin = (card.get('data-asin') or '').strip()
+    if not AMAZON_ASIN_PATTERN.match(asin):
+        return None
+    title = fallback_title = price = mrp = image = None
+    for tag in card.find_all(True):
+        classes = tag.get('class') or ()
+        if tag.name == 'h2':
+            if title is None:
+                text = tag.get_text(' ', strip=True)
+                if text and text.lower() not in AMAZON_REJECTED_TITLES:
+                    title = text
+        elif tag.name == 'img':
+            if image is None and 's-image' in classes:
+                image = _amazon_img_url(tag)
+        elif 'a-price' in classes:
+            if tag.get('data-a-strike'):
+                mrp = mrp or _amazon_price_amount(tag)
+            elif price is None:
+                price = _amazon_price_amount(tag)
+        elif fallback_title is None and tag.name == 'span' and any(name in classes for name in AMAZON_TITLE_CLASSES):
+            text = tag.get_text(' ', strip=True)
+            if text and text.lower() not in AMAZON_REJECTED_TITLES:
+                fallback_title = text
+    title = title or fallback_title
+    if not title or not price:
+        return None
+    return {
+        'title': title,
+        'price': price,
+        'mrp': mrp if mrp and mrp > price else None,
+        'pid': asin,
+        'url': AMAZON_PRODUCT_URL.format(asin=asin),
+        'image': image,
+    }
+
+
+def myntra_products_from_state(state):
+    """Products of a Myntra search page's window.__myx state, in page order.
+
+    Reads searchData.results.products[] and returns dicts with title (brand + name),
+    brand, name, price (discounted), mrp, pid, url and image. Products without a
+    name or price are skipped; repeated pids are kept once.
+    """
+    if not state:
+        return []
+    results = ((state.get('searchData') or {}).get('results') or {})
+    products = []
+    seen_pids = set()
+    for product in results.get('products') or []:
+        product = product or {}
+        brand = product.get('brand') or ''
+        name = product.get('productName') or product.get('product') or ''
+        price = product.get('price')
+        pid = product.get('productId')
+        if not name or not isinstance(price, (int, float)) or price <= 0 or (pid and pid in seen_pids):
+            continue
+        if pid:
+            seen_pids.add(pid)
+
+        # productName usually starts with the brand already
+        title = name if name.lower().startswith(brand.lower()) else f"{brand} {name}"
+        mrp = product.get('mrp')
+        image = product.get('searchImage')
+        if not image:
+            images = product.get('images') or []
+            image = (images[0] or {}).get('src') if images else None
+        url = product.get('landingPageUrl')
+
+        products.append({
+            'title': title.strip(),
+            'brand': brand or None,
+            'name': name,
+            'price': int(price),
+            'mrp': int(mrp) if isinstance(mrp, (int, float)) and mrp > price else None,
+            'pid': pid,
+            'url': urljoin('https://www.myntra.com/', url) if url else None,
+            'image': image,
+        })
+    return products
+
+
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+def _host_semaphore(url):
+    """Process-wide semaphore limiting concurrent requests to the URL's host"""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+
+def _launch_chrome_driver():
+    """Start a headless Chrome WebDriver with stealth options, or return None"""
+    try:
+        logger.info("🌐 [SELENIUM] Initializing Chrome WebDriver...")
+        
+        chrome_options = ChromeOptions()
+        chrome_options.add_argument('--headless=new')  # New headless mode
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Random user agent
+        user_agents = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        ]
+        chrome_options.add_argument(f'user-agent={random.choice(user_agents)}')
+        
+        # Use webdriver-manager to get the correct driver
+        try:
+            # Try to use webdriver-manager with correct platform detection
+            import platform
+            os_name = platform.system().lower()
+            
+            if os_name == 'windows':
+                # Force win64 architecture
+                from webdriver_manager.core.os_manager import ChromeType
+                service = ChromeService(ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install())
+            else:
+                service = ChromeService(ChromeDriverManager().install())
+            
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception as wdm_error:
+            logger.warning(f"⚠️ [SELENIUM] WebDriver Manager error: {wdm_error}")
+            # Fallback: Try using system Chrome driver
+            try:
+                driver = webdriver.Chrome(options=chrome_options)
+            except Exception as fallback_error:
+                logger.error(f"❌ [SELENIUM] Fallback also failed: {fallback_error}")
+                return None
+        
+        # Stealth settings
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': '''
+                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+                Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+            '''
+        })
+        
+        logger.info("✅ [SELENIUM] Chrome WebDriver initialized successfully")
+        return driver
+    except Exception as e:
+        logger.error(f"❌ [SELENIUM] Failed to initialize WebDriver: {e}")
+        return None
+
+
+def _quit_driver(driver):
+    try:
+        driver.quit()
+        logger.info("🔒 [SELENIUM] WebDriver closed")
+    except:
+        pass
+
+
+class SeleniumDriverPool:
+    """Bounded pool of Chrome WebDrivers checked out by one platform at a time.
+
+    Launching Chrome costs seconds, so drivers are kept between platforms and queries.
+    Idle drivers are health-checked on checkout; a driver is recycled once it has
+    loaded max_pages pages or its JS heap grows past max_memory_mb.
+    """
+
+    def __init__(self, max_size=DRIVER_POOL_SIZE, max_pages=DRIVER_MAX_PAGES,
+                 max_memory_mb=DRIVER_MAX_MEMORY_MB, launcher=_launch_chrome_driver):
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._launcher = launcher
+        self._condition = threading.Condition()
+        self._idle = []
+        self._drivers = {}  # id(driver) -> {'pages': int, 'generation': int}
+        self._launching = 0
+        self._generation = 0
+        self.stats = {'launched': 0, 'checkouts': 0, 'recycled': 0}
+
+    def size(self):
+        with self._condition:
+            return len(self._drivers) + self._launching
+
+    def prelaunch(self, count=None):
+        """Start drivers up front so the first Selenium query does not pay for the launch"""
+        count = self.max_size if count is None else min(count, self.max_size)
+        while self.size() < count:
+            driver = self._launch()
+            if driver is None:
+                break
+            self.release(driver)
+        logger.info(f"🌐 [DRIVER-POOL] {self.size()} WebDrivers ready")
+
+    def checkout(self, timeout=DRIVER_CHECKOUT_TIMEOUT):
+        """Take a healthy driver, launching one while below max_size. None if none became free in time."""
+        deadline = time.monotonic() + (timeout if timeout is not None else DRIVER_CHECKOUT_TIMEOUT)
+        while True:
+            with self._condition:
+                while not self._idle and len(self._drivers) + self._launching >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"⏱️ [DRIVER-POOL] No WebDriver free within {timeout}s")
+                        return None
+                    self._condition.wait(remaining)
+                driver = self._idle.pop() if self._idle else None
+
+            if driver is None:
+                driver = self._launch()
+                if driver is None:
+                    return None
+            elif not self._healthy(driver):
+                logger.warning("⚠️ [DRIVER-POOL] Idle WebDriver failed health check, replacing it")
+                self._retire(driver)
+                continue
+
+            with self._condition:
+                self.stats['checkouts'] += 1
+            return driver
+
+    def release(self, driver):
+        """Give a driver back; worn out or bloated drivers are quit instead of kept"""
+        with self._condition:
+            info = self._drivers.get(id(driver))
+            stale = info is not None and info['generation'] != self._generation
+        if info is None:
+            _quit_driver(driver)
+            return
+        reason = None
+        if stale:
+            reason = 'pool was shut down'
+        elif info['pages'] >= self.max_pages:
+            reason = f"{info['pages']} pages loaded"
+        else:
+            memory_mb = self._memory_mb(driver)
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                reason = f"JS heap at {memory_mb:.0f}MB"
+        if reason:
+            logger.info(f"♻️ [DRIVER-POOL] Recycling WebDriver: {reason}")
+            self._retire(driver)
+            return
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def page_loaded(self, driver):
+        """Count one page load against the driver's recycle limit"""
+        with self._condition:
+            info = self._drivers.get(id(driver))
+            if info is not None:
+                info['pages'] += 1
+
+    def shutdown(self):
+        """Quit idle drivers; drivers still checked out are quit when released"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._drivers.pop(id(driver), None)
+            self._generation += 1
+            self._condition.notify_all()
+        for driver in idle:
+            _quit_driver(driver)
+
+    def _launch(self):
+        with self._condition:
+            self._launching += 1
+        driver = None
+        try:
+            driver = self._launcher()
+        finally:
+            with self._condition:
+                self._launching -= 1
+                if driver is not None:
+                    self._drivers[id(driver)] = {'pages': 0, 'generation': self._generation}
+                    self.stats['launched'] += 1
+                self._condition.notify()
+        return driver
+
+    def _retire(self, driver):
+        with self._condition:
+            self._drivers.pop(id(driver), None)
+            self.stats['recycled'] += 1
+            self._condition.notify()
+        _quit_driver(driver)
+
+    def _healthy(self, driver):
+        try:
+            return driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def _memory_mb(self, driver):
+        """Used JS heap of the current page in MB (Chrome only), or None"""
+        try:
+            used = driver.execute_script(
+                'return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null')
+        except Exception:
+            return None
+        return used / (1024 * 1024) if used else None
+
+
+# Shared by every ProductScraper in the process so drivers outlive single queries
+shared_driver_pool = SeleniumDriverPool()
+
+# Shared likewise so every ProductScraper reuses the same warm connections
+shared_transport = HostTransport(PLATFORM_HOSTS)
+
+# Shared likewise so a failing platform stays skipped across queries
+shared_breakers = CircuitBreakerBoard()
+
+# Shared likewise so concurrent queries draw on one request budget per host
+shared_rate_limiter = HostRateLimiter()
+
+# Shared likewise so timeouts adapt to latencies observed across queries
+shared_latencies = LatencyTracker()
+
+
+class FetchedPage:
+    """Picklable stand-in for a fetched response: the URL, raw bytes and Content-Type
+    the parse methods read, so a page can be handed to a parse-pool process"""
+
+    __slots__ = ('url', 'content', 'headers', 'status_code')
+
+    def __init__(self, url, content, content_type=None, status_code=200):
+        self.url = url
+        self.content = content
+        self.headers = {'Content-Type': content_type} if content_type else {}
+        self.status_code = status_code
+
+    @classmethod
+    def from_markup(cls, url, markup):
+        """Page of already-decoded markup (e.g. a Selenium page_source)"""
+        return cls(url, markup.encode('utf-8'), 'text/html; charset=utf-8')
+
+
+class ParsePool:
+    """Worker processes that parse fetched pages and run the extraction on them.
+
+    Parsing and extraction are pure-Python CPU work, so scraper threads serialize on
+    the GIL however many fetches run in parallel. With a pool the fetch threads hand
+    each page's raw bytes to a process and get compact result records back. The
+    processes start on first use (or prewarm()) and stay warm until shutdown().
+    """
+
+    def __init__(self, processes=None):
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = None
+        self._lock = threading.Lock()
+        self.stats = {'parsed': 0, 'restarts': 0}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that runs scraper threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_parse_worker, initargs=(logger.level,))
+            return self._executor
+
+    def run(self, fn, *args, timeout=None):
+        """fn(*args) in a worker process.
+
+        Raises concurrent.futures.TimeoutError after timeout seconds, and
+        BrokenProcessPool when a worker died (the pool is restarted for the next call).
+        """
+        executor = self._get_executor()
+        future = executor.submit(fn, *args)
+        try:
+            result = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+        except BrokenProcessPool:
+            self._restart(executor)
+            raise
+        with self._lock:
+            self.stats['parsed'] += 1
+        return result
+
+    def prewarm(self):
+        """Start every worker process (imports, selector registry) before the first query"""
+        executor = self._get_executor()
+        for future in [executor.submit(_parse_worker_ready) for _ in range(self.processes)]:
+            future.result()
+        logger.info(f"🧵 [PARSE-POOL] {self.processes} parse processes ready")
+
+    def _restart(self, broken):
+        """Drop a broken executor so the next call starts fresh processes"""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                self.stats['restarts'] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# ProductScraper of a parse-pool process; only its network-free parse methods are used
+_parse_worker = None
+
+
+def _init_parse_worker(log_level):
+    logger.setLevel(log_level)
+
+
+def _parse_worker_ready():
+    return os.getpid()
+
+
+def _parse_page_job(method_name, key, page, query, parser, restricted_parse):
+    """Run one ProductScraper parse method in a parse-pool process.
+
+    Returns (method's return value, result records, selector matches).
+    """
+    global _parse_worker
+    if _parse_worker is None:
+        _parse_worker = ProductScraper(parser=parser)
+    worker = _parse_worker
+    worker.parser = parser
+    worker.restricted_parse = restricted_parse
+    worker.results = []
+    worker.selector_matches = {}
+    value = getattr(worker, method_name)(key, page, query)
+    return value, worker.results, worker.selector_matches
+
 class ProductScraper:
-    def __init__(self):
+    def __init__(self, persistent=False, driver_pool=None, cache=None, parser=DEFAULT_PARSER, parse_pool=None,
+                 transport=None, breakers=None, rate_limiter=None, latencies=None):
+        # persistent=True keeps pooled Selenium drivers alive between scrape_all calls (scraper_service.py)
+        self.persistent = persistent
+        self.driver_pool = driver_pool or shared_driver_pool
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Per-host connection pools (optionally HTTP/2) for every platform host
+        self.transport = transport or shared_transport
+        self.transport.mount(self.session)
+        self.breakers = breakers or shared_breakers  # per-platform CircuitBreakerBoard
+        self.rate_limiter = rate_limiter or shared_rate_limiter  # per-host HostRateLimiter
+        self.throttle_waits = []  # seconds _get waited on the rate limiter for the current platform
+        self.latencies = latencies or shared_latencies  # LatencyTracker sizing _get timeouts
         self.results = []
-        self.driver = None  # Selenium WebDriver (lazy-loaded)
+        self.driver = None  # Selenium WebDriver checked out of driver_pool (lazy)
+        self.deadline = None  # time.monotonic() value after which fetches are refused
+        self.fetch_failures = []  # (status, detail) for failed fetches of the current platform
+        self.platform_stats = {}
+        self.on_platform_done = None  # callback(platform, stats, results) as each platform finishes
+        self.cache = cache  # ResultCache consulted by scrape_all, or None
+        self.parser = resolve_parser(parser)  # BeautifulSoup tree builder for every page
+        self.restricted_parse = True  # parse only CONTAINER_SELECTORS subtrees where a scraper allows it
+        self.cache_info = None  # hit/miss/age of the last scrape_all lookup
+        self.selector_matches = {}  # field -> {registry selector: hits} for the current platform
+        self.parse_pool = parse_pool  # ParsePool for parsing pages in worker processes, or None (inline)
         
     def _get_selenium_driver(self):
-        """Get or create Selenium WebDriver with stealth options"""
+        """Check out a pooled Chrome WebDriver, held until _close_selenium_driver"""
         if not SELENIUM_AVAILABLE:
             logger.warning("⚠️ Selenium not available. Install with: pip install selenium webdriver-manager")
             return None
             
         if self.driver is None:
-            try:
-                logger.info("🌐 [SELENIUM] Initializing Chrome WebDriver...")
-                
-                chrome_options = ChromeOptions()
-                chrome_options.add_argument('--headless=new')  # New headless mode
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--window-size=1920,1080')
-                chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-                chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-                chrome_options.add_experimental_option('useAutomationExtension', False)
-                
-                # Random user agent
-                user_agents = [
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                ]
-                chrome_options.add_argument(f'user-agent={random.choice(user_agents)}')
-                
-                # Use webdriver-manager to get the correct driver
-                try:
-                    # Try to use webdriver-manager with correct platform detection
-                    import platform
-                    os_name = platform.system().lower()
-                    
-                    if os_name == 'windows':
-                        # Force win64 architecture
-                        from webdriver_manager.core.os_manager import ChromeType
-                        service = ChromeService(ChromeDriverManager(chrome_type=ChromeType.GOOGLE).install())
-                    else:
-                        service = ChromeService(ChromeDriverManager().install())
-                    
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                except Exception as wdm_error:
-                    logger.warning(f"⚠️ [SELENIUM] WebDriver Manager error: {wdm_error}")
-                    # Fallback: Try using system Chrome driver
-                    try:
-                        self.driver = webdriver.Chrome(options=chrome_options)
-                    except Exception as fallback_error:
-                        logger.error(f"❌ [SELENIUM] Fallback also failed: {fallback_error}")
-                        return None
-                
-                # Stealth settings
-                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                    'source': '''
-                        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                        Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                        Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-                    '''
-                })
-                
-                logger.info("✅ [SELENIUM] Chrome WebDriver initialized successfully")
-            except Exception as e:
-                logger.error(f"❌ [SELENIUM] Failed to initialize WebDriver: {e}")
-                return None
+            remaining = self._remaining_time()
+            timeout = DRIVER_CHECKOUT_TIMEOUT if remaining is None else max(min(remaining, DRIVER_CHECKOUT_TIMEOUT), 0)
+            self.driver = self.driver_pool.checkout(timeout=timeout)
                 
         return self.driver
     
     def _close_selenium_driver(self):
-        """Close Selenium WebDriver"""
+        """Return the Selenium WebDriver to the pool"""
         if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("🔒 [SELENIUM] WebDriver closed")
-            except:
-                pass
+            self.driver_pool.release(self.driver)
             self.driver = None
-        
-    def add_random_delay(self, min_delay=0.1, max_delay=0.3):
-        """Add random delay to avoid being blocked (reduced for speed)"""
-        time.sleep(random.uniform(min_delay, max_delay))
-    
-    def _get_category_base_price(self, query):
-        """Get realistic base price for Indian market based on product category"""
-        query_lower = query.lower()
-        
-        # Electronics
-        if any(word in query_lower for word in ['iphone', 'samsung', 'phone', 'mobile', 'smartphone']):
-            return random.randint(15000, 80000)
-        elif any(word in query_lower for word in ['laptop', 'computer', 'macbook', 'omen', 'pavilion', 'inspiron', 'thinkpad', 'ideapad', 'vivobook', 'gaming laptop', 'i7', 'i5', 'i3', 'ryzen']):
-            # Gaming laptops and high-end models
-            if any(word in query_lower for word in ['omen', 'gaming', 'i7', 'rtx', 'gtx', 'legion', 'rog']):
-                return random.randint(60000, 150000)
-            # Regular laptops
+
+    def fork(self):
+        """Create a worker copy that shares the HTTP session but has its own result buffer"""
+        worker = copy.copy(self)
+        worker.results = []
+        worker.driver = None
+        worker.fetch_failures = []
+        worker.throttle_waits = []
+        worker.platform_stats = {}
+        worker.selector_matches = {}
+        return worker
+
+    def _run_platform(self, method_name, query):
+        """Run one platform scraper against a fresh result buffer and return the buffer"""
+        self.results = []
+        self.fetch_failures = []
+        self.throttle_waits = []
+        self.selector_matches = {}
+        getattr(self, method_name)(query)
+        return self.results
+
+    def _remaining_time(self):
+        """Seconds left before the deadline, or None when there is no deadline"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def _record_failure(self, status, detail):
+        """Remember why a fetch failed so the platform status can be reported"""
+        self.fetch_failures.append((status, detail))
+
+    def _throttle(self, url):
+        """Wait for the rate limiter to allow a request to url's host, within the deadline.
+
+        Returns the seconds left before the deadline afterwards (None without one),
+        or False when the host's next free slot lies past the deadline.
+        """
+        remaining = self._remaining_time()
+        if remaining is not None and remaining <= 0:
+            return False
+        waited = self.rate_limiter.acquire(url, max_wait=remaining)
+        if waited is None:
+            return False
+        if waited:
+            self.throttle_waits.append(waited)
+            remaining = self._remaining_time()
+            if remaining is not None and remaining <= 0:
+                return False
+        return remaining
+
+    def _get(self, url, timeout=15, endpoint=None, **kwargs):
+        """session.get, paced by the per-host rate limiter, with the timeout clamped to the platform deadline.
+
+        Fetches after the deadline are refused, so an abandoned worker stops at its
+        next network call. Failures are recorded for the per-platform status.
+        endpoint is a (platform, endpoint type) pair whose observed latencies set the
+        (connect, read) timeouts, timeout then being their ceiling; the request's own
+        latency is recorded for it.
+        """
+        if endpoint is not None:
+            timeout = self.latencies.timeout(*endpoint, ceiling=timeout)
+        remaining = self._throttle(url)
+        if remaining is False:
+            self._record_failure(STATUS_TIMEOUT, 'time budget exhausted')
+            raise requests.Timeout(f"Time budget exhausted before fetching {url}")
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        clamped = remaining is not None and remaining < read
+        if clamped:
+            connect, read = min(connect, remaining), remaining
+
+        try:
+            response = self.session.get(url, timeout=(connect, read), **kwargs)
+        except requests.Timeout as e:
+            self._record_failure(STATUS_TIMEOUT, str(e))
+            if endpoint is not None and not clamped:
+                # A stall counts as a latency of the timeout it hit (not one cut short by the deadline)
+                self.latencies.record(*endpoint, connect if isinstance(e, requests.ConnectTimeout) else read)
+            raise
+        except requests.RequestException as e:
+            self._record_failure(STATUS_ERROR, str(e))
+            raise
+
+        if endpoint is not None:
+            self.latencies.record(*endpoint, response.elapsed.total_seconds())
+        if response.status_code in BLOCKED_STATUS_CODES:
+            self._record_failure(STATUS_BLOCKED, f"HTTP {response.status_code}")
+        elif response.status_code >= 400:
+            self._record_failure(STATUS_ERROR, f"HTTP {response.status_code}")
+        return response
+
+    def _soup(self, markup, only=None):
+        """Parse markup (e.g. a Selenium page_source) with the configured parser backend"""
+        return make_soup(markup, self.parser, only=only if self.restricted_parse else None)
+
+    def _response_soup(self, response, only=None):
+        """Parse a response's raw bytes with the configured parser backend, skipping .text decoding.
+
+        only restricts the tree to the subtrees matching a container selector list.
+        """
+        return make_soup(response.content, self.parser, encoding=declared_charset(response),
+                         only=only if self.restricted_parse else None)
+
+    def _fetch_all(self, urls, timeout=8, budget=DETAIL_FETCH_BUDGET, **kwargs):
+        """Fetch several pages concurrently through _get; returns {url: response or exception}.
+
+        At most PER_HOST_CONCURRENCY requests hit one host at a time (across all
+        queries in the process) and the whole batch shares one deadline, capped by
+        the platform deadline, so one slow page cannot hold up the others.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        lookup = copy.copy(self)
+        batch_deadline = time.monotonic() + budget
+        lookup.deadline = batch_deadline if self.deadline is None else min(self.deadline, batch_deadline)
+
+        def fetch(url):
+            semaphore = _host_semaphore(url)
+            if not semaphore.acquire(timeout=max(lookup._remaining_time(), 0)):
+                lookup._record_failure(STATUS_TIMEOUT, 'time budget exhausted')
+                raise requests.Timeout(f"Time budget exhausted waiting to fetch {url}")
+            try:
+                return lookup._get(url, timeout=timeout, **kwargs)
+            finally:
+                semaphore.release()
+
+        pages = {}
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix='fetch')
+        futures = {executor.submit(fetch, url): url for url in urls}
+        done, not_done = wait(futures, timeout=max(lookup._remaining_time(), 0) + PLATFORM_GRACE_SECONDS)
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future, url in futures.items():
+            if future in done:
+                pages[url] = future.exception() or future.result()
             else:
-                return random.randint(25000, 100000)
-        elif any(word in query_lower for word in ['headphone', 'earphone', 'speaker', 'audio']):
-            return random.randint(1500, 15000)
-        elif any(word in query_lower for word in ['tv', 'television', 'monitor']):
-            return random.randint(20000, 75000)
-        
-        # Default for general products
-        return random.randint(500, 10000)
-    
-    def scrape_snapdeal(self, query):
-        """Scrape Snapdeal - Indian e-commerce platform"""
+                pages[url] = requests.Timeout(f"Time budget exhausted fetching {url}")
+        logger.info(f"⚡ [FETCH] {len(urls)} pages fetched concurrently in {time.monotonic() - started:.1f}s")
+        return pages
+
+    def _fetched(self, pages, url, **kwargs):
+        """Response prefetched by _fetch_all (re-raising its error), fetched now if it was not prefetched"""
+        page = pages.get(url)
+        if page is None:
+            return self._get(url, **kwargs)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def _selenium_get(self, driver, url, page_load_timeout=30):
+        """driver.get, paced by the per-host rate limiter, with the page load timeout clamped to the platform deadline"""
+        remaining = self._throttle(url)
+        if remaining is False:
+            self._record_failure(STATUS_TIMEOUT, 'time budget exhausted')
+            raise TimeoutException(f"Time budget exhausted before loading {url}")
+        if remaining is not None:
+            page_load_timeout = min(page_load_timeout, remaining)
+        driver.set_page_load_timeout(max(page_load_timeout, 1))
+        self.driver_pool.page_loaded(driver)
         try:
-            logger.info(f"🔍 [SNAPDEAL] Starting scrape for: {query}")
-            url = f"https://www.snapdeal.com/search?keyword={quote_plus(query)}"
-            logger.info(f"🌐 [SNAPDEAL] Search URL: {url}")
-            
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            logger.info(f"✅ [SNAPDEAL] Response status: {response.status_code}")
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find product containers
-            products = soup.find_all('div', class_='product-tuple-listing')[:3]
-            logger.info(f"🎯 [SNAPDEAL] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    logger.info(f"📦 [SNAPDEAL] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = product.find('p', class_='product-title')
-                    title = title_elem.get_text().strip() if title_elem else f"Snapdeal {query} Product"
-                    logger.info(f"📝 [SNAPDEAL] Title extracted: '{title}'")
-                    logger.info(f"🔍 [SNAPDEAL] Title source: {'Real scraped data' if title_elem else 'Generated fallback'}")
-                    
-                    # Extract price
-                    price_elem = product.find('span', class_='product-price')
-                    price = None
-                    price_source = "Not found"
-                    if price_elem:
-                        price_text = price_elem.get_text().strip()
-                        logger.info(f"💰 [SNAPDEAL] Raw price text: '{price_text}'")
-                        price_match = re.search(r'[\d,]+', price_text.replace('Rs.', '').replace(',', ''))
-                        price = int(price_match.group()) if price_match else None
-                        price_source = f"Scraped from span.product-price: '{price_text}'"
-                    logger.info(f"💵 [SNAPDEAL] Final price: ₹{price} (Source: {price_source})")
-                    
-                    # Extract product URL
-                    link_elem = product.find('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        raw_href = link_elem.get('href')
-                        product_url = urljoin('https://www.snapdeal.com', raw_href)
-                        logger.info(f"🔗 [SNAPDEAL] Product URL: {product_url}")
-                        logger.info(f"🔗 [SNAPDEAL] Raw href: {raw_href}")
-                    else:
-                        logger.warning(f"⚠️ [SNAPDEAL] No product URL found")
-                    
-                    # Extract image
-                    img_elem = product.find('img', class_='product-image')
-                    image_url = img_elem.get('src') if img_elem else None
-                    logger.info(f"🖼️ [SNAPDEAL] Image URL: {image_url or 'Not found'}")
-                    
-                    if title and price:
-                        # Filter out accessories when searching for main products
-                        title_lower = title.lower()
-                        is_accessory = any(word in title_lower for word in [
-                            'cover', 'case', 'protector', 'screen guard', 'charger', 
-                            'cable', 'headphone', 'earphone', 'stand', 'holder',
-                            'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
-                            'power bank', 'tempered glass', 'lens', 'clip', 'ring'
-                        ])
-                        
-                        if is_accessory:
-                            logger.info(f"🚫 [SNAPDEAL] Filtered out accessory: {title[:50]}... at ₹{price}")
-                            continue
-                        
-                        result_data = {
-                            'platform': 'Snapdeal',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        }
-                        self.results.append(result_data)
-                        logger.info(f"✅ [SNAPDEAL] Added main product: {title[:50]}... at ₹{price}")
-                        logger.info(f"🔗 [SNAPDEAL] ⚠️ VERIFY: Click URL leads to: {product_url}")
-                    else:
-                        logger.warning(f"❌ [SNAPDEAL] Skipped product #{idx}: title='{title}', price={price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [SNAPDEAL] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Snapdeal: {e}")
-        
-        self.add_random_delay()
+            driver.get(url)
+        except TimeoutException as e:
+            self._record_failure(STATUS_TIMEOUT, str(e))
+            raise
+        except WebDriverException as e:
+            self._record_failure(STATUS_ERROR, str(e))
+            raise
+
+    def _wait_for_products(self, driver, platform, selector, target=READY_TARGET_CARDS):
+        """Poll until `target` elements match selector, scrolling only while more are needed.
+
+        Returns as soon as enough product cards are rendered. After the platform's cap
+        (clamped to the deadline) it gives up and the caller parses whatever is there.
+        Returns the number of matching cards.
+        """
+        cap = SELENIUM_READY_CAPS.get(platform, DEFAULT_READY_CAP)
+        remaining = self._remaining_time()
+        if remaining is not None:
+            cap = max(min(cap, remaining), 0)
+        started = time.monotonic()
+        seen = {'count': 0}
+
+        def cards_ready(driver):
+            count = driver.execute_script('return document.querySelectorAll(arguments[0]).length', selector)
+            if count >= target:
+                seen['count'] = count
+                return True
+            if count == seen['count']:
+                # Nothing new since the last poll: scroll one screen to trigger lazy loading
+                driver.execute_script('window.scrollBy(0, window.innerHeight);')
+            seen['count'] = count
+            return False
 
-    def scrape_naaptol(self, query):
-        """Scrape Naaptol - accessible e-commerce site with minimal anti-bot protection"""
         try:
-            logger.info(f"🔍 [NAAPTOL] Starting scrape for: {query}")
-            url = f"https://www.naaptol.com/search.html?q={quote_plus(query)}"
-            logger.info(f"🌐 [NAAPTOL] Search URL: {url}")
-            
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            logger.info(f"✅ [NAAPTOL] Response status: {response.status_code}")
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find product containers (Naaptol specific selectors)
-            products = soup.find_all('div', class_='item')[:3] or soup.find_all('div', class_='productItem')[:3]
-            logger.info(f"🎯 [NAAPTOL] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    logger.info(f"📦 [NAAPTOL] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = (product.find('h2') or 
-                                 product.find('a', class_='prod_name') or 
-                                 product.find('span', class_='catProductTitle'))
-                    title = title_elem.get_text().strip() if title_elem else f"Naaptol {query} Product"
-                    
-                    title_source_tag = "Unknown"
-                    if title_elem:
-                        title_source_tag = f"{title_elem.name}.{title_elem.get('class', ['no-class'])[0] if title_elem.get('class') else 'no-class'}"
-                    logger.info(f"📝 [NAAPTOL] Title extracted: '{title}'")
-                    logger.info(f"🔍 [NAAPTOL] Title source: {title_source_tag if title_elem else 'Generated fallback'}")
-                    
-                    # Extract price
-                    price_elem = (product.find('span', class_='offer-price') or 
-                                 product.find('span', class_='price') or
-                                 product.find('div', class_='price'))
-                    
-                    price = None
-                    price_source = "Not found"
-                    if price_elem:
-                        price_text = price_elem.get_text().strip()
-                        price_source_tag = f"{price_elem.name}.{price_elem.get('class', ['no-class'])[0] if price_elem.get('class') else 'no-class'}"
-                        logger.info(f"💰 [NAAPTOL] Raw price text: '{price_text}'")
-                        price_match = re.search(r'[\d,]+', price_text.replace('₹', ''))
-                        price = int(price_match.group().replace(',', '')) if price_match else None
-                        price_source = f"Scraped from {price_source_tag}: '{price_text}'"
-                    logger.info(f"💵 [NAAPTOL] Final price: ₹{price} (Source: {price_source})")
-                    
-                    # Extract product URL
-                    link_elem = product.find('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.naaptol.com', href)
-                        logger.info(f"🔗 [NAAPTOL] Product URL: {product_url}")
-                        logger.info(f"🔗 [NAAPTOL] Raw href: {href}")
-                    else:
-                        logger.warning(f"⚠️ [NAAPTOL] No product URL found")
-                    
-                    # Extract image
-                    img_elem = product.find('img')
-                    image_url = img_elem.get('src') or img_elem.get('data-src') if img_elem else None
-                    logger.info(f"🖼️ [NAAPTOL] Image URL: {image_url or 'Not found'}")
-                    
-                    if title and price:
-                        # Filter out accessories when searching for main products
-                        title_lower = title.lower()
-                        is_accessory = any(word in title_lower for word in [
-                            'cover', 'case', 'protector', 'screen guard', 'charger', 
-                            'cable', 'headphone', 'earphone', 'stand', 'holder',
-                            'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
-                            'power bank', 'tempered glass', 'lens', 'clip', 'ring'
-                        ])
-                        
-                        if is_accessory:
-                            logger.info(f"🚫 [NAAPTOL] Filtered out accessory: {title[:50]}... at ₹{price}")
-                            continue
-                        
-                        result_data = {
-                            'platform': 'Naaptol',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        }
-                        self.results.append(result_data)
-                        logger.info(f"✅ [NAAPTOL] Added main product: {title[:50]}... at ₹{price}")
-                        logger.info(f"🔗 [NAAPTOL] ⚠️ VERIFY: Click URL leads to: {product_url}")
-                    else:
-                        logger.warning(f"❌ [NAAPTOL] Skipped product #{idx}: title='{title}', price={price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [NAAPTOL] Error parsing product #{idx}: {e}")
+            WebDriverWait(driver, cap, poll_frequency=READY_POLL_SECONDS).until(cards_ready)
+        except TimeoutException:
+            logger.warning(f"⚠️ [SELENIUM] {platform}: only {seen['count']} product cards after {cap:.1f}s")
+        except WebDriverException as e:
+            logger.warning(f"⚠️ [SELENIUM] {platform}: readiness check failed: {e}")
+        else:
+            logger.info(f"⏱️ [SELENIUM] {platform}: {seen['count']} product cards ready in {time.monotonic() - started:.1f}s")
+        return seen['count']
+
+    def _platform_status(self):
+        """Status of a finished platform run: ok when it produced results, else the worst failure"""
+        if self.results:
+            return STATUS_OK
+        failures = {status for status, _ in self.fetch_failures}
+        for status in (STATUS_SKIPPED, STATUS_BLOCKED, STATUS_TIMEOUT, STATUS_ERROR):
+            if status in failures:
+                return status
+        return STATUS_OK
+
+    def _platform_deadline(self, platform_budget):
+        """Deadline for a platform starting now: its own budget capped by the total deadline"""
+        if not platform_budget:
+            return self.deadline
+        platform_deadline = time.monotonic() + platform_budget
+        return platform_deadline if self.deadline is None else min(self.deadline, platform_deadline)
+
+    def _run_platform_job(self, worker, method_name, query, uses_selenium, platform_budget):
+        """Run one platform on a forked worker; Selenium jobs check out their own pooled driver"""
+        worker.started_at = time.monotonic()
+        worker.deadline = self._platform_deadline(platform_budget)
+        try:
+            worker._run_platform(method_name, query)
+        finally:
+            if uses_selenium:
+                worker._close_selenium_driver()
+            worker.finished_at = time.monotonic()
+        return worker.results
+
+    def _record_platform(self, platform, worker, finished):
+        """Store the outcome of one platform run in platform_stats"""
+        started_at = getattr(worker, 'started_at', None)
+        ended_at = getattr(worker, 'finished_at', None) if finished else time.monotonic()
+        status = worker._platform_status() if finished else STATUS_TIMEOUT
+        stats = {
+            'status': status,
+            'results': len(worker.results),
+            'elapsed': round(ended_at - started_at, 2) if started_at else 0.0,
+        }
+        if status != STATUS_OK and worker.fetch_failures:
+            stats['detail'] = worker.fetch_failures[-1][1][:200]
+        if worker.throttle_waits:
+            stats['throttled'] = round(sum(worker.throttle_waits), 2)
+        latency = self.latencies.report(platform)
+        if latency:
+            stats['latency'] = latency
+        if worker.selector_matches:
+            stats['selectors'] = worker.selector_matches
+        self.platform_stats[platform] = stats
+
+        if started_at:
+            # Only runs that actually went out count towards the platform's breaker
+            self.breakers.record(platform, ok=status == STATUS_OK, trip=status == STATUS_BLOCKED,
+                                 detail=stats.get('detail'))
+
+        icon = '✅' if status == STATUS_OK else '⚠️'
+        logger.info(f"{icon} [PLATFORM] {platform}: {status} with {stats['results']} results in {stats['elapsed']}s")
+
+        if self.on_platform_done:
+            try:
+                self.on_platform_done(platform, stats, list(worker.results))
+            except Exception as e:
+                logger.error(f"❌ [PLATFORM] on_platform_done callback failed for {platform}: {e}")
+
+    def _platform_plan(self, use_selenium):
+        """Ordered (platform, scraper method, uses Selenium) tuples for scrape_all"""
+        selenium = use_selenium and SELENIUM_AVAILABLE
+        return [
+            # ==================== MAJOR PLATFORMS ====================
+            ('Amazon', 'scrape_amazon', False),                  # Amazon India - Using mobile headers ✅
+            ('Flipkart', 'scrape_flipkart', False),              # Flipkart - Using mobile headers ✅
+            # ==================== GENERAL MARKETPLACES ====================
+            # Use Selenium-based scrapers for sites with anti-bot protection
+            ('Meesho', 'scrape_meesho_selenium' if selenium else 'scrape_meesho', selenium),
+            ('JioMart', 'scrape_jiomart_selenium' if selenium else 'scrape_jiomart', selenium),
+            ('Snapdeal', 'scrape_snapdeal', False),              # Snapdeal - Value marketplace ✅
+            # ('IndiaMART', 'scrape_indiamart', False),          # IndiaMART - B2B (optional)
+            # ==================== SPECIALIZED PLATFORMS ====================
+            ('Myntra', 'scrape_myntra_selenium' if selenium else 'scrape_myntra', selenium),
+            ('AJIO', 'scrape_ajio_selenium' if selenium else 'scrape_ajio', selenium),
+            ('Nykaa', 'scrape_nykaa_selenium' if selenium else 'scrape_nykaa', selenium),
+            ('Tata CLiQ', 'scrape_tatacliq_selenium' if selenium else 'scrape_tatacliq', selenium),
+            ('FirstCry', 'scrape_firstcry_selenium' if selenium else 'scrape_firstcry', selenium),
+            # ==================== OTHER ACCESSIBLE SITES ====================
+            ('Naaptol', 'scrape_naaptol', False),                # Naaptol - No anti-bot protection ✅
+            ('Shopsy', 'scrape_shopsy', False),                  # Shopsy - Flipkart's social commerce ✅
+        ]
+
+    def prewarm_connections(self):
+        """Connect ahead of time to the host of every requests-based platform scrape_all runs"""
+        registry = load_registry()
+        hosts = [urlparse(registry[method_name].search_url).netloc
+                 for _, method_name, _ in self._platform_plan(use_selenium=False)
+                 if method_name in registry and registry[method_name].search_url]
+        return self.transport.prewarm(hosts)
+
+    def _breaker_open(self, platform, worker):
+        """Report a platform whose circuit breaker is open as skipped; True when it is"""
+        if self.breakers.allow(platform):
+            return False
+        breaker = self.breakers.breaker(platform)
+        worker._record_failure(STATUS_SKIPPED, f"circuit {breaker.state} after {breaker.failures} failures"
+                                               f" ({breaker.last_failure}), retry in {breaker.retry_in():.0f}s")
+        logger.info(f"⏭️ [BREAKER] {platform}: circuit {breaker.state}, skipped (retry in {breaker.retry_in():.0f}s)")
+        self._record_platform(platform, worker, finished=True)
+        return True
+
+    def _scrape_serially(self, query, plan, platform_budget):
+        """Run the platforms one after another, skipping those left after the deadline"""
+        merged = []
+        for platform, method_name, uses_selenium in plan:
+            worker = self.fork()
+            remaining = self._remaining_time()
+            if remaining is not None and remaining <= 0:
+                worker._record_failure(STATUS_TIMEOUT, 'skipped: time budget exhausted')
+                self._record_platform(platform, worker, finished=False)
+                continue
+            if self._breaker_open(platform, worker):
+                continue
+            self._run_platform_job(worker, method_name, query, uses_selenium, platform_budget)
+            self._record_platform(platform, worker, finished=True)
+            merged.extend(worker.results)
+        return merged
+
+    def _scrape_concurrently(self, query, plan, max_workers, platform_budget):
+        """Run requests-based scrapers on a bounded worker pool, each into its own buffer.
+
+        Selenium scrapers run on their own lane sized to the WebDriver pool, each on a
+        separate pooled driver, so browser work never starves the HTTP workers.
+        Platforms still running when their budget (or the total budget) runs out are
+        abandoned and reported as timeouts, keeping whatever they collected so far.
+        Buffers are merged back in plan order so the dedup step sees the same platform
+        priority as a serial run.
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+        selenium_jobs = sum(1 for _, _, uses_selenium in plan if uses_selenium)
+        selenium_lane = ThreadPoolExecutor(max_workers=max(min(self.driver_pool.max_size, selenium_jobs), 1),
+                                           thread_name_prefix='selenium')
+        jobs = {}
+        for platform, method_name, uses_selenium in plan:
+            worker = self.fork()
+            if self._breaker_open(platform, worker):
+                continue
+            executor = selenium_lane if uses_selenium else pool
+            future = executor.submit(self._run_platform_job, worker, method_name, query,
+                                     uses_selenium, platform_budget)
+            jobs[future] = (platform, worker)
+        logger.info(f"⚡ [CONCURRENT] Dispatched {len(jobs)} platforms to {max_workers} workers")
+
+        pending = set(jobs)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=self._next_check(jobs, pending),
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    platform, worker = jobs[future]
+                    exception = future.exception()
+                    if exception is not None:
+                        logger.error(f"❌ [CONCURRENT] {platform} worker failed: {exception}")
+                        worker._record_failure(STATUS_ERROR, str(exception))
+                    self._record_platform(platform, worker, finished=True)
+
+                remaining = self._remaining_time()
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"⏱️ [CONCURRENT] Total budget exhausted with {len(pending)} platforms running")
+                    break
+
+                now = time.monotonic()
+                for future in list(pending):
+                    platform, worker = jobs[future]
+                    deadline = getattr(worker, 'started_at', None) and worker.deadline
+                    if deadline is not None and now > deadline + PLATFORM_GRACE_SECONDS:
+                        logger.warning(f"⏱️ [CONCURRENT] {platform} overran its budget, abandoning it")
+                        pending.discard(future)
+                        future.cancel()
+                        self._record_platform(platform, worker, finished=False)
+        finally:
+            # Abandoned workers stop at their next fetch, so never block on them here
+            pool.shutdown(wait=False, cancel_futures=True)
+            selenium_lane.shutdown(wait=False, cancel_futures=True)
+
+        for future in pending:
+            platform, worker = jobs[future]
+            future.cancel()
+            self._record_platform(platform, worker, finished=False)
+
+        merged = []
+        for future, (platform, worker) in jobs.items():
+            merged.extend(list(worker.results))
+        return merged
+
+    def _next_check(self, jobs, pending):
+        """Seconds until the earliest running platform deadline or the total deadline"""
+        checkpoints = []
+        if self.deadline is not None:
+            checkpoints.append(self.deadline)
+        for future in pending:
+            _, worker = jobs[future]
+            if getattr(worker, 'started_at', None) and worker.deadline is not None:
+                checkpoints.append(worker.deadline + PLATFORM_GRACE_SECONDS)
+        if not checkpoints:
+            return None
+        return max(min(checkpoints) - time.monotonic(), 0.05)
+
+    # ==================== REGISTRY-DRIVEN EXTRACTION ====================
+    # Listing-style platforms are described in platform_selectors.json and share these methods
+
+    def _selector_matched(self, field, selector):
+        """Count which registry fallback produced a field, reported in the platform stats"""
+        hits = self.selector_matches.setdefault(field, {})
+        hits[selector] = hits.get(selector, 0) + 1
+
+    def _parse_page(self, method_name, key, page, query):
+        """Run a network-free parse method (e.g. '_parse_listing') on a FetchedPage.
+
+        With a parse pool the page goes to a worker process and its result records and
+        selector matches are merged into this scraper; otherwise it runs inline.
+        Returns the method's return value.
+        """
+        if self.parse_pool is None:
+            return getattr(self, method_name)(key, page, query)
+        remaining = self._remaining_time()
+        try:
+            value, results, matches = self.parse_pool.run(
+                _parse_page_job, method_name, key, page, query, self.parser, self.restricted_parse,
+                timeout=None if remaining is None else max(remaining, 0) + PLATFORM_GRACE_SECONDS)
+        except FuturesTimeoutError:
+            self._record_failure(STATUS_TIMEOUT, 'time budget exhausted while parsing')
+            logger.warning(f"⏱️ [PARSE-POOL] {key}: parse did not finish within the time budget")
+            return None
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️ [PARSE-POOL] Parse process died ({e}), parsing {key} in-process")
+            return getattr(self, method_name)(key, page, query)
+        self.results.extend(results)
+        for field, hits in matches.items():
+            for selector, count in hits.items():
+                merged = self.selector_matches.setdefault(field, {})
+                merged[selector] = merged.get(selector, 0) + count
+        return value
+
+    def _listing_page(self, spec, query, until=None):
+        """Fetch a platform's search page as a FetchedPage; None unless HTTP 200.
+
+        until is a page_stream watcher that ends the download early (see _read_page).
+        """
+        logger.info(f"🔍 [{spec.tag}] Starting scrape for: {query}")
+        search_url = spec.search_url_for(query)
+        logger.info(f"🌐 [{spec.tag}] Search URL: {search_url}")
+
+        response = self._get(search_url, headers=spec.headers, timeout=spec.timeout, stream=True,
+                             endpoint=(spec.platform, SEARCH_PAGE))
+        logger.info(f"✅ [{spec.tag}] Response status: {response.status_code}")
+        if response.status_code != 200:
+            response.close()
+            logger.warning(f"⚠️ [{spec.tag}] Non-200 response: {response.status_code}")
+            return None
+        page, stream = self._read_page(response, until, spec.tag)
+        stream.close()
+        return page
+
+    def _read_page(self, response, until=None, tag='STREAM', stream=None):
+        """(FetchedPage, PageStream) of a response fetched with stream=True.
+
+        The body is read until the watcher until is satisfied (to the end without
+        one), and never past MAX_BODY_BYTES. Pass the PageStream back as stream to
+        read the rest of the same body. A captcha or bot-protection page is recognised
+        from its first chunk: the download stops there, the platform is recorded as
+        blocked and the page is None.
+        """
+        first_read = stream is None
+        stream = stream or PageStream(response, max_bytes=MAX_BODY_BYTES)
+        try:
+            if first_read and self._blocked_page(stream.read(until=lambda chunk: True), tag):
+                stream.close()
+                return None, stream
+            content = stream.read(until)
+        except requests.RequestException as e:
+            stream.close()
+            self._record_failure(STATUS_TIMEOUT if isinstance(e, requests.Timeout) else STATUS_ERROR, str(e))
+            raise
+        if stream.oversized:
+            logger.warning(f"⚠️ [{tag}] Page over {MAX_BODY_BYTES // 1024}KB, parsing its first {stream.size // 1024}KB")
+        elif not stream.complete:
+            logger.info(f"✂️ [{tag}] Stopped the download after {stream.size // 1024}KB, the page's products are in")
+        return FetchedPage(response.url, content, response.headers.get('Content-Type'), response.status_code), stream
+
+    def _blocked_page(self, head, tag):
+        """Record a block page (recognised from the start of its body) as a blocked fetch; True if it is one"""
+        reason = block_page_reason(head)
+        if reason is None:
+            return False
+        self._record_failure(STATUS_BLOCKED, reason)
+        logger.warning(f"🚫 [{tag}] Served a {reason} instead of results, not parsing it")
+        return True
+
+    def _stream_watcher(self, spec):
+        """Watcher ending a registry page's download once spec.limit containers of its first
+        container selector are complete, for entries with "stream": true"""
+        if not spec.stream or not spec.containers:
+            return None
+        return ContainerWatcher.for_selector(spec.containers[0][0], spec.limit)
+
+    def _listing_soup(self, spec, response, query, html=None):
+        """Parsed containers of a fetched search page, None when its embedded data gave the results"""
+        if spec.embedded:
+            html = html if html is not None else self._response_html(response)
+            if self._extract_embedded(spec, html, query):
+                return None
+        return self._response_soup(response, only=spec.parse_only)
+
+    def _response_html(self, response, start=None):
+        """A response's body as text, decoded with its declared charset (no encoding sniffing).
+
+        start names an ASCII marker: only the body from its first occurrence on is
+        decoded ('' when it is absent), sparing the markup before an embedded state.
+        """
+        content = response.content
+        if start is not None:
+            position = content.find(start.encode('ascii'))
+            if position == -1:
+                return ''
+            content = content[position:]
+        return content.decode(declared_charset(response) or 'utf-8', errors='replace')
+
+    def _extract_embedded(self, spec, html, query):
+        """Add the products of the page's JSON-LD / state globals; True when there were any"""
+        products, source = embedded_products(html, base_url=spec.base_url, limit=spec.limit,
+                                             state=spec.embedded_state)
+        if not products:
+            return False
+        self._selector_matched('embedded', source)
+        logger.info(f"🎯 [{spec.tag}] Found {len(products)} products in embedded {source} data")
+        self._add_listing_results(spec, query, [{
+            'platform': spec.platform,
+            'title': product['title'][:100],
+            'price': product['price'],
+            'original_price': product['mrp'],
+            'url': product['url'],
+            'image': product['image'],
+            'currency': 'INR',
+            'availability': product['availability'] or spec.availability
+        } for product in products])
+        return True
+
+    def _extract_listing(self, spec, soup, query, extractors=None):
+        """Turn the product containers of a parsed page into results using the spec's selectors.
+
+        extractors maps extra field names to callables taking the container, for
+        fields that need code rather than selectors (e.g. Amazon images).
+        """
+        products, container_selector = spec.find_containers(soup)
+        if container_selector:
+            self._selector_matched('containers', container_selector)
+        logger.info(f"🎯 [{spec.tag}] Found {len(products)} product containers")
+
+        candidates = []
+        for idx, product in enumerate(products, 1):
+            try:
+                logger.info(f"📦 [{spec.tag}] Processing product #{idx}")
+                values, matched = spec.extract(product)
+                for field, selector in matched.items():
+                    self._selector_matched(field, selector)
+                for field, extractor in (extractors or {}).items():
+                    values[field] = extractor(product)
+
+                title = values.get('title')
+                if not title and spec.default_title:
+                    title = spec.default_title.format(query=query)
+                price = values.get('price')
+                logger.info(f"📝 [{spec.tag}] Title: '{title}' (selector: {matched.get('title', 'none')})")
+                logger.info(f"💵 [{spec.tag}] Price: ₹{price} (selector: {matched.get('price', 'none')})")
+
+                if not (title and price):
+                    logger.warning(f"❌ [{spec.tag}] Skipped product #{idx}: title='{title}', price={price}")
                     continue
-                    
+                candidates.append({
+                    'platform': spec.platform,
+                    'title': title[:100],
+                    'price': price,
+                    'url': values.get('url'),
+                    'image': values.get('image'),
+                    'currency': 'INR',
+                    'availability': spec.availability
+                })
+            except Exception as e:
+                logger.error(f"❌ [{spec.tag}] Error parsing product #{idx}: {e}")
+                continue
+
+        self._add_listing_results(spec, query, candidates)
+
+    def _add_listing_results(self, spec, query, candidates):
+        """Append a page's result records, checking every title for accessories in one pass"""
+        accessories = [None] * len(candidates)
+        if spec.skip_accessories:
+            accessories = accessory_filter(query).matches([result['title'] for result in candidates])
+        for result, accessory in zip(candidates, accessories):
+            if accessory:
+                logger.info(f"🚫 [{spec.tag}] Filtered out accessory ({accessory}): {result['title'][:50]}... at ₹{result['price']}")
+                continue
+            self.results.append(result)
+            logger.info(f"✅ [{spec.tag}] Added: {result['title'][:50]}... at ₹{result['price']}")
+
+    def _scrape_listing(self, key, query):
+        """Fetch and extract one registry-described platform (e.g. 'scrape_snapdeal')"""
+        spec = platform_selectors(key)
+        try:
+            page = self._listing_page(spec, query, until=self._stream_watcher(spec))
+            if page is not None:
+                self._parse_page('_parse_listing', key, page, query)
         except Exception as e:
-            logger.error(f"Error scraping Naaptol: {e}")
-        
-        self.add_random_delay()
+            logger.error(f"Error scraping {spec.platform}: {e}")
+
+    def _parse_listing(self, key, page, query):
+        """Embedded data, else the registry selectors, of a fetched listing page (no network)"""
+        spec = platform_selectors(key)
+        soup = self._listing_soup(spec, page, query)
+        if soup is not None:
+            self._extract_listing(spec, soup, query)
+
+    def _scrape_listing_selenium(self, key, query, fallback=True):
+        """Selenium variant of _scrape_listing, falling back to the spec's requests scraper.
+
+        fallback=False skips that fallback, for callers that already ran it.
+        """
+        spec = platform_selectors(key)
+        driver = self._get_selenium_driver()
+        if not driver:
+            if not fallback:
+                return
+            logger.warning(f"⚠️ [{spec.tag}] Falling back to basic scraper")
+            return getattr(self, spec.fallback)(query)
 
-    def scrape_shopsy(self, query):
-        """Scrape Shopsy - Flipkart's social commerce platform with minimal protection"""
         try:
-            logger.info(f"🔍 [SHOPSY] Starting scrape for: {query}")
-            url = f"https://shopsy.in/search?q={quote_plus(query)}"
-            logger.info(f"🌐 [SHOPSY] Search URL: {url}")
-            
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            logger.info(f"✅ [SHOPSY] Response status: {response.status_code}")
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find product containers (Shopsy/Flipkart style selectors)
-            products = (soup.find_all('div', class_='_2kHMta')[:3] or 
-                       soup.find_all('div', class_='_13oc-S')[:3] or
-                       soup.find_all('div', class_='_1AtVbE')[:3])
-            logger.info(f"🎯 [SHOPSY] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products, 1):
-                try:
-                    logger.info(f"📦 [SHOPSY] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = (product.find('a', class_='IRpwTa') or 
-                                 product.find('div', class_='_4rR01T') or
-                                 product.find('a', class_='s1Q9rs'))
-                    title = title_elem.get_text().strip() if title_elem else f"Shopsy {query} Product"
-                    
-                    title_source_tag = "Unknown"
-                    if title_elem:
-                        title_source_tag = f"{title_elem.name}.{title_elem.get('class', ['no-class'])[0] if title_elem.get('class') else 'no-class'}"
-                    logger.info(f"📝 [SHOPSY] Title extracted: '{title}'")
-                    logger.info(f"🔍 [SHOPSY] Title source: {title_source_tag if title_elem else 'Generated fallback'}")
-                    
-                    # Extract price
-                    price_elem = (product.find('div', class_='_30jeq3') or 
-                                 product.find('div', class_='_1_WHN1') or
-                                 product.find('div', class_='_25b18c'))
-                    
-                    price = None
-                    price_source = "Not found"
-                    if price_elem:
-                        price_text = price_elem.get_text().strip()
-                        price_source_tag = f"{price_elem.name}.{price_elem.get('class', ['no-class'])[0] if price_elem.get('class') else 'no-class'}"
-                        logger.info(f"💰 [SHOPSY] Raw price text: '{price_text}'")
-                        price_match = re.search(r'[\d,]+', price_text.replace('₹', ''))
-                        price = int(price_match.group().replace(',', '')) if price_match else None
-                        price_source = f"Scraped from {price_source_tag}: '{price_text}'"
-                    logger.info(f"💵 [SHOPSY] Final price: ₹{price} (Source: {price_source})")
-                    
-                    # Extract product URL
-                    link_elem = product.find('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://shopsy.in', href)
-                        logger.info(f"🔗 [SHOPSY] Product URL: {product_url}")
-                        logger.info(f"🔗 [SHOPSY] Raw href: {href}")
-                    else:
-                        logger.warning(f"⚠️ [SHOPSY] No product URL found")
-                    
-                    # Extract image
-                    img_elem = product.find('img')
-                    image_url = img_elem.get('src') or img_elem.get('data-src') if img_elem else None
-                    logger.info(f"🖼️ [SHOPSY] Image URL: {image_url or 'Not found'}")
-                    
-                    if title and price:
-                        # Filter out accessories when searching for main products
-                        title_lower = title.lower()
-                        is_accessory = any(word in title_lower for word in [
-                            'cover', 'case', 'protector', 'screen guard', 'charger', 
-                            'cable', 'headphone', 'earphone', 'stand', 'holder',
-                            'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
-                            'power bank', 'tempered glass', 'lens', 'clip', 'ring'
-                        ])
-                        
-                        if is_accessory:
-                            logger.info(f"🚫 [SHOPSY] Filtered out accessory: {title[:50]}... at ₹{price}")
-                            continue
-                        
-                        result_data = {
-                            'platform': 'Shopsy',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        }
-                        self.results.append(result_data)
-                        logger.info(f"✅ [SHOPSY] Added main product: {title[:50]}... at ₹{price}")
-                        logger.info(f"🔗 [SHOPSY] ⚠️ VERIFY: Click URL leads to: {product_url}")
-                    else:
-                        logger.warning(f"❌ [SHOPSY] Skipped product #{idx}: title='{title}', price={price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [SHOPSY] Error parsing product #{idx}: {e}")
-                    continue
-                    
+            logger.info(f"🔍 [{spec.tag}] Starting scrape for: {query}")
+            search_url = spec.search_url_for(query)
+            logger.info(f"🌐 [{spec.tag}] URL: {search_url}")
+
+            self._selenium_get(driver, search_url)
+
+            # Wait for product cards to render instead of sleeping a fixed time
+            self._wait_for_products(driver, spec.platform, spec.ready)
+
+            markup = driver.page_source
+            if not self._blocked_page(markup[:BLOCK_SNIFF_BYTES].encode('utf-8', errors='replace'), spec.tag):
+                self._parse_page('_parse_listing', key, FetchedPage.from_markup(search_url, markup), query)
         except Exception as e:
-            logger.error(f"Error scraping Shopsy: {e}")
+            logger.error(f"❌ [{spec.tag}] Error: {e}")
+    
+    def _get_category_base_price(self, query):
+        """Get realistic base price for Indian market based on product category"""
+        query_lower = query.lower()
+        
+        # Electronics
+        if any(word in query_lower for word in ['iphone', 'samsung', 'phone', 'mobile', 'smartphone']):
+            return random.randint(15000, 80000)
+        elif any(word in query_lower for word in ['laptop', 'computer', 'macbook', 'omen', 'pavilion', 'inspiron', 'thinkpad', 'ideapad', 'vivobook', 'gaming laptop', 'i7', 'i5', 'i3', 'ryzen']):
+            # Gaming laptops and high-end models
+            if any(word in query_lower for word in ['omen', 'gaming', 'i7', 'rtx', 'gtx', 'legion', 'rog']):
+                return random.randint(60000, 150000)
+            # Regular laptops
+            else:
+                return random.randint(25000, 100000)
+        elif any(word in query_lower for word in ['headphone', 'earphone', 'speaker', 'audio']):
+            return random.randint(1500, 15000)
+        elif any(word in query_lower for word in ['tv', 'television', 'monitor']):
+            return random.randint(20000, 75000)
         
-        self.add_random_delay()
+        # Default for general products
+        return random.randint(500, 10000)
+    
+    def scrape_snapdeal(self, query):
+        """Scrape Snapdeal - Indian e-commerce platform"""
+        self._scrape_listing('scrape_snapdeal', query)
+
+    def scrape_naaptol(self, query):
+        """Scrape Naaptol - accessible e-commerce site with minimal anti-bot protection"""
+        self._scrape_listing('scrape_naaptol', query)
+
+    def scrape_shopsy(self, query):
+        """Scrape Shopsy - Flipkart's social commerce platform with minimal protection"""
+        self._scrape_listing('scrape_shopsy', query)
 
     def scrape_amazon(self, query):
         """Scrape Amazon India with optimized headers for image extraction"""
-        logger.info(f"🔍 [AMAZON] Starting scrape for: {query}")
-        
-        # Use mobile User-Agent that works better with Amazon (less blocking)
-        mobile_headers = {
-            'User-Agent': 'Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        search_url = f"https://www.amazon.in/s?k={quote_plus(query)}&ref=sr_pg_1"
-        logger.info(f"🌐 [AMAZON] Search URL: {search_url}")
-        
+        # Mobile User-Agent that works better with Amazon (less blocking), see platform_selectors.json
+        spec = platform_selectors('scrape_amazon')
         try:
-            response = self.session.get(search_url, headers=mobile_headers, timeout=10)
-            logger.info(f"✅ [AMAZON] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Amazon product selectors
-                product_selectors = [
-                    '[data-component-type="s-search-result"]',
-                    '.s-result-item',
-                    '[data-asin]'
-                ]
-                
-                products = []
-                for selector in product_selectors:
-                    products = soup.select(selector)
-                    if len(products) > 0:
-                        break
-                
-                logger.info(f"🎯 [AMAZON] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):  # Limit to 5 products
-                    try:
-                        logger.info(f"📦 [AMAZON] Processing product #{idx}")
-                        
-                        # Extract title - improved selectors
-                        title = None
-                        title_selectors = [
-                            'h2 a span',  # Main title in link
-                            '.a-size-medium span',  # Medium size title
-                            '[data-cy="title-recipe-title"]',  # Recipe title
-                            'h2 span',  # Direct h2 span
-                            '.s-title-instructions-style span',  # Instructions style
-                            '.a-text-normal',  # Normal text style
-                            '[data-index] h2 a span'  # Indexed results
-                        ]
-                        
-                        for selector in title_selectors:
-                            try:
-                                title_elem = product.select_one(selector)
-                                if title_elem:
-                                    potential_title = title_elem.get_text(strip=True)
-                                    # Skip generic sponsored/ad titles
-                                    if potential_title and potential_title.lower() not in ['sponsored', 'advertisement', 'ad', '']:
-                                        title = potential_title
-                                        break
-                            except:
-                                continue
-                        
-                        logger.info(f"📝 [AMAZON] Title extracted: '{title}'")
-                        
-                        # Extract price
-                        price = None
-                        price_selectors = [
-                            '.a-price-whole',
-                            '.a-price .a-offscreen',
-                            '.a-price-symbol + .a-price-whole',
-                            '[aria-label*="price"] .a-price-whole'
-                        ]
-                        
-                        for price_selector in price_selectors:
-                            price_elem = product.select_one(price_selector)
-                            if price_elem:
-                                price_text = price_elem.get_text(strip=True)
-                                price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                                if price_match:
-                                    price = int(price_match.group().replace(',', ''))
-                                    logger.info(f"💵 [AMAZON] Final price: ₹{price}")
-                                    break
-                        
-                        # Extract URL
-                        link_elem = product.select_one('h2 a, .a-link-normal')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.amazon.in', href)
-                            logger.info(f"🔗 [AMAZON] Product URL: {product_url}")
-                        
-                        # Extract image (robust) - Amazon uses various image loading strategies
-                        image_url = None
-                        
-                        # Method 1: Check for data-mlt-img-url attribute (Amazon stores thumbnail here)
-                        mlt_elem = product.select_one('[data-mlt-img-url]')
-                        if mlt_elem:
-                            mlt_img = mlt_elem.get('data-mlt-img-url')
-                            if mlt_img and 'media-amazon' in mlt_img and '/I/' in mlt_img:
-                                # Upgrade thumbnail to larger image
-                                image_url = re.sub(r'\._[A-Z]{2}\d+[,_]\d+_', '._AC_SL500_', mlt_img)
-                                if image_url == mlt_img:  # If no replacement, try different pattern
-                                    image_url = re.sub(r'\._[A-Z]+\d+[,_]?\d*_?', '._AC_SL500_', mlt_img)
-                        
-                        # Method 2: Check img elements if method 1 didn't work
-                        if not image_url:
-                            img_elem = product.select_one('img.s-image, img.a-dynamic-image, img[data-image-latency], img')
-                            if img_elem:
-                                # Priority order for Amazon images:
-                                # 1. srcset contains high-res images (parse the largest one)
-                                # 2. data-src for lazy-loaded images
-                                # 3. src if it's not a data URI or placeholder
-                                
-                                # Try srcset first (contains multiple resolutions)
-                                srcset = img_elem.get('srcset')
-                                if srcset:
-                                    # Parse srcset to get the highest resolution image
-                                    srcset_parts = srcset.split(',')
-                                    best_url = None
-                                    best_size = 0
-                                    for part in srcset_parts:
-                                        part = part.strip()
-                                        if ' ' in part:
-                                            url_part, size_part = part.rsplit(' ', 1)
-                                            url_part = url_part.strip()
-                                            size_match = re.search(r'(\d+)', size_part)
-                                            if size_match:
-                                                size = int(size_match.group(1))
-                                                # Skip SVG placeholders and only accept JPG/PNG images
-                                                if size > best_size and url_part.startswith('http') and not url_part.endswith('.svg'):
-                                                    # Must be an actual product image
-                                                    if 'media-amazon' in url_part and '/I/' in url_part:
-                                                        best_size = size
-                                                        best_url = url_part
-                                        elif part.startswith('http') and not part.endswith('.svg'):
-                                            if not best_url and 'media-amazon' in part and '/I/' in part:
-                                                best_url = part
-                                    if best_url:
-                                        image_url = best_url
-                                
-                                # If no srcset, try other attributes
-                                if not image_url:
-                                    for attr in ['data-src', 'data-image-src', 'data-lazy', 'data-original', 'data-old-hires', 'src']:
-                                        potential_url = img_elem.get(attr)
-                                        if potential_url:
-                                            # Skip data URIs, placeholder images, SVGs, and grey-pixel
-                                            if potential_url.startswith('data:'):
-                                                continue
-                                            if potential_url.endswith('.svg') or potential_url.endswith('.gif'):
-                                                continue
-                                            if 'grey-pixel' in potential_url or 'placeholder' in potential_url.lower():
-                                                continue
-                                            if 'sprite' in potential_url.lower() or 'transparent' in potential_url.lower():
-                                                continue
-                                            # Only accept actual Amazon product images
-                                            if 'media-amazon' in potential_url and '/I/' in potential_url:
-                                                image_url = potential_url
-                                                break
-                        
-                        # Fallback: Search for image URLs in the entire product HTML
-                        if not image_url:
-                            product_html = str(product)
-                            # Look for Amazon CDN image URLs with product image pattern
-                            img_pattern = r'https://m\.media-amazon\.com/images/I/[A-Za-z0-9_\-]+\.(jpg|jpeg|png|webp)'
-                            for url_match in re.finditer(img_pattern, product_html):
-                                potential_img = url_match.group()
-                                # Found a valid product image
-                                image_url = potential_img
-                                break
-                        
-                        # Second fallback: Try to construct image URL from ASIN
-                        if not image_url:
-                            asin = product.get('data-asin')
-                            if asin and product_url:
-                                # Extract ASIN from URL if not in data attribute
-                                if not asin:
-                                    asin_match = re.search(r'/dp/([A-Z0-9]{10})', product_url)
-                                    if asin_match:
-                                        asin = asin_match.group(1)
-                        
-                        # Convert relative URLs to absolute
-                        if image_url and image_url.startswith('/'):
-                            image_url = urljoin('https://www.amazon.in', image_url)
-                        
-                        # Upgrade Amazon image quality by modifying URL parameters
-                        if image_url and 'amazon' in image_url.lower():
-                            # Amazon images can be resized by changing URL parameters
-                            # Replace small sizes with larger ones (500px)
-                            image_url = re.sub(r'\._[A-Z]{2}\d+[A-Z_]*_', '._AC_SL500_', image_url)
-                            image_url = re.sub(r'\._[A-Z]{2}_[A-Z]{2}\d+[A-Z_]*_', '._AC_SL500_', image_url)
-                                
-                        logger.info(f"🖼️ [AMAZON] Image URL for product #{idx}: {image_url if image_url else 'Not found'}")
-                        
-                        if title and price:
-                            # Filter out accessories
-                            title_lower = title.lower()
-                            is_accessory = any(word in title_lower for word in [
-                                'cover', 'case', 'protector', 'screen guard', 'charger', 
-                                'cable', 'headphone', 'earphone', 'stand', 'holder',
-                                'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
-                                'power bank', 'tempered glass', 'lens', 'clip', 'ring'
-                            ])
-                            
-                            if is_accessory:
-                                logger.info(f"🚫 [AMAZON] Filtered out accessory: {title[:50]}... at ₹{price}")
-                                continue
-                            
-                            result_data = {
-                                'platform': 'Amazon',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            }
-                            self.results.append(result_data)
-                            logger.info(f"✅ [AMAZON] Added main product: {title[:50]}... at ₹{price}")
-                        else:
-                            logger.warning(f"❌ [AMAZON] Skipped product #{idx}: title='{title}', price={price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [AMAZON] Error parsing product #{idx}: {e}")
-                        continue
-                        
-            else:
-                logger.warning(f"⚠️ [AMAZON] Non-200 response: {response.status_code}")
-                
+            page = self._listing_page(spec, query)
+            if page is not None:
+                self._parse_page('_parse_amazon', 'scrape_amazon', page, query)
         except Exception as e:
             logger.error(f"Error scraping Amazon: {e}")
-        
-        self.add_random_delay()
+
+    def _parse_amazon(self, key, page, query):
+        """Results of a fetched Amazon search page (no network)"""
+        spec = platform_selectors(key)
+        soup = self._listing_soup(spec, page, query)
+        if soup is not None:
+            # Fast path: search result cards keyed by ASIN, each read in one pass;
+            # the registry selectors cover layouts without them
+            if not self._add_amazon_cards(spec, soup, query):
+                self._extract_listing(spec, soup, query, extractors={'image': self._amazon_image})
+
+    def _add_amazon_cards(self, spec, soup, query):
+        """Add the ASIN-keyed search result cards of a page; False when it has none"""
+        products = []
+        seen_asins = set()
+        for card in soup.select(AMAZON_CARD_SELECTOR):
+            product = amazon_card_product(card)
+            if product is None or product['pid'] in seen_asins:
+                continue
+            seen_asins.add(product['pid'])
+            products.append(product)
+            if len(products) >= spec.limit:
+                break
+        if not products:
+            return False
+
+        self._selector_matched('containers', AMAZON_CARD_SELECTOR)
+        logger.info(f"🎯 [AMAZON] Found {len(products)} ASIN-keyed search results")
+        self._add_listing_results(spec, query, [{
+            'platform': 'Amazon',
+            'title': product['title'][:100],
+            'price': product['price'],
+            'original_price': product['mrp'],
+            'pid': product['pid'],
+            'url': product['url'],
+            'image': product['image'],
+            'currency': 'INR',
+            'availability': spec.availability
+        } for product in products])
+        return True
+
+    def _amazon_image(self, product):
+        """Product image of an Amazon search result card - Amazon uses various image loading strategies"""
+        image_url = None
+
+        # Method 1: Check for data-mlt-img-url attribute (Amazon stores thumbnail here)
+        mlt_elem = product.select_one('[data-mlt-img-url]')
+        if mlt_elem:
+            mlt_img = mlt_elem.get('data-mlt-img-url')
+            if mlt_img and 'media-amazon' in mlt_img and '/I/' in mlt_img:
+                # Upgrade thumbnail to larger image
+                image_url = re.sub(r'\._[A-Z]{2}\d+[,_]\d+_', '._AC_SL500_', mlt_img)
+                if image_url == mlt_img:  # If no replacement, try different pattern
+                    image_url = re.sub(r'\._[A-Z]+\d+[,_]?\d*_?', '._AC_SL500_', mlt_img)
+
+        # Method 2: Check img elements if method 1 didn't work
+        if not image_url:
+            img_elem = product.select_one('img.s-image, img.a-dynamic-image, img[data-image-latency], img')
+            if img_elem:
+                # Priority order for Amazon images:
+                # 1. srcset contains high-res images (parse the largest one)
+                # 2. data-src for lazy-loaded images
+                # 3. src if it's not a data URI or placeholder
+
+                # Try srcset first (contains multiple resolutions)
+                image_url = best_srcset_url(img_elem.get('srcset'))
+
+                # If no srcset, try other attributes
+                if not image_url:
+                    for attr in ['data-src', 'data-image-src', 'data-lazy', 'data-original', 'data-old-hires', 'src']:
+                        potential_url = img_elem.get(attr)
+                        if potential_url:
+                            # Skip data URIs, placeholder images, SVGs, and grey-pixel
+                            if potential_url.startswith('data:'):
+                                continue
+                            if potential_url.endswith('.svg') or potential_url.endswith('.gif'):
+                                continue
+                            if 'grey-pixel' in potential_url or 'placeholder' in potential_url.lower():
+                                continue
+                            if 'sprite' in potential_url.lower() or 'transparent' in potential_url.lower():
+                                continue
+                            # Only accept actual Amazon product images
+                            if 'media-amazon' in potential_url and '/I/' in potential_url:
+                                image_url = potential_url
+                                break
+
+        # Fallback: any product image URL on any img of the card (attributes only,
+        # the card's markup is never re-serialized)
+        if not image_url:
+            for img_elem in product.find_all('img'):
+                image_url = best_srcset_url(img_elem.get('srcset')) or next(
+                    (value for value in img_elem.attrs.values()
+                     if isinstance(value, str) and is_amazon_product_image(value)), None)
+                if image_url:
+                    break
+
+        # Convert relative URLs to absolute
+        if image_url and image_url.startswith('/'):
+            image_url = urljoin('https://www.amazon.in', image_url)
+
+        return upscale_amazon_image(image_url)
 
     def scrape_flipkart(self, query):
         """Scrape Flipkart with mobile headers"""
         logger.info(f"🔍 [FLIPKART] Starting scrape for: {query}")
+        spec = platform_selectors('scrape_flipkart')
         
         # Mobile headers for Flipkart
-        mobile_headers = {
-            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-        }
+        mobile_headers = spec.headers
         
-        search_url = f"https://www.flipkart.com/search?q={quote_plus(query)}"
+        search_url = spec.search_url_for(query)
         logger.info(f"🌐 [FLIPKART] Search URL: {search_url}")
         
         try:
-            response = self.session.get(search_url, headers=mobile_headers, timeout=10)
+            response = self._get(search_url, headers=mobile_headers, timeout=spec.timeout, stream=True,
+                                 endpoint=(spec.platform, SEARCH_PAGE))
             logger.info(f"✅ [FLIPKART] Response status: {response.status_code}")
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Fast path: every product with its price is embedded in the page state,
+                # so neither HTML parsing nor product page visits are needed, nor the
+                # markup after the state script
+                page, stream = self._read_page(response, MarkerWatcher(INITIAL_STATE_MARKER), 'FLIPKART')
+                if page is None or self._parse_page('_parse_flipkart_state', 'scrape_flipkart', page, query):
+                    stream.close()
+                    return
+                logger.info("🔄 [FLIPKART] No products in __INITIAL_STATE__, falling back to HTML parsing")
+                if not stream.complete:
+                    page, _ = self._read_page(response, tag='FLIPKART', stream=stream)
+                
+                soup = self._response_soup(page)
+                # Text, script, link and class views of the search page, each built once
+                # and shared by every strategy and product below
+                page = PageContext(soup)
                 
                 # Debug: Check if page is loading properly
-                if "flipkart" not in soup.get_text().lower():
+                if "flipkart" not in page.text_lower:
                     logger.warning("⚠️ [FLIPKART] Page might not be loading properly - no flipkart text found")
                 
                 # Try to find product links first - more reliable approach
-                product_links = soup.find_all('a', href=True)
                 product_urls = []
-                for link in product_links:
+                for link in page.links:
                     href = link.get('href', '')
                     # Updated Flipkart product patterns
                     if ('/p/' in href) or ('pid=' in href) or ('/dp/' in href):
@@ -741,32 +1706,27 @@ class ProductScraper:
                     logger.info(f"🎯 [FLIPKART] Found {len(product_urls)} product links using href pattern")
                     products = product_urls
                 else:
-                    # Fallback: try standard selectors
-                    product_selectors = [
-                        '[data-id]',  # Main product containers
-                        '._1AtVbE',   # Product cards
-                        '._2kHMtA',   # Individual items
-                        '._13oc-S',   # Search results
-                        '[data-tkid]', # Tracking ID items
-                        '._2-gKeQ',   # Alternative containers
-                        '._1fQZEK',   # Product tiles
-                        '.cPHDOP'     # Newer containers
-                    ]
-                    
-                    products = []
-                    for selector in product_selectors:
-                        products = soup.select(selector)
-                        if len(products) > 0:
-                            logger.info(f"🎯 [FLIPKART] Found {len(products)} products with selector: {selector}")
-                            break
-                    
-                    # If still no products found, try broader search
-                    if len(products) == 0:
-                        logger.warning("⚠️ [FLIPKART] No products found with standard selectors, trying broader search")
-                        products = soup.select('div[data-id], div[class*="_"], a[href*="/p/"]')[:10]
+                    # Fallback: the registry's container selectors, the last one a broad search
+                    products, selector = spec.find_containers(soup)
+                    if selector:
+                        self._selector_matched('containers', selector)
+                        logger.info(f"🎯 [FLIPKART] Found {len(products)} products with selector: {selector}")
                 
                 logger.info(f"🎯 [FLIPKART] Found {len(products)} product containers")
                 
+                # Fetch the product pages of link-based results concurrently up front
+                detail_urls = [urljoin('https://www.flipkart.com', product.get('href'))
+                               for product in products[:5]
+                               if getattr(product, 'name', None) == 'a' and product.get('href')]
+                product_pages = self._fetch_all(detail_urls, headers=mobile_headers, timeout=8,
+                                                endpoint=(spec.platform, PRODUCT_PAGE))
+                # Parsed product pages by URL, so the glitch fallback does not parse a page again
+                product_contexts = {}
+                # Page-wide fallback prices (Strategies 1 and 2), the same for every product
+                page_prices = None
+                # Extracted products, accessory-filtered together once the loop is done
+                candidates = []
+                
                 for idx, product in enumerate(products[:5], 1):  # Limit to 5 products
                     try:
                         logger.info(f"📦 [FLIPKART] Processing product #{idx}")
@@ -807,13 +1767,11 @@ class ProductScraper:
                                 parent = product.parent
                                 if parent:
                                     # Try common title selectors in parent
-                                    for selector in ['._4rR01T', '.s1Q9rs', '._2WkVRV', '.IRpwTa']:
-                                        title_elem = parent.select_one(selector)
-                                        if title_elem:
-                                            title = title_elem.get_text(strip=True)
-                                            if title and len(title) > 10:
-                                                logger.info(f"📝 [FLIPKART] Got title from parent with {selector}: '{title}'")
-                                                break
+                                    values, matched = spec.extract(parent, ['link_title'])
+                                    if values['link_title']:
+                                        title = values['link_title']
+                                        self._selector_matched('link_title', matched['link_title'])
+                                        logger.info(f"📝 [FLIPKART] Got title from parent with {matched['link_title']}: '{title}'")
                             
                             # Try nested text elements as last resort
                             if not title or len(title) < 10:
@@ -826,28 +1784,13 @@ class ProductScraper:
                             
                             logger.info(f"📝 [FLIPKART] Final link-based title: '{title}'")
                         else:
-                            # Container-based processing
-                            # Extract title - Updated selectors for 2024/2025
-                            title_selectors = [
-                                '._4rR01T',      # Main title class
-                                '.s1Q9rs',       # Alternative title
-                                '._2WkVRV',      # Product name
-                                '.IRpwTa',       # Item title
-                                'a[title]',      # Link title attribute
-                                '._2B099V',      # Updated title class
-                                '.KzDlHZ',       # Newer title selector
-                                '.wjcEIp'        # Alternative title
-                            ]
-                            
-                            title = None
-                            for title_selector in title_selectors:
-                                title_elem = product.select_one(title_selector)
-                                if title_elem:
-                                    title = title_elem.get_text(strip=True) or title_elem.get('title')
-                                    if title and len(title) > 3:  # Ensure we have meaningful title
-                                        break
+                            # Container-based processing: the registry's title fallbacks
+                            values, matched = spec.extract(product, ['title'])
+                            title = values['title']
+                            if title:
+                                self._selector_matched('title', matched['title'])
                             
-                            logger.info(f"📝 [FLIPKART] Container-based title: '{title}'")
+                            logger.info(f"📝 [FLIPKART] Container-based title: '{title}' (selector: {matched.get('title', 'none')})")
                         
                         # Extract price - Updated selectors
                         price = None
@@ -869,45 +1812,34 @@ class ProductScraper:
                                     product_url = urljoin('https://www.flipkart.com', product_href)
                                     logger.info(f"🔗 [FLIPKART] Visiting individual product page: {product_url[:80]}...")
                                     
-                                    # Fetch individual product page
-                                    product_response = self.session.get(product_url, headers=mobile_headers, timeout=8)
+                                    # Individual product page (prefetched above)
+                                    product_response = self._fetched(product_pages, product_url, headers=mobile_headers, timeout=8,
+                                                                     endpoint=(spec.platform, PRODUCT_PAGE))
                                     if product_response.status_code == 200:
-                                        product_soup = BeautifulSoup(product_response.content, 'html.parser')
+                                        product_page = product_contexts.get(product_url)
+                                        if product_page is None:
+                                            product_page = product_contexts[product_url] = PageContext(
+                                                self._response_soup(product_response))
                                         
                                         # PRIORITY 1: Try to extract price from JavaScript __INITIAL_STATE__ (current Flipkart structure)
-                                        script_tags = product_soup.find_all('script')
                                         js_price_found = False
-                                        
-                                        for script in script_tags:
-                                            script_text = script.get_text()
-                                            if 'window.__INITIAL_STATE__' in script_text:
-                                                logger.info(f"🎯 [FLIPKART] Found __INITIAL_STATE__ script")
-                                                # Look for price patterns in the JavaScript object
-                                                price_matches = re.findall(r'"price":(\d+)', script_text)
-                                                if not price_matches:
-                                                    price_matches = re.findall(r'₹([\d,]+)', script_text)
-                                                
-                                                if price_matches:
-                                                    # Convert all found prices and get the lowest one (current selling price)
-                                                    found_js_prices = []
-                                                    for match in price_matches:
-                                                        try:
-                                                            price_val = int(str(match).replace(',', ''))
-                                                            if 5000 <= price_val <= 50000:  # Reasonable price range
-                                                                found_js_prices.append(price_val)
-                                                        except:
-                                                            continue
-                                                    
-                                                    if found_js_prices:
-                                                        js_price = min(found_js_prices)  # Take lowest price (current price)
-                                                        logger.info(f"✅ [FLIPKART] Found price in JS __INITIAL_STATE__: ₹{js_price}")
-                                                        price_elem = script  # Use script tag as price element
-                                                        js_price_found = True
-                                                        break
+                                        script, script_text = product_page.script_containing('window.__INITIAL_STATE__')
+                                        if script is not None:
+                                            logger.info(f"🎯 [FLIPKART] Found __INITIAL_STATE__ script")
+                                            # Look for price patterns in the JavaScript object (reasonable range only)
+                                            found_js_prices = (find_json_prices(script_text, 5000, 50000)
+                                                               if JSON_PRICE_PATTERN.search(script_text)
+                                                               else find_prices(script_text, 5000, 50000))
+                                            if found_js_prices:
+                                                js_price = min(found_js_prices)  # Take lowest price (current price)
+                                                logger.info(f"✅ [FLIPKART] Found price in JS __INITIAL_STATE__: ₹{js_price}")
+                                                price_elem = script  # Use script tag as price element
+                                                js_price_found = True
                                         
                                         # PRIORITY 2: Try the exact .Nx9bqj.CxhGGd selector (legacy support)
                                         if not js_price_found:
-                                            exact_price_elem = product_soup.select_one('.Nx9bqj.CxhGGd')
+                                            exact_price_elems = product_page.with_classes('Nx9bqj', 'CxhGGd')
+                                            exact_price_elem = exact_price_elems[0] if exact_price_elems else None
                                             if exact_price_elem:
                                                 exact_text = exact_price_elem.get_text(strip=True)
                                                 logger.info(f"✅ [FLIPKART] Found exact .Nx9bqj.CxhGGd selector with text: '{exact_text}'")
@@ -915,7 +1847,7 @@ class ProductScraper:
                                             else:
                                                 logger.info(f"⚠️ [FLIPKART] .Nx9bqj.CxhGGd not found, trying .Nx9bqj fallback")
                                                 # PRIORITY 3: Fallback to general .Nx9bqj selector
-                                                nx9bqj_elements = product_soup.select('.Nx9bqj')
+                                                nx9bqj_elements = product_page.with_classes('Nx9bqj')
                                                 logger.info(f"🔍 [FLIPKART] Found {len(nx9bqj_elements)} .Nx9bqj elements")
                                                 
                                                 for elem in nx9bqj_elements:
@@ -924,9 +1856,9 @@ class ProductScraper:
                                                     logger.info(f"🔍 [FLIPKART] .Nx9bqj element: class='{elem_classes}' text='{elem_text}'")
                                                     
                                                     # Look for price pattern in this element
-                                                    price_match = re.search(r'₹([\d,]+)', elem_text)
-                                                    if price_match:
-                                                        logger.info(f"✅ [FLIPKART] Found price in .Nx9bqj fallback: ₹{price_match.group(1)}")
+                                                    elem_prices = find_prices(elem_text)
+                                                    if elem_prices:
+                                                        logger.info(f"✅ [FLIPKART] Found price in .Nx9bqj fallback: ₹{elem_prices[0]}")
                                                         price_elem = elem  # Mark as found
                                                         break
                                         
@@ -948,10 +1880,8 @@ class ProductScraper:
                                     logger.info(f"🔍 [FLIPKART] Processing price element text: '{price_text}'")
                                     
                                     # Look for price pattern - prioritize the first valid price found
-                                    price_matches = re.findall(r'₹([\d,]+)', price_text)
-                                    if price_matches:
-                                        # Convert all found prices and choose the first one (usually the current price)
-                                        found_prices = [int(match.replace(',', '')) for match in price_matches]
+                                    found_prices = find_prices(price_text)
+                                    if found_prices:
                                         price = found_prices[0]  # Take the first price (current selling price)
                                         
                                         # Show which selector was used and all found prices
@@ -969,36 +1899,22 @@ class ProductScraper:
                                 found_prices = []  # Initialize the variable
                                 price = -1  # Will be displayed as "Technical Glitch Occurred"
                                 
-                                # Strategy 1: Look for any price elements in the broader page context
-                                all_price_elements = soup.select('[class*="price"], [class*="Price"], .Nx9bqj')
-                                for price_elem in all_price_elements:
-                                    price_text = price_elem.get_text(strip=True)
-                                    if '₹' in price_text:
-                                        price_matches = re.findall(r'₹([\d,]+)', price_text)
-                                        for match in price_matches:
-                                            price_val = int(match.replace(',', ''))
-                                            if 1000 <= price_val <= 50000:  # Reasonable price range for electronics
-                                                found_prices.append(price_val)
-                                
-                                # Strategy 2: Look for special/sale price patterns in the broader page
-                                page_text = soup.get_text()
-                                
-                                # Look for special price indicators
-                                special_price_patterns = [
-                                    r'Special\s*Price.*?₹([\d,]+)',
-                                    r'Deal\s*Price.*?₹([\d,]+)',
-                                    r'Sale\s*Price.*?₹([\d,]+)',
-                                    r'Current\s*Price.*?₹([\d,]+)',
-                                    r'₹([\d,]+)\s*₹[\d,]+'  # Current price followed by crossed out price
-                                ]
+                                if page_prices is None:
+                                    # Strategy 1: Look for any price elements in the broader page context,
+                                    # all tokenized in one pass (reasonable price range for electronics)
+                                    all_price_elements = page.class_contains('price', 'Price', also=('Nx9bqj',))
+                                    element_prices = find_prices_batch(
+                                        [price_elem.get_text(strip=True) for price_elem in all_price_elements], 1000, 50000)
+                                    
+                                    # Strategy 2: Look for special/sale price patterns in the broader page:
+                                    # "Special/Deal/Sale/Current Price ₹X" or ₹X next to the crossed out price
+                                    page_prices = (element_prices, selling_prices(page.text, 1000, 50000))
                                 
-                                for pattern in special_price_patterns:
-                                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                                    for match in matches:
-                                        price_val = int(match.replace(',', ''))
-                                        if 1000 <= price_val <= 50000:
-                                            found_prices.append(price_val)
-                                            logger.info(f"� [FLIPKART] Found special price pattern: ₹{price_val}")
+                                element_prices, special_prices = page_prices
+                                found_prices.extend(element_prices)
+                                for price_val in special_prices:
+                                    found_prices.append(price_val)
+                                    logger.info(f"💰 [FLIPKART] Found special price pattern: ₹{price_val}")
                                 
                                 # Strategy 3: Get product link and try to fetch individual page (limited attempt)
                                 product_href = product.get('href', '')
@@ -1007,44 +1923,38 @@ class ProductScraper:
                                         product_url = urljoin('https://www.flipkart.com', product_href)
                                         logger.info(f"🔗 [FLIPKART] Attempting individual product page: {product_url[:80]}...")
                                         
-                                        # Quick fetch of product page
-                                        product_response = self.session.get(product_url, timeout=5)
+                                        # Reuse the prefetched product page
+                                        product_response = self._fetched(product_pages, product_url, timeout=5,
+                                                                         endpoint=(spec.platform, PRODUCT_PAGE))
                                         if product_response.status_code == 200:
-                                            product_soup = BeautifulSoup(product_response.content, 'html.parser')
+                                            product_page = product_contexts.get(product_url)
+                                            if product_page is None:
+                                                product_page = product_contexts[product_url] = PageContext(
+                                                    self._response_soup(product_response))
                                             
                                             # PRIORITY 1: Try JavaScript __INITIAL_STATE__ extraction (current Flipkart)
-                                            script_tags = product_soup.find_all('script')
-                                            for script in script_tags:
-                                                script_text = script.get_text()
-                                                if 'window.__INITIAL_STATE__' in script_text:
-                                                    logger.info(f"🎯 [FLIPKART] Processing __INITIAL_STATE__ for price extraction")
-                                                    # Look for price patterns in the JavaScript object
-                                                    js_price_matches = re.findall(r'"price":(\d+)', script_text)
-                                                    if not js_price_matches:
-                                                        js_price_matches = re.findall(r'₹([\d,]+)', script_text)
-                                                    
-                                                    if js_price_matches:
-                                                        for match in js_price_matches:
-                                                            try:
-                                                                price_val = int(str(match).replace(',', ''))
-                                                                if 5000 <= price_val <= 50000:
-                                                                    found_prices.insert(0, price_val)  # Insert at beginning for priority
-                                                                    logger.info(f"✅ [FLIPKART] PRIORITY: Found JS price: ₹{price_val}")
-                                                            except:
-                                                                continue
-                                                    break
+                                            script, script_text = product_page.script_containing('window.__INITIAL_STATE__')
+                                            if script is not None:
+                                                logger.info(f"🎯 [FLIPKART] Processing __INITIAL_STATE__ for price extraction")
+                                                # Look for price patterns in the JavaScript object
+                                                js_prices = (find_json_prices(script_text, 5000, 50000)
+                                                             if JSON_PRICE_PATTERN.search(script_text)
+                                                             else find_prices(script_text, 5000, 50000))
+                                                for price_val in js_prices:
+                                                    found_prices.insert(0, price_val)  # Insert at beginning for priority
+                                                    logger.info(f"✅ [FLIPKART] PRIORITY: Found JS price: ₹{price_val}")
                                             
                                             # PRIORITY 2: Try the specific .Nx9bqj.CxhGGd selector (legacy support)
                                             if not found_prices:
-                                                current_price_elem = product_soup.select_one('.Nx9bqj.CxhGGd')
+                                                current_price_elems = product_page.with_classes('Nx9bqj', 'CxhGGd')
+                                                current_price_elem = current_price_elems[0] if current_price_elems else None
                                                 if current_price_elem:
                                                     price_text = current_price_elem.get_text(strip=True)
                                                     logger.info(f"🎯 [FLIPKART] .Nx9bqj.CxhGGd element text: '{price_text}'")
                                                     
                                                     # Get the first price from this element (current selling price)
-                                                    price_matches = re.findall(r'₹([\d,]+)', price_text)
-                                                    if price_matches:
-                                                        price_val = int(price_matches[0].replace(',', ''))  # First price = current price
+                                                    price_val = parse_price(price_text)
+                                                    if price_val:
                                                         if 1000 <= price_val <= 50000:
                                                             found_prices.insert(0, price_val)  # Insert at beginning for priority
                                                             logger.info(f"✅ [FLIPKART] PRIORITY: Found current price with .Nx9bqj.CxhGGd: ₹{price_val}")
@@ -1052,23 +1962,18 @@ class ProductScraper:
                                                 # PRIORITY 3: Only if .Nx9bqj.CxhGGd didn't yield valid price, try general .Nx9bqj
                                                 if not found_prices:
                                                     logger.info(f"🔄 [FLIPKART] No valid price from .Nx9bqj.CxhGGd, trying .Nx9bqj fallback")
-                                                    general_price_elems = product_soup.select('.Nx9bqj')
+                                                    general_price_elems = product_page.with_classes('Nx9bqj')
                                                     for elem in general_price_elems:
                                                         price_text = elem.get_text(strip=True)
-                                                        price_matches = re.findall(r'₹([\d,]+)', price_text)
-                                                        if price_matches:
-                                                            price_val = int(price_matches[0].replace(',', ''))  # First price
+                                                        elem_prices = find_prices(price_text)
+                                                        if elem_prices:
+                                                            price_val = elem_prices[0]  # First price
                                                             if 1000 <= price_val <= 50000:
                                                                 found_prices.append(price_val)
                                                                 logger.info(f"💰 [FLIPKART] Found fallback price with .Nx9bqj: ₹{price_val}")
                                             
                                             # Fallback to general text search on product page
-                                            product_page_text = product_soup.get_text()
-                                            product_prices = re.findall(r'₹([\d,]+)', product_page_text)
-                                            for p in product_prices:
-                                                price_val = int(p.replace(',', ''))
-                                                if 1000 <= price_val <= 50000:
-                                                    found_prices.append(price_val)
+                                            found_prices.extend(find_prices(product_page.text, 1000, 50000))
                                             
                                             logger.info(f"🏷️ [FLIPKART] Product page prices: {sorted(set(found_prices))}")
                                     except Exception as e:
@@ -1099,20 +2004,18 @@ class ProductScraper:
                                     parent_container = product.parent
                                     if parent_container:
                                         container_text = parent_container.get_text()
-                                        all_prices = re.findall(r'₹([\d,]+)', container_text)
-                                        if all_prices:
-                                            price_values = [int(p.replace(',', '')) for p in all_prices if 1000 <= int(p.replace(',', '')) <= 50000]
-                                            if price_values:
-                                                price_values.sort()
-                                                price = price_values[0]  # Take lowest reasonable price
-                                                logger.info(f"💵 [FLIPKART] Link-based price (container fallback): ₹{price} from {price_values}")
+                                        price_values = find_prices(container_text, 1000, 50000)
+                                        if price_values:
+                                            price_values.sort()
+                                            price = price_values[0]  # Take lowest reasonable price
+                                            logger.info(f"💵 [FLIPKART] Link-based price (container fallback): ₹{price} from {price_values}")
                             
                             if not price:
                                 # Last resort: search for any price pattern near the product
                                 nearby_text = parent.get_text() if parent else ""
-                                price_match = re.search(r'₹([\d,]+)', nearby_text)
-                                if price_match:
-                                    price = int(price_match.group(1).replace(',', ''))
+                                nearby_prices = find_prices(nearby_text)
+                                if nearby_prices:
+                                    price = nearby_prices[0]
                                     logger.info(f"💵 [FLIPKART] Link-based price (text search): ₹{price}")
                                 else:
                                     # Set a placeholder for direct links
@@ -1131,9 +2034,9 @@ class ProductScraper:
                                 logger.info(f"🔍 [FLIPKART] .Nx9bqj.CxhGGd element text: '{elem_text}' with classes: '{elem_classes}'")
                                 
                                 # Look for price pattern
-                                price_match = re.search(r'₹([\d,]+)', elem_text)
-                                if price_match:
-                                    price = int(price_match.group(1).replace(',', ''))
+                                elem_prices = find_prices(elem_text)
+                                if elem_prices:
+                                    price = elem_prices[0]
                                     logger.info(f"✅ [FLIPKART] Found EXACT price with .Nx9bqj.CxhGGd: ₹{price}")
                                     price_found = True
                                     break
@@ -1154,9 +2057,9 @@ class ProductScraper:
                                         continue
                                     
                                     # Look for price pattern
-                                    price_match = re.search(r'₹([\d,]+)', elem_text)
-                                    if price_match:
-                                        price = int(price_match.group(1).replace(',', ''))
+                                    elem_prices = find_prices(elem_text)
+                                    if elem_prices:
+                                        price = elem_prices[0]
                                         logger.info(f"💵 [FLIPKART] Found fallback price with .Nx9bqj: ₹{price}")
                                         price_found = True
                                         break
@@ -1187,20 +2090,6 @@ class ProductScraper:
                         logger.info(f"🖼️ [FLIPKART] Image URL: {image_url or 'Not found'}")
                         
                         if title and (price or price == -1):  # Include technical glitch case
-                            # Filter out accessories (but not for technical glitch)
-                            if price != -1:
-                                title_lower = title.lower()
-                                is_accessory = any(word in title_lower for word in [
-                                    'cover', 'case', 'protector', 'screen guard', 'charger', 
-                                    'cable', 'headphone', 'earphone', 'stand', 'holder',
-                                    'selfie stick', 'tripod', 'mount', 'adapter', 'battery',
-                                    'power bank', 'tempered glass', 'lens', 'clip', 'ring'
-                                ])
-                                
-                                if is_accessory:
-                                    logger.info(f"🚫 [FLIPKART] Filtered out accessory: {title[:50]}... at ₹{price}")
-                                    continue
-                            
                             # Handle technical glitch case
                             display_price = "Technical Glitch Occurred" if price == -1 else price
                             price_for_data = 0 if price == -1 else price  # 0 for JSON serialization
@@ -1215,905 +2104,222 @@ class ProductScraper:
                                 'currency': 'INR',
                                 'availability': 'In Stock' if price != -1 else 'Technical Issue'
                             }
-                            self.results.append(result_data)
-                            logger.info(f"✅ [FLIPKART] Added product: {title[:50]}... - {display_price}")
+                            candidates.append(result_data)
                         else:
                             logger.warning(f"❌ [FLIPKART] Skipped product #{idx}: title='{title}', price={price}")
                             
                     except Exception as e:
                         logger.error(f"❌ [FLIPKART] Error parsing product #{idx}: {e}")
                         continue
+                
+                # Filter out accessories, all titles in one pass (but not for technical glitch)
+                accessories = accessory_filter(query).matches([result['title'] for result in candidates])
+                for result_data, accessory in zip(candidates, accessories):
+                    if accessory and result_data['price']:
+                        logger.info(f"🚫 [FLIPKART] Filtered out accessory ({accessory}): {result_data['title'][:50]}... at ₹{result_data['price']}")
+                        continue
+                    self.results.append(result_data)
+                    logger.info(f"✅ [FLIPKART] Added product: {result_data['title'][:50]}... - {result_data['display_price']}")
                         
             else:
+                response.close()
                 logger.warning(f"⚠️ [FLIPKART] Non-200 response: {response.status_code}")
                 
         except Exception as e:
             logger.error(f"Error scraping Flipkart: {e}")
-        
-        self.add_random_delay()
+
+    def _parse_flipkart_state(self, key, page, query):
+        """Add the products of a Flipkart search page's __INITIAL_STATE__ (no network); True when it had any"""
+        state_products = flipkart_products_from_state(extract_initial_state(self._response_html(page, start=INITIAL_STATE_MARKER)))
+        if not state_products:
+            return False
+        logger.info(f"🎯 [FLIPKART] Found {len(state_products)} products in __INITIAL_STATE__")
+        self._add_flipkart_state_products(state_products, query)
+        return True
+
+    def _add_flipkart_state_products(self, products, query, limit=5):
+        """Add products decoded from Flipkart's __INITIAL_STATE__, skipping accessories"""
+        added = 0
+        accessories = accessory_filter(query).matches([product['title'] for product in products])
+        for product, accessory in zip(products, accessories):
+            if accessory:
+                logger.info(f"🚫 [FLIPKART] Filtered out accessory ({accessory}): {product['title'][:50]}... at ₹{product['price']}")
+                continue
+            
+            self.results.append({
+                'platform': 'Flipkart',
+                'title': product['title'][:100],
+                'price': product['price'],
+                'original_price': product['mrp'],
+                'pid': product['pid'],
+                'url': product['url'],
+                'image': product['image'],
+                'currency': 'INR',
+                'availability': 'In Stock'
+            })
+            logger.info(f"✅ [FLIPKART] Added product from page state: {product['title'][:50]}... - ₹{product['price']}")
+            added += 1
+            if added >= limit:
+                break
 
     # ==================== GENERAL MARKETPLACES ====================
 
     def scrape_meesho(self, query):
         """Scrape Meesho - Social commerce platform with affordable products"""
-        try:
-            logger.info(f"🔍 [MEESHO] Starting scrape for: {query}")
-            
-            # Meesho uses a mobile-first approach
-            mobile_headers = {
-                'User-Agent': 'Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-            }
-            
-            search_url = f"https://www.meesho.com/search?q={quote_plus(query)}"
-            logger.info(f"🌐 [MEESHO] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=mobile_headers, timeout=15)
-            logger.info(f"✅ [MEESHO] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Meesho product card selectors
-                products = soup.select('[data-testid="product-card"], .ProductCard, .sc-dkzDqf')[:5]
-                logger.info(f"🎯 [MEESHO] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [MEESHO] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('p[class*="Text"], .ProductTitle, h5, p')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        logger.info(f"📝 [MEESHO] Title: {title}")
-                        
-                        # Extract price
-                        price_elem = product.select_one('h5[class*="Text"], .ProductPrice, span[class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        logger.info(f"💵 [MEESHO] Price: ₹{price}")
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.meesho.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'Meesho',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [MEESHO] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [MEESHO] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping Meesho: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_meesho', query)
 
     def scrape_jiomart(self, query):
         """Scrape JioMart - Reliance's e-commerce platform"""
-        try:
-            logger.info(f"🔍 [JIOMART] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-            }
-            
-            search_url = f"https://www.jiomart.com/search/{quote_plus(query)}"
-            logger.info(f"🌐 [JIOMART] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [JIOMART] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # JioMart product selectors
-                products = soup.select('.plp-card-wrapper, .product-card, [data-qa="product"]')[:5]
-                logger.info(f"🎯 [JIOMART] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [JIOMART] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('.plp-card-details-name, .product-title, h3, span[class*="name"]')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.plp-card-details-price, .product-price, span[class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.jiomart.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'JioMart',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [JIOMART] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [JIOMART] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping JioMart: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_jiomart', query)
 
     def scrape_indiamart(self, query):
         """Scrape IndiaMART - B2B marketplace"""
-        try:
-            logger.info(f"🔍 [INDIAMART] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            search_url = f"https://dir.indiamart.com/search.mp?ss={quote_plus(query)}"
-            logger.info(f"🌐 [INDIAMART] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [INDIAMART] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # IndiaMART product selectors
-                products = soup.select('.prd-card, .card, [class*="product"]')[:5]
-                logger.info(f"🎯 [INDIAMART] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [INDIAMART] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('.prd-name, .product-name, h2, h3')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        # Extract price (IndiaMART often shows price range)
-                        price_elem = product.select_one('.prc, .price, span[class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            # Get the first price if it's a range
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            if href.startswith('http'):
-                                product_url = href
-                            else:
-                                product_url = urljoin('https://www.indiamart.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'IndiaMART',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'Available'
-                            })
-                            logger.info(f"✅ [INDIAMART] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [INDIAMART] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping IndiaMART: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_indiamart', query)
 
     # ==================== SPECIALIZED E-COMMERCE ====================
 
     def scrape_myntra(self, query):
         """Scrape Myntra - Fashion e-commerce platform"""
+        spec = platform_selectors('scrape_myntra')
         try:
-            logger.info(f"🔍 [MYNTRA] Starting scrape for: {query}")
-            
-            # Myntra requires mobile headers
-            mobile_headers = {
-                'User-Agent': 'Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-            }
-            
-            search_url = f"https://www.myntra.com/{quote_plus(query.replace(' ', '-'))}"
-            logger.info(f"🌐 [MYNTRA] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=mobile_headers, timeout=15)
-            logger.info(f"✅ [MYNTRA] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Myntra product selectors
-                products = soup.select('.product-base, .product-productMetaInfo, [class*="product-sliderContainer"]')[:5]
-                logger.info(f"🎯 [MYNTRA] Found {len(products)} product containers")
-                
-                # Also try to find products from script tag (Myntra uses SSR)
-                scripts = soup.find_all('script')
-                for script in scripts:
-                    if script.string and 'window.__myx' in str(script.string):
-                        try:
-                            # Extract JSON data from script
-                            json_match = re.search(r'window\.__myx\s*=\s*({.*?});', script.string, re.DOTALL)
-                            if json_match:
-                                logger.info(f"🎯 [MYNTRA] Found SSR data in script tag")
-                        except:
-                            pass
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [MYNTRA] Processing product #{idx}")
-                        
-                        # Extract title (brand + product name)
-                        brand_elem = product.select_one('.product-brand, h3[class*="brand"]')
-                        name_elem = product.select_one('.product-product, h4[class*="product"]')
-                        
-                        brand = brand_elem.get_text(strip=True) if brand_elem else ''
-                        name = name_elem.get_text(strip=True) if name_elem else ''
-                        title = f"{brand} {name}".strip() if brand or name else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.product-discountedPrice, .product-price span, [class*="discountedPrice"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.myntra.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img.img-responsive, img[class*="product"]')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'Myntra',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [MYNTRA] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [MYNTRA] Error parsing product #{idx}: {e}")
-                        continue
-                        
+            page = self._listing_page(spec, query)
+            if page is not None:
+                self._parse_page('_parse_myntra', 'scrape_myntra', page, query)
         except Exception as e:
             logger.error(f"Error scraping Myntra: {e}")
-        
-        self.add_random_delay()
+
+    def _parse_myntra(self, key, page, query):
+        """Results of a fetched Myntra search page (no network)"""
+        spec = platform_selectors(key)
+        # Fast path: the server-rendered window.__myx state lists every product
+        # of the results page, so no HTML needs to be parsed
+        html = self._response_html(page)
+        state_products = myntra_products_from_state(extract_myx_state(html))
+        if state_products:
+            self._selector_matched('embedded', '__myx')
+            logger.info(f"🎯 [MYNTRA] Found {len(state_products)} products in window.__myx")
+            self._add_listing_results(spec, query, [{
+                'platform': 'Myntra',
+                'title': product['title'][:100],
+                'price': product['price'],
+                'original_price': product['mrp'],
+                'pid': product['pid'],
+                'url': product['url'],
+                'image': product['image'],
+                'currency': 'INR',
+                'availability': spec.availability
+            } for product in state_products[:spec.limit]])
+            return
+        logger.info("🔄 [MYNTRA] No products in window.__myx, falling back to HTML parsing")
+        soup = self._listing_soup(spec, page, query, html)
+        if soup is not None:
+            self._extract_listing(spec, soup, query)
 
     def scrape_nykaa(self, query):
         """Scrape Nykaa - Beauty and wellness e-commerce"""
-        try:
-            logger.info(f"🔍 [NYKAA] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            search_url = f"https://www.nykaa.com/search/result/?q={quote_plus(query)}"
-            logger.info(f"🌐 [NYKAA] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [NYKAA] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Nykaa product selectors
-                products = soup.select('.productWrapper, .product-card, [class*="ProductCard"]')[:5]
-                logger.info(f"🎯 [NYKAA] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [NYKAA] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('.product-name, .title, [class*="product-title"]')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.post-card__content-price-offer, .price, [class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.nykaa.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'Nykaa',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [NYKAA] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [NYKAA] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping Nykaa: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_nykaa', query)
 
     def scrape_firstcry(self, query):
         """Scrape FirstCry - Baby and kids products"""
-        try:
-            logger.info(f"🔍 [FIRSTCRY] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            search_url = f"https://www.firstcry.com/search?q={quote_plus(query)}"
-            logger.info(f"🌐 [FIRSTCRY] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [FIRSTCRY] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # FirstCry product selectors
-                products = soup.select('.product-card, .productBox, [class*="product-listing"]')[:5]
-                logger.info(f"🎯 [FIRSTCRY] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [FIRSTCRY] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('.product-title, .prod-name, h3')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.final-price, .price, span[class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.firstcry.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'FirstCry',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [FIRSTCRY] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [FIRSTCRY] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping FirstCry: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_firstcry', query)
 
     def scrape_ajio(self, query):
         """Scrape AJIO - Reliance's fashion platform"""
-        try:
-            logger.info(f"🔍 [AJIO] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            search_url = f"https://www.ajio.com/search/?text={quote_plus(query)}"
-            logger.info(f"🌐 [AJIO] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [AJIO] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # AJIO product selectors
-                products = soup.select('.item, .rilrtl-products-list__item, [class*="product-card"]')[:5]
-                logger.info(f"🎯 [AJIO] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [AJIO] Processing product #{idx}")
-                        
-                        # Extract title (brand + name)
-                        brand_elem = product.select_one('.brand, [class*="brand"]')
-                        name_elem = product.select_one('.nameCls, [class*="name"]')
-                        
-                        brand = brand_elem.get_text(strip=True) if brand_elem else ''
-                        name = name_elem.get_text(strip=True) if name_elem else ''
-                        title = f"{brand} {name}".strip() if brand or name else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.price strong, [class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.ajio.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'AJIO',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [AJIO] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [AJIO] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping AJIO: {e}")
-        
-        self.add_random_delay()
-
-    def scrape_tatacliq(self, query):
-        """Scrape Tata CLiQ - Premium e-commerce from Tata Group"""
-        try:
-            logger.info(f"🔍 [TATACLIQ] Starting scrape for: {query}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            search_url = f"https://www.tatacliq.com/search/?searchCategory=all&text={quote_plus(query)}"
-            logger.info(f"🌐 [TATACLIQ] Search URL: {search_url}")
-            
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            logger.info(f"✅ [TATACLIQ] Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Tata CLiQ product selectors
-                products = soup.select('.ProductModule, .product-card, [class*="ProductItem"]')[:5]
-                logger.info(f"🎯 [TATACLIQ] Found {len(products)} product containers")
-                
-                for idx, product in enumerate(products[:5], 1):
-                    try:
-                        logger.info(f"📦 [TATACLIQ] Processing product #{idx}")
-                        
-                        # Extract title
-                        title_elem = product.select_one('.ProductDescription__productName, .product-name, h3')
-                        title = title_elem.get_text(strip=True) if title_elem else None
-                        
-                        # Extract price
-                        price_elem = product.select_one('.ProductDescription__priceStrikeContainer, .price, [class*="price"]')
-                        price = None
-                        if price_elem:
-                            price_text = price_elem.get_text(strip=True)
-                            price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                            if price_match:
-                                price = int(price_match.group())
-                        
-                        # Extract URL
-                        link_elem = product.select_one('a')
-                        product_url = None
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            product_url = urljoin('https://www.tatacliq.com', href)
-                        
-                        # Extract image
-                        img_elem = product.select_one('img')
-                        image_url = None
-                        if img_elem:
-                            image_url = img_elem.get('src') or img_elem.get('data-src')
-                        
-                        if title and price:
-                            self.results.append({
-                                'platform': 'Tata CLiQ',
-                                'title': title[:100],
-                                'price': price,
-                                'url': product_url,
-                                'image': image_url,
-                                'currency': 'INR',
-                                'availability': 'In Stock'
-                            })
-                            logger.info(f"✅ [TATACLIQ] Added: {title[:50]}... at ₹{price}")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ [TATACLIQ] Error parsing product #{idx}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logger.error(f"Error scraping Tata CLiQ: {e}")
-        
-        self.add_random_delay()
-
-    # ==================== SELENIUM-BASED SCRAPERS ====================
-    # These scrapers use Selenium WebDriver to handle JavaScript-rendered sites
-    
-    def scrape_meesho_selenium(self, query):
-        """Scrape Meesho using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [MEESHO-SELENIUM] Falling back to basic scraper")
-            return self.scrape_meesho(query)
-        
-        try:
-            logger.info(f"🔍 [MEESHO-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.meesho.com/search?q={quote_plus(query)}"
-            logger.info(f"🌐 [MEESHO-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(4)  # Wait for JavaScript to render
-            
-            # Scroll down to load products
-            driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(2)
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Try to find product cards by looking for price-containing elements
-            # Meesho products have ₹ symbol in them
-            all_links = soup.find_all('a', href=True)
-            product_links = []
-            
-            for link in all_links:
-                href = link.get('href', '')
-                # Meesho product URLs contain specific patterns
-                if '/product/' in href or (len(href) > 30 and href.startswith('/')):
-                    # Check if this link has price text nearby
-                    link_text = link.get_text()
-                    if '₹' in link_text and len(link_text) > 10:
-                        product_links.append(link)
-                        if len(product_links) >= 5:
-                            break
-            
-            logger.info(f"🎯 [MEESHO-SELENIUM] Found {len(product_links)} product links with prices")
-            
-            for idx, product in enumerate(product_links[:5], 1):
-                try:
-                    logger.info(f"📦 [MEESHO-SELENIUM] Processing product #{idx}")
-                    
-                    # Get all text content from the product link
-                    full_text = product.get_text(separator='|', strip=True)
-                    parts = [p.strip() for p in full_text.split('|') if p.strip()]
-                    
-                    # Extract title - usually the longest meaningful text
-                    title = None
-                    for part in parts:
-                        if len(part) > 15 and '₹' not in part and not part.isdigit():
-                            title = part
-                            break
-                    
-                    # Fallback title extraction
-                    if not title:
-                        for part in parts:
-                            if len(part) > 5 and '₹' not in part and part not in ['Free Delivery', 'Sort by', '+1 More']:
-                                title = part
-                                break
-                    
-                    logger.info(f"📝 [MEESHO-SELENIUM] Title: {title}")
-                    
-                    # Extract price - look for ₹ in text
-                    price = None
-                    for part in parts:
-                        if '₹' in part:
-                            price_match = re.search(r'₹\s*([\d,]+)', part)
-                            if price_match:
-                                price = int(price_match.group(1).replace(',', ''))
-                                break
-                    
-                    logger.info(f"💵 [MEESHO-SELENIUM] Price: ₹{price}")
-                    
-                    # Extract URL
-                    href = product.get('href', '')
-                    product_url = urljoin('https://www.meesho.com', href) if href else None
-                    
-                    # Extract image
-                    img_elem = product.find('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price and title not in ['Sort by :', '+1 More', 'Free Delivery']:
-                        self.results.append({
-                            'platform': 'Meesho',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [MEESHO-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [MEESHO-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [MEESHO-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing('scrape_ajio', query)
 
-    def scrape_jiomart_selenium(self, query):
-        """Scrape JioMart using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [JIOMART-SELENIUM] Falling back to basic scraper")
-            return self.scrape_jiomart(query)
-        
-        try:
-            logger.info(f"🔍 [JIOMART-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.jiomart.com/search/{quote_plus(query)}"
-            logger.info(f"🌐 [JIOMART-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(4)  # Wait for JavaScript to render
-            
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.plp-card-wrapper, .product-card, [data-qa="product"]'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [JIOMART-SELENIUM] Product cards not found")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # JioMart product selectors
-            products = soup.select('.plp-card-wrapper, .product-card, [data-qa="product"], .jm-col-4, div[class*="product"]')[:5]
-            logger.info(f"🎯 [JIOMART-SELENIUM] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products[:5], 1):
-                try:
-                    logger.info(f"📦 [JIOMART-SELENIUM] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = product.select_one('.plp-card-details-name, .product-title, span[class*="name"], h3, p[class*="name"]')
-                    title = title_elem.get_text(strip=True) if title_elem else None
-                    
-                    # Extract price
-                    price = None
-                    price_elem = product.select_one('.plp-card-details-price, .product-price, span[class*="price"], span[class*="Price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
-                    
-                    # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.jiomart.com', href)
-                    
-                    # Extract image
-                    img_elem = product.select_one('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price:
-                        self.results.append({
-                            'platform': 'JioMart',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [JIOMART-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [JIOMART-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [JIOMART-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+    def scrape_tatacliq(self, query):
+        """Scrape Tata CLiQ - Premium e-commerce from Tata Group"""
+        self._scrape_listing('scrape_tatacliq', query)
 
-    def scrape_myntra_selenium(self, query):
-        """Scrape Myntra using Selenium for JavaScript-rendered content"""
+    # ==================== SELENIUM-BASED SCRAPERS ====================
+    # These scrapers use Selenium WebDriver to handle JavaScript-rendered sites
+    
+    def scrape_meesho_selenium(self, query):
+        """Scrape Meesho using Selenium for JavaScript-rendered content"""
+        spec = platform_selectors('scrape_meesho_selenium')
         driver = self._get_selenium_driver()
         if not driver:
-            logger.warning("⚠️ [MYNTRA-SELENIUM] Falling back to basic scraper")
-            return self.scrape_myntra(query)
+            logger.warning("⚠️ [MEESHO-SELENIUM] Falling back to basic scraper")
+            return self.scrape_meesho(query)
         
         try:
-            logger.info(f"🔍 [MYNTRA-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.myntra.com/{quote_plus(query.replace(' ', '-'))}"
-            logger.info(f"🌐 [MYNTRA-SELENIUM] URL: {search_url}")
+            logger.info(f"🔍 [MEESHO-SELENIUM] Starting scrape for: {query}")
+            search_url = spec.search_url_for(query)
+            logger.info(f"🌐 [MEESHO-SELENIUM] URL: {search_url}")
             
-            driver.get(search_url)
-            time.sleep(3)
+            self._selenium_get(driver, search_url)
             
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.product-base, .product-productMetaInfo, li[class*="product"]'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [MYNTRA-SELENIUM] Product cards not found")
+            # Wait for product cards to render instead of sleeping a fixed time
+            self._wait_for_products(driver, spec.platform, spec.ready)
+            
+            soup = self._soup(driver.page_source, only=spec.parse_only)
+            
+            # Meesho cards have no stable classes, so they are found by heuristics rather than registry fields.
+            # Try to find product cards by looking for price-containing elements
+            # Meesho products have ₹ symbol in them
+            all_links = soup.find_all('a', href=True)
+            product_links = []
             
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            for link in all_links:
+                href = link.get('href', '')
+                # Meesho product URLs contain specific patterns
+                if '/product/' in href or (len(href) > 30 and href.startswith('/')):
+                    # Check if this link has price text nearby
+                    link_text = link.get_text()
+                    if '₹' in link_text and len(link_text) > 10:
+                        product_links.append(link)
+                        if len(product_links) >= 5:
+                            break
             
-            # Myntra product selectors
-            products = soup.select('.product-base, li[class*="product"], div[class*="product-sliderContainer"]')[:5]
-            logger.info(f"🎯 [MYNTRA-SELENIUM] Found {len(products)} product containers")
+            logger.info(f"🎯 [MEESHO-SELENIUM] Found {len(product_links)} product links with prices")
             
-            for idx, product in enumerate(products[:5], 1):
+            for idx, product in enumerate(product_links[:5], 1):
                 try:
-                    logger.info(f"📦 [MYNTRA-SELENIUM] Processing product #{idx}")
+                    logger.info(f"📦 [MEESHO-SELENIUM] Processing product #{idx}")
                     
-                    # Extract title (brand + name)
-                    brand_elem = product.select_one('.product-brand, h3[class*="brand"], [class*="brand"]')
-                    name_elem = product.select_one('.product-product, h4[class*="product"], [class*="product-title"]')
+                    # Get all text content from the product link
+                    full_text = product.get_text(separator='|', strip=True)
+                    parts = [p.strip() for p in full_text.split('|') if p.strip()]
+                    
+                    # Extract title - usually the longest meaningful text
+                    title = None
+                    for part in parts:
+                        if len(part) > 15 and '₹' not in part and not part.isdigit():
+                            title = part
+                            break
+                    
+                    # Fallback title extraction
+                    if not title:
+                        for part in parts:
+                            if len(part) > 5 and '₹' not in part and part not in ['Free Delivery', 'Sort by', '+1 More']:
+                                title = part
+                                break
                     
-                    brand = brand_elem.get_text(strip=True) if brand_elem else ''
-                    name = name_elem.get_text(strip=True) if name_elem else ''
-                    title = f"{brand} {name}".strip() if brand or name else None
+                    logger.info(f"📝 [MEESHO-SELENIUM] Title: {title}")
                     
-                    # Extract price
+                    # Extract price - look for ₹ in text
                     price = None
-                    price_elem = product.select_one('.product-discountedPrice, span[class*="discountedPrice"], span[class*="price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
+                    for part_prices in tokenize_batch(parts):
+                        part_prices = [token.value for token in part_prices if token.kind == CURRENCY]
+                        if part_prices:
+                            price = part_prices[0]
+                            break
+                    
+                    logger.info(f"💵 [MEESHO-SELENIUM] Price: ₹{price}")
                     
                     # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.myntra.com', href)
+                    href = product.get('href', '')
+                    product_url = urljoin(spec.base_url, href) if href else None
                     
                     # Extract image
-                    img_elem = product.select_one('img.img-responsive, img[class*="product"], picture img')
+                    img_elem = product.find('img')
                     image_url = None
                     if img_elem:
                         image_url = img_elem.get('src') or img_elem.get('data-src')
                     
-                    if title and price:
+                    if title and price and title not in ['Sort by :', '+1 More', 'Free Delivery']:
                         self.results.append({
-                            'platform': 'Myntra',
+                            'platform': 'Meesho',
                             'title': title[:100],
                             'price': price,
                             'url': product_url,
@@ -2121,392 +2327,99 @@ class ProductScraper:
                             'currency': 'INR',
                             'availability': 'In Stock'
                         })
-                        logger.info(f"✅ [MYNTRA-SELENIUM] Added: {title[:50]}... at ₹{price}")
+                        logger.info(f"✅ [MEESHO-SELENIUM] Added: {title[:50]}... at ₹{price}")
                         
                 except Exception as e:
-                    logger.error(f"❌ [MYNTRA-SELENIUM] Error parsing product #{idx}: {e}")
+                    logger.error(f"❌ [MEESHO-SELENIUM] Error parsing product #{idx}: {e}")
                     continue
                     
         except Exception as e:
-            logger.error(f"❌ [MYNTRA-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+            logger.error(f"❌ [MEESHO-SELENIUM] Error: {e}")
+
+    def scrape_jiomart_selenium(self, query):
+        """Scrape JioMart using Selenium for JavaScript-rendered content"""
+        self._scrape_listing_selenium('scrape_jiomart_selenium', query)
+
+    def scrape_myntra_selenium(self, query):
+        """Scrape Myntra using Selenium for JavaScript-rendered content.
+
+        The request-based scraper reads the same products from the server-rendered
+        window.__myx state, so the browser is only started when that finds nothing.
+        """
+        self.scrape_myntra(query)
+        if self.results:
+            logger.info(f"⚡ [MYNTRA-SELENIUM] Request-based scrape found {len(self.results)} products, skipping the browser")
+            return
+        self._scrape_listing_selenium('scrape_myntra_selenium', query, fallback=False)
 
     def scrape_nykaa_selenium(self, query):
         """Scrape Nykaa using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [NYKAA-SELENIUM] Falling back to basic scraper")
-            return self.scrape_nykaa(query)
-        
-        try:
-            logger.info(f"🔍 [NYKAA-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.nykaa.com/search/result/?q={quote_plus(query)}"
-            logger.info(f"🌐 [NYKAA-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(3)
-            
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.productWrapper, .product-card, [class*="ProductCard"]'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [NYKAA-SELENIUM] Product cards not found")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Nykaa product selectors
-            products = soup.select('.productWrapper, .product-card, [class*="ProductCard"], div[class*="product-list"] > div')[:5]
-            logger.info(f"🎯 [NYKAA-SELENIUM] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products[:5], 1):
-                try:
-                    logger.info(f"📦 [NYKAA-SELENIUM] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = product.select_one('.product-name, .title, [class*="product-title"], span[class*="name"]')
-                    title = title_elem.get_text(strip=True) if title_elem else None
-                    
-                    # Extract price
-                    price = None
-                    price_elem = product.select_one('.post-card__content-price-offer, .price, [class*="price"], span[class*="Price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
-                    
-                    # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.nykaa.com', href)
-                    
-                    # Extract image
-                    img_elem = product.select_one('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price:
-                        self.results.append({
-                            'platform': 'Nykaa',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [NYKAA-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [NYKAA-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [NYKAA-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing_selenium('scrape_nykaa_selenium', query)
 
     def scrape_ajio_selenium(self, query):
         """Scrape AJIO using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [AJIO-SELENIUM] Falling back to basic scraper")
-            return self.scrape_ajio(query)
-        
-        try:
-            logger.info(f"🔍 [AJIO-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.ajio.com/search/?text={quote_plus(query)}"
-            logger.info(f"🌐 [AJIO-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(4)
-            
-            # Scroll down to load more products
-            driver.execute_script("window.scrollTo(0, 500);")
-            time.sleep(1)
-            
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.item, [class*="product-card"], .rilrtl-products-list__item'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [AJIO-SELENIUM] Product cards not found")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # AJIO product selectors
-            products = soup.select('.item, [class*="product-card"], .rilrtl-products-list__item, div[class*="product"]')[:5]
-            logger.info(f"🎯 [AJIO-SELENIUM] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products[:5], 1):
-                try:
-                    logger.info(f"📦 [AJIO-SELENIUM] Processing product #{idx}")
-                    
-                    # Extract title (brand + name)
-                    brand_elem = product.select_one('.brand, [class*="brand"]')
-                    name_elem = product.select_one('.nameCls, [class*="name"]')
-                    
-                    brand = brand_elem.get_text(strip=True) if brand_elem else ''
-                    name = name_elem.get_text(strip=True) if name_elem else ''
-                    title = f"{brand} {name}".strip() if brand or name else None
-                    
-                    # Extract price
-                    price = None
-                    price_elem = product.select_one('.price strong, [class*="price"], span[class*="Price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
-                    
-                    # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.ajio.com', href)
-                    
-                    # Extract image
-                    img_elem = product.select_one('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price:
-                        self.results.append({
-                            'platform': 'AJIO',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [AJIO-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [AJIO-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [AJIO-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing_selenium('scrape_ajio_selenium', query)
 
     def scrape_tatacliq_selenium(self, query):
         """Scrape Tata CLiQ using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [TATACLIQ-SELENIUM] Falling back to basic scraper")
-            return self.scrape_tatacliq(query)
-        
-        try:
-            logger.info(f"🔍 [TATACLIQ-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.tatacliq.com/search/?searchCategory=all&text={quote_plus(query)}"
-            logger.info(f"🌐 [TATACLIQ-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(4)
-            
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.ProductModule, .product-card, [class*="ProductItem"]'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [TATACLIQ-SELENIUM] Product cards not found")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Tata CLiQ product selectors
-            products = soup.select('.ProductModule, .product-card, [class*="ProductItem"], div[class*="product"]')[:5]
-            logger.info(f"🎯 [TATACLIQ-SELENIUM] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products[:5], 1):
-                try:
-                    logger.info(f"📦 [TATACLIQ-SELENIUM] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = product.select_one('.ProductDescription__productName, .product-name, span[class*="name"], h3')
-                    title = title_elem.get_text(strip=True) if title_elem else None
-                    
-                    # Extract price
-                    price = None
-                    price_elem = product.select_one('.ProductDescription__priceStrikeContainer, .price, [class*="price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
-                    
-                    # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.tatacliq.com', href)
-                    
-                    # Extract image
-                    img_elem = product.select_one('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price:
-                        self.results.append({
-                            'platform': 'Tata CLiQ',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [TATACLIQ-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [TATACLIQ-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [TATACLIQ-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing_selenium('scrape_tatacliq_selenium', query)
 
     def scrape_firstcry_selenium(self, query):
         """Scrape FirstCry using Selenium for JavaScript-rendered content"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            logger.warning("⚠️ [FIRSTCRY-SELENIUM] Falling back to basic scraper")
-            return self.scrape_firstcry(query)
-        
-        try:
-            logger.info(f"🔍 [FIRSTCRY-SELENIUM] Starting scrape for: {query}")
-            search_url = f"https://www.firstcry.com/search?q={quote_plus(query)}"
-            logger.info(f"🌐 [FIRSTCRY-SELENIUM] URL: {search_url}")
-            
-            driver.get(search_url)
-            time.sleep(3)
-            
-            # Wait for products to load
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.product-card, .productBox, [class*="product-listing"]'))
-                )
-            except TimeoutException:
-                logger.warning("⚠️ [FIRSTCRY-SELENIUM] Product cards not found")
-            
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # FirstCry product selectors
-            products = soup.select('.product-card, .productBox, [class*="product-listing"], div[class*="product"]')[:5]
-            logger.info(f"🎯 [FIRSTCRY-SELENIUM] Found {len(products)} product containers")
-            
-            for idx, product in enumerate(products[:5], 1):
-                try:
-                    logger.info(f"📦 [FIRSTCRY-SELENIUM] Processing product #{idx}")
-                    
-                    # Extract title
-                    title_elem = product.select_one('.product-title, .prod-name, span[class*="name"], h3')
-                    title = title_elem.get_text(strip=True) if title_elem else None
-                    
-                    # Extract price
-                    price = None
-                    price_elem = product.select_one('.final-price, .price, span[class*="price"]')
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            price = int(price_match.group())
-                    
-                    # Extract URL
-                    link_elem = product.select_one('a')
-                    product_url = None
-                    if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        product_url = urljoin('https://www.firstcry.com', href)
-                    
-                    # Extract image
-                    img_elem = product.select_one('img')
-                    image_url = None
-                    if img_elem:
-                        image_url = img_elem.get('src') or img_elem.get('data-src')
-                    
-                    if title and price:
-                        self.results.append({
-                            'platform': 'FirstCry',
-                            'title': title[:100],
-                            'price': price,
-                            'url': product_url,
-                            'image': image_url,
-                            'currency': 'INR',
-                            'availability': 'In Stock'
-                        })
-                        logger.info(f"✅ [FIRSTCRY-SELENIUM] Added: {title[:50]}... at ₹{price}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ [FIRSTCRY-SELENIUM] Error parsing product #{idx}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"❌ [FIRSTCRY-SELENIUM] Error: {e}")
-        
-        self.add_random_delay()
+        self._scrape_listing_selenium('scrape_firstcry_selenium', query)
 
-    def scrape_all(self, query, use_selenium=True):
+    def scrape_all(self, query, use_selenium=True, concurrent=False, max_workers=DEFAULT_MAX_WORKERS,
+                   budget=None, platform_budget=None, on_platform_done=None, use_cache=True):
         """Scrape Indian e-commerce platforms including major sites
         
         Args:
             query: Search query string
             use_selenium: If True, use Selenium for JavaScript-rendered sites (default: True)
+            concurrent: If True, run requests-based scrapers in parallel on a worker pool
+            max_workers: Worker pool size used in concurrent mode
+            budget: Total time budget in seconds; results collected so far are returned when it runs out
+            platform_budget: Time budget in seconds for each platform
+            on_platform_done: Called as callback(platform, stats, results) from the calling
+                thread as soon as each platform finishes, before dedup
+            use_cache: If False, skip the result cache for this query
+        
+        Per-platform outcomes (ok / timeout / blocked / error) are left in self.platform_stats
+        and the cache lookup outcome in self.cache_info.
         """
         logger.info(f"Starting scrape for query: {query}")
         logger.info(f"🔧 Selenium mode: {'ENABLED' if use_selenium and SELENIUM_AVAILABLE else 'DISABLED'}")
+        logger.info(f"🔧 Execution mode: {'CONCURRENT (' + str(max_workers) + ' workers)' if concurrent else 'SERIAL'}")
+        if budget or platform_budget:
+            logger.info(f"⏱️ Time budget: total={budget or 'none'}s, per platform={platform_budget or 'none'}s")
         
-        # ==================== MAJOR PLATFORMS ====================
-        self.scrape_amazon(query)           # Amazon India - Using mobile headers ✅
-        self.scrape_flipkart(query)         # Flipkart - Using mobile headers ✅
+        plan = self._platform_plan(use_selenium)
+        key = None
+        self.cache_info = None
+        if self.cache is not None and use_cache:
+            key = cache_key(query, [platform for platform, _, _ in plan], use_selenium and SELENIUM_AVAILABLE)
+            cached, self.cache_info = self.cache.get(key)
+            if cached is not None:
+                return self._serve_cached(cached, on_platform_done)
         
-        # ==================== GENERAL MARKETPLACES ====================
-        # Use Selenium-based scrapers for sites with anti-bot protection
-        if use_selenium and SELENIUM_AVAILABLE:
-            self.scrape_meesho_selenium(query)       # Meesho - Selenium ✅
-            self.scrape_jiomart_selenium(query)      # JioMart - Selenium ✅
-        else:
-            self.scrape_meesho(query)               # Meesho - Basic (may be blocked)
-            self.scrape_jiomart(query)              # JioMart - Basic (may be blocked)
-        
-        self.scrape_snapdeal(query)         # Snapdeal - Value marketplace ✅
-        # self.scrape_indiamart(query)      # IndiaMART - B2B (optional) 
-        
-        # ==================== SPECIALIZED PLATFORMS ====================
-        if use_selenium and SELENIUM_AVAILABLE:
-            self.scrape_myntra_selenium(query)       # Myntra - Selenium ✅
-            self.scrape_ajio_selenium(query)         # AJIO - Selenium ✅
-            self.scrape_nykaa_selenium(query)        # Nykaa - Selenium ✅
-            self.scrape_tatacliq_selenium(query)     # Tata CLiQ - Selenium ✅
-            self.scrape_firstcry_selenium(query)     # FirstCry - Selenium ✅
+        self.deadline = time.monotonic() + budget if budget else None
+        self.platform_stats = {}
+        self.on_platform_done = on_platform_done
+        if concurrent:
+            merged = self._scrape_concurrently(query, plan, max_workers, platform_budget)
         else:
-            self.scrape_myntra(query)               # Myntra - Basic (may be blocked)
-            self.scrape_ajio(query)                 # AJIO - Basic (may be blocked)
-            self.scrape_nykaa(query)                # Nykaa - Basic (may be blocked)
-            self.scrape_tatacliq(query)             # Tata CLiQ - Basic (may be blocked)
-            self.scrape_firstcry(query)             # FirstCry - Basic (may be blocked)
-        
-        # ==================== OTHER ACCESSIBLE SITES ====================
-        self.scrape_naaptol(query)          # Naaptol - No anti-bot protection ✅
-        self.scrape_shopsy(query)           # Shopsy - Flipkart's social commerce ✅
+            merged = self._scrape_serially(query, plan, platform_budget)
+        self.results = self.results + merged
+        self.deadline = None
+        self.on_platform_done = None
+        # Report platforms in plan order regardless of completion order
+        self.platform_stats = {platform: self.platform_stats[platform]
+                               for platform, _, _ in plan if platform in self.platform_stats}
         
-        # Close Selenium driver to free resources
+        # Quit pooled Selenium drivers to free resources (a persistent scraper keeps them warm)
         if use_selenium and SELENIUM_AVAILABLE:
             self._close_selenium_driver()
+            if not self.persistent:
+                self.driver_pool.shutdown()
         
         # REAL SCRAPING ONLY - No mock data generation
         scraped_count = len(self.results)
@@ -2547,8 +2460,145 @@ class ProductScraper:
             logger.info(f"  #{idx}: [{result['platform']}] {source_type} - {result['title'][:50]}... - ₹{result['price']}")
             logger.info(f"       URL: {result['url']}")
         
+        if key is not None and self.results:
+            self._store_cached(key)
+        
+        return self.results
+
+    def _store_cached(self, key):
+        """Cache the deduplicated results with stats counting them.
+
+        Runs where every platform was ok get the full TTL. Runs with blocked, failed
+        or skipped platforms are kept only PARTIAL_RESULT_TTL seconds, and runs with
+        timeouts are not cached, so a bad fetch is retried soon.
+        """
+        statuses = {stats['status'] for stats in self.platform_stats.values()}
+        if STATUS_TIMEOUT in statuses:
+            return
+        counts = {}
+        for result in self.results:
+            counts[result['platform']] = counts.get(result['platform'], 0) + 1
+        platforms = {platform: dict(stats, results=counts.get(platform, 0))
+                     for platform, stats in self.platform_stats.items()}
+        ttl = None if statuses <= {STATUS_OK} else PARTIAL_RESULT_TTL
+        self.cache.put(key, {'results': self.results, 'platforms': platforms}, ttl=ttl)
+
+    def _serve_cached(self, cached, on_platform_done=None):
+        """Return a cached scrape_all result, replaying per-platform callbacks for streaming"""
+        self.results = list(cached['results'])
+        self.platform_stats = dict(cached['platforms'])
+        logger.info(f"⚡ [CACHE] {self.cache_info['tier']} hit: {len(self.results)} products, "
+                    f"{self.cache_info['age']}s old")
+        if on_platform_done:
+            for platform, stats in self.platform_stats.items():
+                platform_results = [result for result in self.results if result['platform'] == platform]
+                try:
+                    on_platform_done(platform, stats, platform_results)
+                except Exception as e:
+                    logger.error(f"❌ [PLATFORM] on_platform_done callback failed for {platform}: {e}")
         return self.results
 
+def format_results(results, start_id=1):
+    """Format scraped results for the Cost Curve frontend"""
+    logger.info(f"🎨 [FORMAT] Formatting {len(results)} results for frontend")
+    formatted_results = []
+    for i, result in enumerate(results, start_id - 1):
+        source_type = "🎭 MOCK" if "Special" in result['title'] else "🌐 REAL"
+        deal_score = random.randint(70, 95)
+        shipping = 'Free' if result['price'] > 500 else '₹50'
+        rating = round(random.uniform(3.5, 4.8), 1)
+        reviews = random.randint(100, 5000)
+        
+        logger.info(f"🎨 [FORMAT] #{i+1}: {source_type} [{result['platform']}] {result['title'][:40]}...")
+        logger.info(f"   💰 Price: ₹{result['price']} | 🚚 Shipping: {shipping} | ⭐ Rating: {rating} | 💬 Reviews: {reviews}")
+        logger.info(f"   🔗 FINAL URL that user will click: {result['url']}")
+        
+        formatted_results.append({
+            'id': i + 1,
+            'title': result['title'],
+            'price': result['price'],
+            'platform': result['platform'],
+            'url': result['url'],
+            'image': result['image'],
+            'currency': result['currency'],
+            'availability': result['availability'],
+            'dealScore': deal_score,
+            'shipping': shipping,
+            'rating': rating,
+            'reviews': reviews
+        })
+    return formatted_results
+
+def build_output(query, results, platform_stats=None, cache_info=None):
+    """Build the JSON document returned to the Node API"""
+    formatted_results = format_results(results)
+    platform_stats = platform_stats or {}
+    output = {
+        'success': True,
+        'query': query,
+        'resultsCount': len(formatted_results),
+        'products': formatted_results,
+        'platforms': platform_stats,
+        'partial': any(stats['status'] == STATUS_TIMEOUT for stats in platform_stats.values()),
+        'timestamp': time.time()
+    }
+    if cache_info:
+        output['cache'] = cache_info
+    return output
+
+def build_error_output(query, error):
+    """Build the JSON document returned when a scrape fails"""
+    return {
+        'success': False,
+        'error': str(error),
+        'query': query,
+        'products': []
+    }
+
+class NDJSONStreamer:
+    """Writes one JSON line per finished platform, then a summary line.
+
+    Platform records carry that platform's products before dedup; the summary is
+    the regular build_output document and replaces them on the client.
+    """
+
+    def __init__(self, query, write=None, extra=None):
+        self.query = query
+        self.write = write or self._write_stdout
+        self.extra = extra or {}
+        self.next_id = 1
+
+    @staticmethod
+    def _write_stdout(line):
+        sys.stdout.write(line + '\n')
+        sys.stdout.flush()
+
+    def emit(self, record):
+        self.write(json.dumps({**record, **self.extra}))
+
+    def platform_done(self, platform, stats, results):
+        """on_platform_done callback for ProductScraper.scrape_all"""
+        products = format_results(results, start_id=self.next_id)
+        self.next_id += len(products)
+        self.emit({
+            'type': 'platform',
+            'query': self.query,
+            'platform': platform,
+            **stats,
+            'products': products,
+        })
+
+    def summary(self, output):
+        self.emit({'type': 'summary', **output})
+
+def _get_cli_option(name, default=None):
+    """Return the value following a `--name value` flag in sys.argv, or default"""
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Please provide a search query"}))
@@ -2557,62 +2607,60 @@ def main():
     query = sys.argv[1]
     # Check for --selenium flag to enable Selenium (disabled by default for speed)
     use_selenium = '--selenium' in sys.argv
+    # --concurrent runs the requests-based scrapers in parallel (--workers N sets the pool size)
+    concurrent = '--concurrent' in sys.argv
+    max_workers = int(_get_cli_option('--workers', DEFAULT_MAX_WORKERS))
+    # --budget / --platform-budget (seconds) return partial results instead of running over
+    budget = _get_cli_option('--budget')
+    platform_budget = _get_cli_option('--platform-budget')
+    # --stream prints one NDJSON record per platform as it finishes, then a summary record
+    streamer = NDJSONStreamer(query) if '--stream' in sys.argv else None
+    # --cache-db PATH reuses results of recent identical queries (--cache-ttl S sets their lifetime)
+    cache = None
+    cache_db = _get_cli_option('--cache-db')
+    if cache_db:
+        cache_ttl = float(_get_cli_option('--cache-ttl', DEFAULT_DISK_TTL))
+        cache = ResultCache(path=cache_db, memory_ttl=cache_ttl, disk_ttl=cache_ttl)
+    
+    # --parser html.parser|lxml|fastest selects the HTML parser backend
+    parser = _get_cli_option('--parser', DEFAULT_PARSER)
+    # --parse-processes N parses pages in N worker processes (0: all cores) instead of the fetch threads
+    parse_pool = None
+    parse_processes = _get_cli_option('--parse-processes')
+    if parse_processes is not None:
+        parse_pool = ParsePool(int(parse_processes) or None)
     
-    scraper = ProductScraper()
+    # --http2 talks HTTP/2 to the hosts that offer it (needs httpx[http2])
+    transport = HostTransport(PLATFORM_HOSTS, http2=True) if '--http2' in sys.argv else None
     
     try:
+        # Inside the try so a bad --parser is reported as a JSON error like any other failure
+        scraper = ProductScraper(cache=cache, parser=parser, parse_pool=parse_pool, transport=transport)
+        
         # Disable Selenium by default for web API calls (too slow, causes timeouts)
         # Use --selenium flag to enable for better results
-        results = scraper.scrape_all(query, use_selenium=use_selenium)
-        
-        # Format results for Cost Curve frontend
-        logger.info(f"🎨 [FORMAT] Formatting {len(results)} results for frontend")
-        formatted_results = []
-        for i, result in enumerate(results):
-            source_type = "🎭 MOCK" if "Special" in result['title'] else "🌐 REAL"
-            deal_score = random.randint(70, 95)
-            shipping = 'Free' if result['price'] > 500 else '₹50'
-            rating = round(random.uniform(3.5, 4.8), 1)
-            reviews = random.randint(100, 5000)
-            
-            logger.info(f"🎨 [FORMAT] #{i+1}: {source_type} [{result['platform']}] {result['title'][:40]}...")
-            logger.info(f"   💰 Price: ₹{result['price']} | 🚚 Shipping: {shipping} | ⭐ Rating: {rating} | 💬 Reviews: {reviews}")
-            logger.info(f"   🔗 FINAL URL that user will click: {result['url']}")
-            
-            formatted_results.append({
-                'id': i + 1,
-                'title': result['title'],
-                'price': result['price'],
-                'platform': result['platform'],
-                'url': result['url'],
-                'image': result['image'],
-                'currency': result['currency'],
-                'availability': result['availability'],
-                'dealScore': deal_score,
-                'shipping': shipping,
-                'rating': rating,
-                'reviews': reviews
-            })
-        
-        output = {
-            'success': True,
-            'query': query,
-            'resultsCount': len(formatted_results),
-            'products': formatted_results,
-            'timestamp': time.time()
-        }
+        results = scraper.scrape_all(query, use_selenium=use_selenium,
+                                     concurrent=concurrent, max_workers=max_workers,
+                                     budget=float(budget) if budget else None,
+                                     platform_budget=float(platform_budget) if platform_budget else None,
+                                     on_platform_done=streamer.platform_done if streamer else None)
         
-        print(json.dumps(output, indent=2))
+        output = build_output(query, results, scraper.platform_stats, scraper.cache_info)
+        if streamer:
+            streamer.summary(output)
+        else:
+            print(json.dumps(output, indent=2))
         
     except Exception as e:
-        error_output = {
-            'success': False,
-            'error': str(e),
-            'query': query,
-            'products': []
-        }
-        print(json.dumps(error_output))
+        error_output = build_error_output(query, e)
+        if streamer:
+            streamer.summary(error_output)
+        else:
+            print(json.dumps(error_output))
         sys.exit(1)
+    finally:
+        if parse_pool:
+            parse_pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Scraper Service - long-lived ProductScraper behind a JSON-lines protocol
+Keeps the HTTP session, its connection pools and a pool of Selenium browsers warm between
+queries instead of paying interpreter startup and cold connections on every search.
+
+Protocol (one JSON object per line):
+    stdin:  {"id": "42", "query": "iPhone 15", "selenium": false, "concurrent": true, "workers": 6,
+             "budget": 80, "platformBudget": 25, "cache": true, "parser": "lxml"}
+            {"id": "43", "type": "ping"}
+    stdout: {"id": "42", "success": true, "query": "iPhone 15", "products": [...], "platforms": {...}, ...}
+            {"id": "43", "type": "pong", "served": 12, "transport": {"www.flipkart.com": {"reused": 11, ...}},
+             "breakers": {"Meesho": {"state": "open", "retryIn": 42.0, ...}},
+             "rateLimit": {"www.flipkart.com": {"requests": 14, "delayed": 2, "waited": 0.7}}}
+
+With "stream": true the service first writes one {"id", "type": "platform", ...} line
+per platform as it finishes and ends with {"id", "type": "summary", ...}.
+
+Logging stays on stderr so stdout carries protocol lines only.
+"""
+
+import os
+import sys
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from scraper import (
+    ProductScraper,
+    NDJSONStreamer,
+    ParsePool,
+    SeleniumDriverPool,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PARSER,
+    DRIVER_POOL_SIZE,
+    PLATFORM_HOSTS,
+    SELENIUM_AVAILABLE,
+    build_output,
+    build_error_output,
+    resolve_parser,
+    logger,
+)
+from http_transport import HostTransport
+from result_cache import ResultCache, DEFAULT_MEMORY_TTL, DEFAULT_DISK_TTL
+
+# Number of queries served at the same time
+DEFAULT_QUERY_SLOTS = 4
+
+# SQLite file of the persistent result cache tier
+DEFAULT_CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper_cache.sqlite')
+
+
+class ScraperService:
+    def __init__(self, query_slots=DEFAULT_QUERY_SLOTS, drivers=DRIVER_POOL_SIZE, prelaunch=0, cache=None,
+                 parser=DEFAULT_PARSER, parse_pool=None, transport=None, prewarm=True):
+        self.driver_pool = SeleniumDriverPool(max_size=drivers)
+        self.cache = cache
+        self.parse_pool = parse_pool
+        self.scraper = ProductScraper(persistent=True, driver_pool=self.driver_pool, cache=cache, parser=parser,
+                                      parse_pool=parse_pool, transport=transport)
+        self.transport = self.scraper.transport
+        self.query_slots = query_slots
+        self.prelaunch = prelaunch
+        self.prewarm = prewarm
+        self.served = 0
+        self._write_lock = threading.Lock()
+
+    def send(self, message):
+        """Write one protocol message to stdout"""
+        self.send_line(json.dumps(message))
+
+    def send_line(self, line):
+        """Write one already-encoded protocol line to stdout"""
+        with self._write_lock:
+            sys.stdout.write(line + '\n')
+            sys.stdout.flush()
+
+    def handle_search(self, request):
+        """Run one search request and reply with the same document main() prints"""
+        request_id = request.get('id')
+        query = request.get('query', '')
+        use_selenium = bool(request.get('selenium', False))
+        concurrent = bool(request.get('concurrent', True))
+        max_workers = int(request.get('workers', DEFAULT_MAX_WORKERS))
+        budget = request.get('budget')
+        platform_budget = request.get('platformBudget')
+        streamer = None
+        if request.get('stream'):
+            streamer = NDJSONStreamer(query, write=self.send_line, extra={'id': request_id})
+
+        try:
+            if not query:
+                raise ValueError('Please provide a search query')
+
+            options = {
+                'concurrent': concurrent,
+                'max_workers': max_workers,
+                'budget': float(budget) if budget else None,
+                'platform_budget': float(platform_budget) if platform_budget else None,
+                'on_platform_done': streamer.platform_done if streamer else None,
+                'use_cache': bool(request.get('cache', True)),
+            }
+            # Each query runs on a fork that shares the warm session and WebDriver pool
+            scraper = self.scraper.fork()
+            if request.get('parser'):
+                scraper.parser = resolve_parser(request['parser'])
+            results = scraper.scrape_all(query, use_selenium=use_selenium, **options)
+
+            output = build_output(query, results, scraper.platform_stats, scraper.cache_info)
+        except Exception as e:
+            logger.error(f"❌ [SERVICE] Query '{query}' failed: {e}")
+            output = build_error_output(query, e)
+
+        self.served += 1
+        if streamer:
+            streamer.summary(output)
+        else:
+            output['id'] = request_id
+            self.send(output)
+
+    def serve(self, stream=sys.stdin):
+        """Read requests until stdin closes"""
+        if self.prelaunch and SELENIUM_AVAILABLE:
+            self.driver_pool.prelaunch(self.prelaunch)
+        if self.parse_pool:
+            self.parse_pool.prewarm()
+        if self.prewarm:
+            # Connections are opened in the background; a query arriving first just connects itself
+            threading.Thread(target=self.scraper.prewarm_connections, name='prewarm', daemon=True).start()
+        logger.info(f"🚀 [SERVICE] Scraper service ready ({self.query_slots} query slots)")
+        with ThreadPoolExecutor(max_workers=self.query_slots, thread_name_prefix='query') as pool:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.send({'id': None, 'success': False, 'error': f'Invalid request: {e}'})
+                    continue
+
+                if request.get('type') == 'ping':
+                    pong = {'id': request.get('id'), 'type': 'pong', 'served': self.served}
+                    if self.cache:
+                        pong['cache'] = dict(self.cache.stats)
+                    if self.parse_pool:
+                        pong['parsePool'] = dict(self.parse_pool.stats, processes=self.parse_pool.processes)
+                    pong['transport'] = self.transport.stats()
+                    pong['breakers'] = self.scraper.breakers.snapshot()
+                    pong['rateLimit'] = self.scraper.rate_limiter.stats()
+                    self.send(pong)
+                    continue
+
+                pool.submit(self.handle_search, request)
+
+        self.driver_pool.shutdown()
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+        self.transport.close()
+        if self.cache:
+            self.cache.close()
+        logger.info("🔒 [SERVICE] Scraper service stopped")
+
+
+def main():
+    query_slots = DEFAULT_QUERY_SLOTS
+    if '--slots' in sys.argv:
+        query_slots = int(sys.argv[sys.argv.index('--slots') + 1])
+    drivers = DRIVER_POOL_SIZE
+    if '--drivers' in sys.argv:
+        drivers = int(sys.argv[sys.argv.index('--drivers') + 1])
+    prelaunch = 0
+    if '--prelaunch' in sys.argv:
+        prelaunch = int(sys.argv[sys.argv.index('--prelaunch') + 1])
+
+    # Result cache: --cache-db PATH, --memory-ttl S, --cache-ttl S (disk tier), --no-cache
+    cache = None
+    if '--no-cache' not in sys.argv:
+        cache_db = DEFAULT_CACHE_DB
+        if '--cache-db' in sys.argv:
+            cache_db = sys.argv[sys.argv.index('--cache-db') + 1]
+        memory_ttl = DEFAULT_MEMORY_TTL
+        if '--memory-ttl' in sys.argv:
+            memory_ttl = float(sys.argv[sys.argv.index('--memory-ttl') + 1])
+        disk_ttl = DEFAULT_DISK_TTL
+        if '--cache-ttl' in sys.argv:
+            disk_ttl = float(sys.argv[sys.argv.index('--cache-ttl') + 1])
+        cache = ResultCache(path=cache_db, memory_ttl=memory_ttl, disk_ttl=disk_ttl)
+
+    parser = DEFAULT_PARSER
+    if '--parser' in sys.argv:
+        parser = sys.argv[sys.argv.index('--parser') + 1]
+    try:
+        resolve_parser(parser)
+    except ValueError as e:
+        # Fail at startup with the reason, before any pool or browser is started
+        logger.error(f"❌ [SERVICE] {e}")
+        sys.exit(1)
+
+    # --parse-processes N: parse pages in N warm worker processes (0: one per core)
+    parse_pool = None
+    if '--parse-processes' in sys.argv:
+        parse_pool = ParsePool(int(sys.argv[sys.argv.index('--parse-processes') + 1]) or None)
+
+    # --http2 talks HTTP/2 to the hosts that offer it (needs httpx[http2]);
+    # --no-prewarm skips connecting to the platform hosts at startup
+    transport = HostTransport(PLATFORM_HOSTS, http2=True) if '--http2' in sys.argv else None
+
+    ScraperService(query_slots=query_slots, drivers=drivers, prelaunch=prelaunch, cache=cache,
+                   parser=parser, parse_pool=parse_pool, transport=transport,
+                   prewarm='--no-prewarm' not in sys.argv).serve()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Cost Curve Selector Registry - declarative per-platform extraction rules
+Loads platform_selectors.json once per process and compiles every CSS selector in
+it, so the scrapers share one extraction path: find the product containers, pull
+each field from the first fallback selector that yields a usable value, and report
+which fallback matched. Fixing a broken selector or adding a listing-style platform
+is an edit to the JSON file.
+
+Field rules are either a list of fallback selectors or an object:
+    {"selectors": [...], "from": ["text", "title"], "reject": ["sponsored"], "min_length": 4}
+"from" lists the sources tried on the matched element: "text" is its text, any other
+name an attribute. url fields read href and image fields src/data-src by default.
+
+Entry options: "extends" names an entry whose keys this one inherits and overrides.
+"parse_only" restricts the parse to the containers (derived from them when null, off
+when false); a selector list given explicitly may only hold compound selectors.
+"embedded": false skips the structured-data pass that runs before the selectors, and
+"embedded_state": false keeps its JSON-LD but skips the generic state walk, for
+platforms whose state has a dedicated reader. "stream": true stops the download once
+`limit` containers have arrived, so structured data further down is never seen.
+"""
+
+import json
+import os
+from functools import lru_cache
+from urllib.parse import quote_plus, urljoin
+
+import soupsieve
+
+from price_parser import parse_price
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'platform_selectors.json')
+
+TEXT_SOURCE = 'text'
+FIELD_SOURCES = {
+    'url': ('href',),
+    'image': ('src', 'data-src'),
+}
+
+FIELD_PARSERS = {
+    'price': parse_price,
+}
+
+
+@lru_cache(maxsize=None)
+def compile_selector(css):
+    """soupsieve-compiled selector, compiled once per process"""
+    return soupsieve.compile(css)
+
+
+class FieldRule:
+    """Ordered fallback selectors for one field of a product container"""
+
+    def __init__(self, name, spec):
+        if isinstance(spec, list):
+            spec = {'selectors': spec}
+        self.name = name
+        self.selectors = [(css, compile_selector(css)) for css in spec['selectors']]
+        self.sources = tuple(spec.get('from', FIELD_SOURCES.get(name, (TEXT_SOURCE,))))
+        self.reject = frozenset(word.lower() for word in spec.get('reject', ()))
+        self.min_length = spec.get('min_length', 1)
+        self.parse = FIELD_PARSERS.get(spec.get('parse', name))
+
+    def extract(self, element):
+        """(value, selector) from the first fallback yielding a usable value, else (None, None)"""
+        for css, selector in self.selectors:
+            found = selector.select_one(element)
+            if found is None:
+                continue
+            value = self._value(found)
+            if value is not None:
+                return value, css
+        return None, None
+
+    def _value(self, found):
+        for source in self.sources:
+            raw = found.get_text(' ', strip=True) if source == TEXT_SOURCE else found.get(source)
+            if not raw or len(raw) < self.min_length or raw.lower() in self.reject:
+                continue
+            if self.parse:
+                raw = self.parse(raw)
+                if raw is None:
+                    continue
+            return raw
+        return None
+
+
+class PlatformSelectors:
+    """Compiled registry entry of one scraper method (e.g. scrape_snapdeal)"""
+
+    def __init__(self, key, spec):
+        self.key = key
+        self.platform = spec['platform']
+        self.tag = spec.get('tag', self.platform.upper())
+        self.search_url = spec.get('search_url')
+        self.query_separator = spec.get('query_separator')
+        self.headers = spec.get('headers') or None
+        self.timeout = spec.get('timeout', 15)
+        self.base_url = spec.get('base_url')
+        self.limit = spec.get('limit', 5)
+        self.fallback = spec.get('fallback')  # scraper method used when Selenium is unavailable
+        self.ready = spec.get('ready')  # CSS selector the Selenium readiness wait counts
+        self.containers = [(css, compile_selector(css)) for css in spec.get('containers', ())]
+        # Restricted parse (ContainerStrainer): the container union unless overridden, false disables it
+        parse_only = spec.get('parse_only')
+        if parse_only is None:
+            parse_only = ', '.join(css for css, _ in self.containers)
+        self.parse_only = parse_only or None
+        self.fields = {name: FieldRule(name, rule) for name, rule in spec.get('fields', {}).items()}
+        self.compose = spec.get('compose', {})  # field -> parts joined with spaces (brand + name)
+        self.default_title = spec.get('default_title')
+        self.skip_accessories = spec.get('skip_accessories', False)
+        self.availability = spec.get('availability', 'In Stock')
+        # Try the page's JSON-LD / state globals (embedded_data) before the CSS selectors
+        self.embedded = spec.get('embedded', True)
+        # Include the generic walk of state globals (off where the scraper reads its state itself)
+        self.embedded_state = spec.get('embedded_state', True)
+        # Stop downloading the page once `limit` containers of the first selector are complete
+        self.stream = spec.get('stream', False)
+
+    def search_url_for(self, query):
+        if self.query_separator:
+            query = query.replace(' ', self.query_separator)
+        return self.search_url.format(query=quote_plus(query))
+
+    def find_containers(self, soup):
+        """(containers, selector) for the first container fallback with any matches"""
+        for css, selector in self.containers:
+            found = selector.select(soup, limit=self.limit)
+            if found:
+                return found, css
+        return [], None
+
+    def extract(self, element, fields=None):
+        """Extract fields (default: all) from one container.
+
+        Returns (values, matched): the field values, None where no fallback produced
+        one, and the selector that matched each extracted field.
+        """
+        values, matched = {}, {}
+        for name in fields or self.fields:
+            value, css = self.fields[name].extract(element)
+            if css is not None:
+                matched[name] = css
+            if name == 'url' and value:
+                value = urljoin(self.base_url, value) if self.base_url else value
+            values[name] = value
+        for name, parts in self.compose.items():
+            joined = ' '.join(values[part] for part in parts if values.get(part))
+            values[name] = joined or None
+        return values, matched
+
+
+def _resolve(raw, key, seen=()):
+    """Registry entry with its "extends" chain merged in (own keys win)"""
+    spec = raw[key]
+    parent = spec.get('extends')
+    if not parent:
+        return spec
+    if parent in seen:
+        raise ValueError(f"Selector registry: 'extends' cycle through {key}")
+    merged = dict(_resolve(raw, parent, seen + (key,)))
+    merged.update(spec)
+    return merged
+
+
+@lru_cache(maxsize=None)
+def load_registry(path=REGISTRY_PATH):
+    """All compiled PlatformSelectors keyed by scraper method, loaded once per process"""
+    with open(path, encoding='utf-8') as f:
+        raw = json.load(f)
+    return {key: PlatformSelectors(key, _resolve(raw, key))
+            for key in raw if not key.startswith('_')}
+
+
+def platform_selectors(key):
+    """PlatformSelectors of one scraper method from the default registry"""
+    return load_registry()[key]
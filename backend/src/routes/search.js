@@ -1,9 +1,62 @@
 const express = require('express');
 const { query, body, validationResult } = require('express-validator');
-const { spawn } = require('child_process');
-const path = require('path');
+const scraperService = require('../services/scraperService');
 const router = express.Router();
 
+// Scraping multiple sites takes time; the scraper stops at SEARCH_BUDGET_MS and
+// returns what it has, SEARCH_TIMEOUT_MS is the hard stop
+const SEARCH_TIMEOUT_MS = 90000;
+const SEARCH_BUDGET_MS = 75000;
+const PLATFORM_BUDGET_MS = 30000;
+const SCRAPER_OPTIONS = {
+  timeoutMs: SEARCH_TIMEOUT_MS,
+  budgetMs: SEARCH_BUDGET_MS,
+  platformBudgetMs: PLATFORM_BUDGET_MS
+};
+
+// Map scraper service failures onto HTTP responses
+const sendScraperError = (res, error) => {
+  if (res.headersSent) {
+    return;
+  }
+
+  if (error.code === 'ETIMEDOUT') {
+    return res.status(408).json({
+      success: false,
+      message: 'Search timeout - please try again with a simpler query'
+    });
+  }
+
+  console.error('Python scraper error:', error.details || error.message);
+  return res.status(500).json({
+    success: false,
+    message: 'Scraper failed',
+    error: error.details || error.message
+  });
+};
+
+// Format a scraped product for the frontend
+const formatProduct = (product) => ({
+  id: product.id,
+  name: product.title,
+  price: product.price,
+  originalPrice: Math.floor(product.price * 1.2),
+  platform: product.platform,
+  rating: product.rating,
+  reviews: product.reviews,
+  image: product.image,
+  url: product.url,
+  savings: Math.floor(product.price * 0.2),
+  dealScore: product.dealScore,
+  inStock: product.availability === 'In Stock',
+  shipping: product.shipping
+});
+
+// Keep products within budget (if one was given)
+const withinBudget = (products, budget) => (
+  budget ? products.filter(item => item.price <= parseInt(budget)) : products
+);
+
 // @route   POST /api/search
 // @desc    Search for products across platforms using Python scraper
 // @access  Public  
@@ -26,105 +79,41 @@ router.post('/', [
     const { category = 'all', budget } = filters;
     const startTime = Date.now();
 
-    // Call Python scraper
-    const scraperPath = path.join(__dirname, '../../scraper.py');
-    const python = spawn('python', [scraperPath, searchQuery]);
-
-    let data = '';
-    let errorData = '';
-
-    python.stdout.on('data', (chunk) => {
-      data += chunk.toString();
-    });
+    let scraperResult;
+    try {
+      // Query the long-lived Python scraper service
+      scraperResult = await scraperService.search(searchQuery, SCRAPER_OPTIONS);
+    } catch (scraperError) {
+      return sendScraperError(res, scraperError);
+    }
+    const searchTime = (Date.now() - startTime) / 1000;
 
-    python.stderr.on('data', (chunk) => {
-      errorData += chunk.toString();
-    });
+    if (!scraperResult.success) {
+      return res.status(500).json({
+        success: false,
+        message: 'Scraper returned error',
+        error: scraperResult.error
+      });
+    }
 
-    python.on('close', (code) => {
-      const searchTime = (Date.now() - startTime) / 1000;
-
-      if (code !== 0) {
-        console.error('Python scraper error:', errorData);
-        return res.status(500).json({
-          success: false,
-          message: 'Scraper failed',
-          error: errorData
-        });
-      }
-
-      try {
-        clearTimeout(timeout); // Clear timeout since we got a response
-        
-        const scraperResult = JSON.parse(data);
-
-        if (!scraperResult.success) {
-          return res.status(500).json({
-            success: false,
-            message: 'Scraper returned error',
-            error: scraperResult.error
-          });
-        }
-
-        // Filter by budget if provided
-        let filteredResults = scraperResult.products;
-        if (budget) {
-          filteredResults = scraperResult.products.filter(item => item.price <= parseInt(budget));
-        }
-
-        // Format results for frontend compatibility
-        const formattedResults = filteredResults.map(product => ({
-          id: product.id,
-          name: product.title,
-          price: product.price,
-          originalPrice: Math.floor(product.price * 1.2),
-          platform: product.platform,
-          rating: product.rating,
-          reviews: product.reviews,
-          image: product.image,
-          url: product.url,
-          savings: Math.floor(product.price * 0.2),
-          dealScore: product.dealScore,
-          inStock: product.availability === 'In Stock',
-          shipping: product.shipping
-        }));
-
-        res.json({
-          success: true,
-          products: formattedResults,
-          totalResults: formattedResults.length,
-          searchQuery,
-          filters,
-          searchTime: searchTime,
-          scrapedAt: new Date().toISOString()
-        });
-
-      } catch (parseError) {
-        clearTimeout(timeout); // Clear timeout on error too
-        console.error('Error parsing scraper result:', parseError);
-        console.error('Raw data:', data);
-        
-        if (!res.headersSent) {
-          res.status(500).json({
-            success: false,
-            message: 'Failed to parse scraper results',
-            error: parseError.message
-          });
-        }
-      }
+    // Filter by budget if provided
+    const filteredResults = withinBudget(scraperResult.products, budget);
+
+    // Format results for frontend compatibility
+    const formattedResults = filteredResults.map(formatProduct);
+
+    res.json({
+      success: true,
+      products: formattedResults,
+      totalResults: formattedResults.length,
+      searchQuery,
+      filters,
+      platforms: scraperResult.platforms,
+      partial: scraperResult.partial,
+      searchTime: searchTime,
+      scrapedAt: new Date().toISOString()
     });
 
-    // Timeout after 90 seconds (scraping multiple sites takes time)
-    const timeout = setTimeout(() => {
-      python.kill();
-      if (!res.headersSent) {
-        res.status(408).json({
-          success: false,
-          message: 'Search timeout - please try again with a simpler query'
-        });
-      }
-    }, 90000);
-
   } catch (error) {
     console.error('Search error:', error);
     res.status(500).json({
@@ -155,98 +144,48 @@ router.get('/products', [
     const { q: searchQuery, category = 'all', budget } = req.query;
     const startTime = Date.now();
 
-    // Call Python scraper
-    const scraperPath = path.join(__dirname, '../../scraper.py');
-    const python = spawn('python', [scraperPath, searchQuery]);
-
-    let data = '';
-    let errorData = '';
-
-    python.stdout.on('data', (chunk) => {
-      data += chunk.toString();
-    });
+    let scraperResult;
+    try {
+      // Query the long-lived Python scraper service
+      scraperResult = await scraperService.search(searchQuery, SCRAPER_OPTIONS);
+    } catch (scraperError) {
+      return sendScraperError(res, scraperError);
+    }
+    const searchTime = (Date.now() - startTime) / 1000;
 
-    python.stderr.on('data', (chunk) => {
-      errorData += chunk.toString();
-    });
+    if (!scraperResult.success) {
+      return res.status(500).json({
+        success: false,
+        message: 'Scraper returned error',
+        error: scraperResult.error
+      });
+    }
 
-    python.on('close', (code) => {
-      const searchTime = (Date.now() - startTime) / 1000;
-
-      if (code !== 0) {
-        console.error('Python scraper error:', errorData);
-        return res.status(500).json({
-          success: false,
-          message: 'Scraper failed',
-          error: errorData
-        });
-      }
-
-      try {
-        clearTimeout(timeout); // Clear timeout since we got a response
-        
-        const scraperResult = JSON.parse(data);
-
-        if (!scraperResult.success) {
-          return res.status(500).json({
-            success: false,
-            message: 'Scraper returned error',
-            error: scraperResult.error
-          });
-        }
-
-        // Filter by budget if provided
-        let filteredResults = scraperResult.products;
-        if (budget) {
-          filteredResults = scraperResult.products.filter(item => item.price <= parseInt(budget));
-        }
-
-        // Enhance results with additional data for frontend
-        const enhancedResults = filteredResults.map(product => ({
-          ...product,
-          originalPrice: Math.floor(product.price * 1.2), // Mock original price (20% higher)
-          discount: Math.floor(Math.random() * 30) + 10, // Mock discount 10-40%
-          inStock: product.availability === 'In Stock',
-          name: product.title, // Map title to name for consistency
-        }));
-
-        res.json({
-          success: true,
-          query: searchQuery,
-          category,
-          budget: budget ? parseInt(budget) : null,
-          totalResults: enhancedResults.length,
-          results: enhancedResults,
-          searchTime: searchTime,
-          scrapedAt: new Date().toISOString()
-        });
-
-      } catch (parseError) {
-        clearTimeout(timeout); // Clear timeout on error too
-        console.error('Error parsing scraper result:', parseError);
-        console.error('Raw data:', data);
-        
-        if (!res.headersSent) {
-          res.status(500).json({
-            success: false,
-            message: 'Failed to parse scraper results',
-            error: parseError.message
-          });
-        }
-      }
+    // Filter by budget if provided
+    const filteredResults = withinBudget(scraperResult.products, budget);
+
+    // Enhance results with additional data for frontend
+    const enhancedResults = filteredResults.map(product => ({
+      ...product,
+      originalPrice: Math.floor(product.price * 1.2), // Mock original price (20% higher)
+      discount: Math.floor(Math.random() * 30) + 10, // Mock discount 10-40%
+      inStock: product.availability === 'In Stock',
+      name: product.title, // Map title to name for consistency
+    }));
+
+    res.json({
+      success: true,
+      query: searchQuery,
+      category,
+      budget: budget ? parseInt(budget) : null,
+      totalResults: enhancedResults.length,
+      results: enhancedResults,
+      platforms: scraperResult.platforms,
+      partial: scraperResult.partial,
+      searchTime: searchTime,
+      scrapedAt: new Date().toISOString()
     });
 
-    // Timeout after 90 seconds (scraping multiple sites takes time)
-    const timeout = setTimeout(() => {
-      python.kill();
-      if (!res.headersSent) {
-        res.status(408).json({
-          success: false,
-          message: 'Search timeout - please try again with a simpler query'
-        });
-      }
-    }, 90000);
-
   } catch (error) {
     console.error('Search route error:', error);
     res.status(500).json({
@@ -257,6 +196,87 @@ router.get('/products', [
   }
 });
 
+// @route   GET /api/search/stream
+// @desc    Stream search results as Server-Sent Events, one "platform" event per
+//          platform as soon as it finishes, then a "summary" event with the
+//          deduplicated final list (or an "error" event)
+// @access  Public
+router.get('/stream', [
+  query('q').notEmpty().trim().withMessage('Search query is required'),
+  query('category').optional().isIn(['fashion', 'electronics', 'home', 'books', 'all']),
+  query('budget').optional().isNumeric()
+], async (req, res) => {
+  const errors = validationResult(req);
+  if (!errors.isEmpty()) {
+    return res.status(400).json({
+      success: false,
+      errors: errors.array()
+    });
+  }
+
+  const { q: searchQuery, budget } = req.query;
+  const startTime = Date.now();
+  let clientClosed = false;
+
+  res.set({
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    Connection: 'keep-alive'
+  });
+  res.flushHeaders();
+  req.on('close', () => {
+    clientClosed = true;
+  });
+
+  const sendEvent = (event, data) => {
+    if (clientClosed) {
+      return;
+    }
+    res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+    // compression() buffers the body unless flushed explicitly
+    if (res.flush) {
+      res.flush();
+    }
+  };
+
+  try {
+    const summary = await scraperService.searchStream(searchQuery, SCRAPER_OPTIONS, (batch) => {
+      sendEvent('platform', {
+        platform: batch.platform,
+        status: batch.status,
+        elapsed: batch.elapsed,
+        products: withinBudget(batch.products, budget).map(formatProduct)
+      });
+    });
+
+    if (!summary.success) {
+      sendEvent('error', { message: 'Scraper returned error', error: summary.error });
+    } else {
+      const products = withinBudget(summary.products, budget).map(formatProduct);
+      sendEvent('summary', {
+        success: true,
+        products,
+        totalResults: products.length,
+        searchQuery,
+        platforms: summary.platforms,
+        partial: summary.partial,
+        searchTime: (Date.now() - startTime) / 1000,
+        scrapedAt: new Date().toISOString()
+      });
+    }
+  } catch (scraperError) {
+    console.error('Streaming search error:', scraperError.details || scraperError.message);
+    sendEvent('error', {
+      message: scraperError.code === 'ETIMEDOUT'
+        ? 'Search timeout - please try again with a simpler query'
+        : 'Scraper failed',
+      error: scraperError.message
+    });
+  }
+
+  res.end();
+});
+
 // @route   GET /api/search/suggestions
 // @desc    Get search suggestions
 // @access  Public
@@ -18,6 +18,9 @@ const alertRoutes = require('./routes/alerts');
 const scrapingRoutes = require('./routes/scraping');
 const userDataRoutes = require('./routes/userData');
 
+// Long-lived Python scraper process
+const scraperService = require('./services/scraperService');
+
 // Import middleware
 const errorHandler = require('./middleware/errorHandler');
 const { auth, optionalAuth } = require('./middleware/auth');
@@ -149,11 +152,13 @@ app.use(errorHandler);
 // Graceful shutdown handling
 process.on('SIGTERM', () => {
   console.log('SIGTERM received. Shutting down gracefully...');
+  scraperService.stop();
   process.exit(0);
 });
 
 process.on('SIGINT', () => {
   console.log('SIGINT received. Shutting down gracefully...');
+  scraperService.stop();
   process.exit(0);
 });
 
@@ -164,6 +169,9 @@ if (require.main === module) {
     console.log(`📊 Environment: ${process.env.NODE_ENV || 'development'}`);
     console.log(`🔗 Health Check: http://localhost:${PORT}/health`);
     console.log(`📚 API Docs: http://localhost:${PORT}/api`);
+
+    // Warm up the scraper service so the first search skips interpreter startup
+    scraperService.start();
   });
 }
 
@@ -0,0 +1,137 @@
+const { spawn } = require('child_process');
+const path = require('path');
+const readline = require('readline');
+
+const SERVICE_PATH = path.join(__dirname, '../../scraper_service.py');
+const PYTHON_BIN = process.env.PYTHON_BIN || 'python';
+const STDERR_TAIL_LIMIT = 8192;
+
+// Long-lived Python scraper process shared by all search requests.
+// Requests and responses are JSON lines matched up by id.
+class ScraperService {
+  constructor() {
+    this.process = null;
+    this.pending = new Map();
+    this.nextId = 1;
+    this.stderrTail = '';
+  }
+
+  start() {
+    if (this.process) {
+      return this.process;
+    }
+
+    const python = spawn(PYTHON_BIN, [SERVICE_PATH], {
+      cwd: path.dirname(SERVICE_PATH)
+    });
+
+    readline.createInterface({ input: python.stdout }).on('line', (line) => {
+      this.handleLine(line);
+    });
+
+    python.stderr.on('data', (chunk) => {
+      this.stderrTail = (this.stderrTail + chunk.toString()).slice(-STDERR_TAIL_LIMIT);
+    });
+
+    python.on('error', (error) => {
+      console.error('Scraper service failed to start:', error.message);
+    });
+
+    python.on('exit', (code) => {
+      console.error(`Scraper service exited with code ${code}`);
+      this.process = null;
+      const error = new Error('Scraper service exited');
+      error.details = this.stderrTail;
+      this.pending.forEach(({ reject, timer }) => {
+        clearTimeout(timer);
+        reject(error);
+      });
+      this.pending.clear();
+    });
+
+    this.process = python;
+    return python;
+  }
+
+  handleLine(line) {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch (parseError) {
+      console.error('Unparseable scraper service line:', line);
+      return;
+    }
+
+    const entry = this.pending.get(message.id);
+    if (!entry) {
+      return;
+    }
+
+    // Streamed per-platform batches arrive before the final summary line
+    if (message.type === 'platform') {
+      if (entry.onEvent) {
+        entry.onEvent(message);
+      }
+      return;
+    }
+
+    this.pending.delete(message.id);
+    clearTimeout(entry.timer);
+    entry.resolve(message);
+  }
+
+  send(payload, timeoutMs, onEvent) {
+    const python = this.start();
+    const id = String(this.nextId++);
+
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pending.delete(id);
+        const error = new Error('Scraper service timeout');
+        error.code = 'ETIMEDOUT';
+        reject(error);
+      }, timeoutMs);
+
+      this.pending.set(id, { resolve, reject, timer, onEvent });
+      python.stdin.write(`${JSON.stringify({ ...payload, id })}\n`);
+    });
+  }
+
+  // budgetMs is the scraper's own time budget; it should stay below timeoutMs so
+  // partial results come back before the request is given up on
+  search(query, {
+    selenium = false,
+    concurrent = true,
+    timeoutMs = 90000,
+    budgetMs = timeoutMs - 10000,
+    platformBudgetMs
+  } = {}, onPlatform = null) {
+    const payload = { query, selenium, concurrent, budget: budgetMs / 1000 };
+    if (platformBudgetMs) {
+      payload.platformBudget = platformBudgetMs / 1000;
+    }
+    if (onPlatform) {
+      payload.stream = true;
+    }
+    return this.send(payload, timeoutMs, onPlatform);
+  }
+
+  // Like search(), but calls onPlatform with each platform batch as it finishes.
+  // Resolves with the summary record.
+  searchStream(query, options, onPlatform) {
+    return this.search(query, options, onPlatform);
+  }
+
+  ping(timeoutMs = 5000) {
+    return this.send({ type: 'ping' }, timeoutMs);
+  }
+
+  stop() {
+    if (this.process) {
+      this.process.stdin.end();
+      this.process = null;
+    }
+  }
+}
+
+module.exports = new ScraperService();
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Checks for accessory_filter.py: whole-word keywords and the query and product exemptions
+"""
+
+from accessory_filter import accessory_filter, is_accessory
+
+
+def test_whole_words_only():
+    # Substring matching used to find "ring" in "string" and "stand" in "Standard"
+    assert not is_accessory('Yamaha Acoustic Guitar with Steel Strings')
+    assert not is_accessory('Samsung Galaxy S23 Standard Edition')
+    assert not is_accessory('Samsung Galaxy Ring (Titanium Black, Size 9)')
+    assert is_accessory('Ring Light with Tripod for Phones')
+
+
+def test_accessories_are_caught():
+    assert accessory_filter('iphone 14').match('iPhone 14 Silicone Case') == 'Case'
+    assert is_accessory('Tempered  Glass Screen Protector for iPhone 14')  # any whitespace between words
+    assert is_accessory('Pack of 2 USB-C Cables')  # plurals
+    assert is_accessory('20000mAh Power Bank')
+
+
+def test_descriptions_of_the_product_do_not_count():
+    assert not is_accessory('Redmi 13C (6000mAh Battery, 128 GB)')
+    assert not is_accessory('Samsung Galaxy M14 5G with Charger')
+
+
+def test_query_keywords_are_kept():
+    assert accessory_filter('iphone case').match('iPhone 14 Silicone Case') is None
+    assert is_accessory('iPhone 14 Silicone Case', query='iphone 14')
+    # Queries are normalized, so these share one compiled filter
+    assert accessory_filter('  iPhone   Case ') is accessory_filter('iphone case')
+
+
+def test_batch_matches_single_calls():
+    titles = ['iPhone 14 (128 GB)', 'iPhone 14 Back Cover', None, 'Lightning Cable 1m', 'iPhone 14 Plus']
+    hits = accessory_filter('iphone 14').matches(titles)
+    assert hits == [accessory_filter('iphone 14').match(title) for title in titles]
+    assert hits == [None, 'Cover', None, 'Cable', None]
+
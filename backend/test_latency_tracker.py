@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Checks for latency_tracker.py: adaptive timeouts, percentiles and the per-platform report
+"""
+
+from latency_tracker import PRODUCT_PAGE, SEARCH_PAGE, LatencyTracker, histogram, percentile
+
+
+def _tracker(seconds, samples=10, **settings):
+    tracker = LatencyTracker(**settings)
+    for _ in range(samples):
+        tracker.record('Flipkart', SEARCH_PAGE, seconds)
+    return tracker
+
+
+def test_ceiling_until_enough_samples():
+    tracker = _tracker(0.5, samples=9)
+    assert tracker.timeout('Flipkart', SEARCH_PAGE, ceiling=10) == (10, 10)
+    tracker.record('Flipkart', SEARCH_PAGE, 0.5)
+    assert tracker.timeout('Flipkart', SEARCH_PAGE, ceiling=10) != (10, 10)
+
+
+def test_timeouts_follow_p99():
+    assert _tracker(3.0).timeout('Flipkart', SEARCH_PAGE, ceiling=10) == (4.5, 6.0)
+
+
+def test_timeouts_are_clamped():
+    # Fast hosts keep the minimums
+    assert _tracker(0.1).timeout('Flipkart', SEARCH_PAGE, ceiling=10) == (1.0, 2.0)
+    # Connect stops at MAX_CONNECT_TIMEOUT, read at the ceiling
+    assert _tracker(4.0).timeout('Flipkart', SEARCH_PAGE, ceiling=10) == (5.0, 8.0)
+    assert _tracker(4.0).timeout('Flipkart', SEARCH_PAGE, ceiling=3) == (3, 3)
+
+
+def test_platforms_and_endpoints_are_separate():
+    tracker = _tracker(3.0)
+    assert tracker.timeout('Flipkart', PRODUCT_PAGE, ceiling=8) == (8, 8)
+    assert tracker.timeout('Amazon', SEARCH_PAGE, ceiling=10) == (10, 10)
+
+
+def test_window_keeps_latest():
+    tracker = _tracker(4.0, window=20)
+    for _ in range(20):
+        tracker.record('Flipkart', SEARCH_PAGE, 0.1)
+    assert tracker.timeout('Flipkart', SEARCH_PAGE, ceiling=10) == (1.0, 2.0)
+    assert tracker.report('Flipkart')[SEARCH_PAGE]['samples'] == 20
+
+
+def test_percentile():
+    ordered = list(range(1, 101))
+    assert percentile(ordered, 0.5) == 51
+    assert percentile(ordered, 0.99) == 100
+    assert percentile([7], 0.99) == 7
+
+
+def test_histogram():
+    assert histogram([0.1, 0.25, 0.3, 3, 20]) == {'<=0.25s': 2, '<=0.5s': 1, '<=4s': 1, '>16s': 1}
+    assert list(histogram([20, 0.1])) == ['<=0.25s', '>16s']  # buckets in ascending order
+
+
+def test_report():
+    tracker = _tracker(0.4)
+    tracker.record('Flipkart', PRODUCT_PAGE, 1.5)
+    tracker.timeout('Flipkart', SEARCH_PAGE, ceiling=10)
+    report = tracker.report('Flipkart')
+    assert report[SEARCH_PAGE] == {'samples': 10, 'timeout': {'connect': 1.0, 'read': 2.0},
+                                   'p50': 0.4, 'p90': 0.4, 'p99': 0.4, 'histogram': {'<=0.5s': 10}}
+    assert 'timeout' not in report[PRODUCT_PAGE]  # no timeout handed out yet
+    assert tracker.report('Amazon') == {}
+
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Checks for platform_health.py: block page detection and the per-platform circuit breakers
+"""
+
+import time
+
+from platform_health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerBoard, block_page_reason
+from rate_limiter import HostRateLimiter
+from scraper import STATUS_BLOCKED, STATUS_ERROR, ProductScraper
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def test_block_pages():
+    assert block_page_reason(b'<html><head><TITLE>Robot Check</TITLE>') == 'Amazon robot check'
+    assert block_page_reason(b'<script>window._cf_chl_opt = {}</script>') == 'Cloudflare challenge'
+    assert block_page_reason(b'<html><title>Running Shoes</title>') is None
+    # Only the first chunk of the body is searched
+    assert block_page_reason(b' ' * (16 * 1024) + b'<title>access denied</title>') is None
+
+
+def test_opens_after_threshold(clock):
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False)
+    breaker.record(ok=False)
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record(ok=False, detail='HTTP 500')
+    assert breaker.state == OPEN and not breaker.allow()
+    assert breaker.describe() == {'state': OPEN, 'failures': 3, 'retryIn': 60.0, 'lastFailure': 'HTTP 500'}
+
+
+def test_success_resets_failures(clock):
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False)
+    breaker.record(ok=False)
+    breaker.record(ok=True)
+    breaker.record(ok=False)
+    assert breaker.state == CLOSED and breaker.failures == 1
+
+
+def test_trip_opens_at_once(clock):
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False, trip=True)
+    assert breaker.state == OPEN
+
+
+def test_half_open_trial(clock):
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False, trip=True)
+    clock.now = 60
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()  # one trial at a time
+    breaker.record(ok=True)
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+
+def test_failed_trials_double_the_cooldown(clock):
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False, trip=True)
+    for cooldown in (120, 240, 480, 900, 900):
+        clock.now += breaker.cooldown
+        assert breaker.allow()
+        breaker.record(ok=False)
+        assert breaker.state == OPEN and breaker.cooldown == cooldown
+    clock.now += 900
+    breaker.allow()
+    breaker.record(ok=True)
+    assert breaker.cooldown == 60
+
+
+def test_stale_trial_is_replaced(clock):
+    # A trial that never reports back (cancelled at the deadline) does not keep the breaker shut
+    breaker = CircuitBreaker(clock=clock)
+    breaker.record(ok=False, trip=True)
+    clock.now = 60
+    assert breaker.allow()
+    clock.now = 119
+    assert not breaker.allow()
+    clock.now = 120
+    assert breaker.allow()
+
+
+def test_board_snapshot(clock):
+    board = CircuitBreakerBoard(clock=clock)
+    board.record('Meesho', ok=False, trip=True, detail='Cloudflare challenge')
+    board.record('Snapdeal', ok=False)
+    board.record('Amazon', ok=True)
+    snapshot = board.snapshot()
+    assert set(snapshot) == {'Meesho', 'Snapdeal'}
+    assert snapshot['Meesho']['state'] == OPEN and snapshot['Snapdeal']['state'] == CLOSED
+    assert not board.allow('Meesho') and board.allow('Snapdeal')
+
+
+def _scrape_status(status_code, clock):
+    """Status and breaker of a platform whose only fetch answered status_code"""
+    board = CircuitBreakerBoard(clock=clock)
+    scraper = ProductScraper(breakers=board, rate_limiter=HostRateLimiter(burst=100))
+    scraper.session.get = lambda url, **kwargs: FakeResponse(status_code)
+    scraper._get('https://www.meesho.com/search?q=shoes')
+    scraper.started_at = scraper.finished_at = time.monotonic()
+    scraper._record_platform('Meesho', scraper, finished=True)
+    return scraper.platform_stats['Meesho']['status'], board.breaker('Meesho')
+
+
+def test_refusals_trip_the_breaker(clock):
+    for status_code in (403, 429):
+        status, breaker = _scrape_status(status_code, clock)
+        assert status == STATUS_BLOCKED and breaker.state == OPEN
+
+
+def test_unavailable_counts_as_an_error(clock):
+    # A 503 is an overloaded server, not a block: it waits for the failure threshold
+    status, breaker = _scrape_status(503, clock)
+    assert status == STATUS_ERROR
+    assert breaker.state == CLOSED and breaker.failures == 1
+
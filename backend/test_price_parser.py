@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Checks for price_parser.py: digit grouping, MRP and discount labels, batch parsing
+"""
+
+from price_parser import (find_json_prices, find_prices, find_prices_batch, parse_price, parse_price_batch,
+                          parse_price_details, selling_prices)
+
+
+def test_digit_grouping():
+    assert parse_price('₹1,29,999') == 129999  # Indian grouping
+    assert parse_price('₹129,999') == 129999  # western grouping
+    assert parse_price('Rs. 45999.50') == 45999  # paise dropped
+    assert parse_price('INR 799') == 799
+    assert parse_price('no price here') is None
+
+
+def test_details_separate_mrp_and_discount():
+    assert parse_price_details('₹799 MRP ₹999 20% off') == {'price': 799, 'mrp': 999, 'discount': 20}
+    assert parse_price_details('₹799 M.R.P. (incl. of all taxes) ₹999')['mrp'] == 999
+
+
+def test_adjacent_spans_split():
+    # Text of adjacent price and discount spans runs together
+    assert parse_price_details('₹59,90023% off') == {'price': 59900, 'mrp': None, 'discount': 23}
+
+
+def test_selling_prices_skip_struck_out_mrp():
+    # The fallback used to keep the first of '₹X ₹Y' even when it was the MRP
+    assert selling_prices('₹23,999 ₹9,499') == [9499]
+    assert selling_prices('MRP ₹18,699 ₹10,499') == [10499]
+    assert selling_prices('Special Price ₹8,999') == [8999]
+
+
+def test_selling_prices_do_not_span_unrelated_text():
+    # 'Special Price.*?₹' used to reach the next amount however far away it was
+    assert selling_prices('Special Price offers on phones. Delivery by Monday. ₹23,999') == []
+
+
+def test_page_and_json_prices():
+    assert find_prices('₹500 then ₹12,000 and ₹60,000', low=1000, high=50000) == [12000]
+    assert find_json_prices('{"price": 45999, "mrp": 49999, "price":12}', low=1000) == [45999]
+
+
+def test_batch_matches_single_calls():
+    texts = ['₹1,299', 'MRP ₹999 ₹799', None, 'Rs.45']
+    assert parse_price_batch(texts) == [parse_price_details(text or '') for text in texts]
+    # A pending label does not carry over from one text to the next
+    assert parse_price_batch(['Special Price', '₹100'])[1]['price'] == 100
+    assert find_prices_batch(['₹1,299', '₹40'], low=100) == [1299]
+
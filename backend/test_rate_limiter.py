@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Checks for rate_limiter.py: per-host token buckets, driven by a fake clock
+"""
+
+from rate_limiter import HostRateLimiter, TokenBucket
+
+
+def _limiter(clock, **settings):
+    return HostRateLimiter(sleep=clock.sleep, clock=clock, **settings)
+
+
+def test_burst_then_paced(clock):
+    limiter = _limiter(clock, rate=2.0, burst=5)
+    waits = [limiter.acquire('https://www.flipkart.com/search?q=ssd') for _ in range(8)]
+    assert waits == [0.0] * 5 + [0.5] * 3
+    assert clock.sleeps == [0.5] * 3
+
+
+def test_idle_host_refills(clock):
+    bucket = TokenBucket(rate=2.0, burst=5, clock=clock)
+    for _ in range(5):
+        bucket.reserve()
+    clock.now += 1.0  # two tokens back
+    assert [bucket.reserve(), bucket.reserve()] == [0.0, 0.0]
+    clock.now += 60  # refills up to the burst only
+    assert [bucket.reserve() for _ in range(6)][-1] > 0
+
+
+def test_waiters_queue_one_token_apart(clock):
+    # Concurrent callers that reserve before sleeping each get the next free slot
+    bucket = TokenBucket(rate=2.0, burst=1, clock=clock)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_max_wait_takes_nothing(clock):
+    limiter = _limiter(clock, rate=2.0, burst=1)
+    assert limiter.acquire('www.amazon.in') == 0.0
+    assert limiter.acquire('www.amazon.in', max_wait=0.2) is None
+    assert clock.sleeps == []
+    # The refused call left the bucket as it was
+    assert limiter.acquire('www.amazon.in', max_wait=0.5) == 0.5
+    assert limiter.stats()['www.amazon.in']['requests'] == 2
+
+
+def test_hosts_are_separate(clock):
+    limiter = _limiter(clock, rate=2.0, burst=1)
+    assert limiter.acquire('https://www.flipkart.com/search?q=ssd') == 0.0
+    assert limiter.acquire('https://www.myntra.com/shoes') == 0.0
+    # A URL and its bare host share one bucket
+    assert limiter.acquire('www.flipkart.com') == 0.5
+
+
+def test_stats(clock):
+    limiter = _limiter(clock, rate=4.0, burst=2)
+    for _ in range(4):
+        limiter.acquire('https://www.snapdeal.com/search?keyword=ssd')
+    assert limiter.stats() == {'www.snapdeal.com': {'requests': 4, 'delayed': 2, 'waited': 0.5}}
+
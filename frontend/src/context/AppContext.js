@@ -60,6 +60,42 @@ export async function clearSearchHistory(username) {
   }
 }
 
+// Stream search results from /api/search/stream. onBatch receives each platform's
+// products as they arrive; resolves with the final summary.
+const streamSearch = (query, filters = {}, onBatch) => new Promise((resolve, reject) => {
+  const params = new URLSearchParams({ q: query });
+  if (filters.category) params.set('category', filters.category);
+  if (filters.budget) params.set('budget', filters.budget);
+
+  const source = new EventSource(`/api/search/stream?${params.toString()}`);
+  const timer = setTimeout(() => {
+    source.close();
+    const error = new Error('Search timed out');
+    error.name = 'AbortError';
+    reject(error);
+  }, 95000);
+
+  const finish = (callback) => {
+    clearTimeout(timer);
+    source.close();
+    callback();
+  };
+
+  source.addEventListener('platform', (event) => {
+    const batch = JSON.parse(event.data);
+    if (batch.products && batch.products.length > 0) {
+      onBatch(batch.products);
+    }
+  });
+  source.addEventListener('summary', (event) => {
+    finish(() => resolve(JSON.parse(event.data)));
+  });
+  source.addEventListener('error', (event) => {
+    const message = event.data ? JSON.parse(event.data).message : 'Search stream failed';
+    finish(() => reject(new Error(message)));
+  });
+});
+
 const AppContext = createContext();
 
 export const useApp = () => {
@@ -106,23 +142,32 @@ export const AppProvider = ({ children }) => {
     if (isSearching) return; // Prevent multiple simultaneous searches
     
     setIsSearching(true);
+    setSearchResults([]);
     try {
-      const response = await fetch('/api/search', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({ query, filters }),
-        signal: AbortSignal.timeout(30000) // 30 second timeout
-      });
-      
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
+      if (typeof window !== 'undefined' && window.EventSource) {
+        // Show each platform's products as soon as it finishes
+        const data = await streamSearch(query, filters, (products) => {
+          setSearchResults((prev) => [...prev, ...products]);
+        });
+        setSearchResults(data.products || []);
+      } else {
+        const response = await fetch('/api/search', {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({ query, filters }),
+          signal: AbortSignal.timeout(30000) // 30 second timeout
+        });
+        
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        const data = await response.json();
+        setSearchResults(data.products || []);
       }
       
-      const data = await response.json();
-      setSearchResults(data.products || []);
-      
       // Save search history if user is logged in
       if (user && user.username) {
         try {
@@ -33,7 +33,8 @@ const Results = () => {
   }, [bestDeal]);
 
   // Early returns after all hooks are called
-  if (isSearching) {
+  // Streamed results are shown as soon as the first platform finishes
+  if (isSearching && (!searchResults || searchResults.length === 0)) {
     return (
       <div className="results-page">
         <div className="loading-container">
@@ -72,7 +73,10 @@ const Results = () => {
         {/* Results Header */}
         <div className="results-header">
           <h2>Price Comparison Results</h2>
-          <p>Found {searchResults.length} results across different platforms</p>
+          <p>
+            Found {searchResults.length} results across different platforms
+            {isSearching && ' — still checking more platforms...'}
+          </p>
         </div>
 
         {/* Best Deal Highlight */}